@@ -1 +1,16 @@
 from ._from_dict import from_dict, FromDictTypeError, FromDictUnknownArgsError
+from ._from_dict import from_dict_with_errors, FromDictResult
+from ._canonical import CanonicalTable
+from ._check import check, compile_checker
+from ._coerce import compile_coercer
+from ._constraints import Constraint, Convert, Max, MaxLength, Min, Regex
+from ._flat import from_flat_dict
+from ._from_csv import from_csv
+from ._from_json import from_json, from_json_file
+from ._hooks import DecodeEvent, add_decode_hook, remove_decode_hook
+from ._intern import Intern, InternTable
+from ._limits import DecodeLimits, FromDictLimitError
+from ._naming import Alias, naming_policy
+from ._patch import from_dict_patch
+from ._stats import disable_stats, enable_stats, reset_stats, stats
+from ._to_dict import to_dict, to_dict_many
@@ -0,0 +1,106 @@
+from dataclasses import is_dataclass
+from typing import Any, Dict, Hashable, Optional, Tuple, Type, get_origin
+
+from ._class_cache import class_cache
+
+
+class CanonicalTable:
+    """Maps the input of immutable structures onto one shared instance.
+
+    Like InternTable, the table stops taking in new entries once it holds max_size entries. Use one table per
+    from_dict call (fd_canonical=True) or share a table across a batch of calls.
+    """
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        self.max_size = max_size
+        self._table: Dict[Hashable, Any] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        return self._table.get(key)
+
+    def add(self, key: Hashable, obj: Any) -> None:
+        if len(self._table) < self.max_size:
+            self._table[key] = obj
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def clear(self) -> None:
+        self._table.clear()
+
+
+class CanonicalScope:
+    """The CanonicalTable as seen by one from_dict call.
+
+    Objects are only shared between calls with equal options, as the options decide how an object is decoded and
+    checked. The keys of the dicts in the input are remembered, so that every dict is frozen only once, however deep
+    it is nested.
+    """
+
+    __slots__ = ("table", "options", "_frozen")
+
+    def __init__(self, table: CanonicalTable, options: Hashable) -> None:
+        self.table = table
+        self.options = options
+        self._frozen: Dict[int, Tuple[Any, Hashable]] = {}
+
+    def key(self, cls: Type, given_args: Any) -> Hashable:
+        """Key of the object of cls constructed from given_args; raises TypeError if it contains unhashable leaves"""
+        return (cls, self.options, freeze(given_args, self._frozen))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        return self.table.get(key)
+
+    def add(self, key: Hashable, obj: Any) -> None:
+        self.table.add(key, obj)
+
+
+@class_cache(100)
+def is_frozen(cls: Type) -> bool:
+    """Can instances of cls be shared because they can not be changed"""
+    # Generic classes like Page[int] are frozen if their origin is
+    origin = get_origin(cls) or cls
+    if not isinstance(origin, type):
+        return False
+    if is_dataclass(origin):
+        return origin.__dataclass_params__.frozen  # type: ignore
+    if hasattr(origin, "__attrs_attrs__"):
+        # attrs replaces __setattr__ of frozen classes
+        return getattr(origin.__setattr__, "__name__", None) == "_frozen_setattrs"
+    return issubclass(origin, tuple) and hasattr(origin, "_fields")
+
+
+_UNHASHABLE = object()
+
+
+def freeze(
+    value: Any, frozen: Optional[Dict[int, Tuple[Any, Hashable]]] = None
+) -> Hashable:
+    """Normalize a decoder input into a hashable key.
+
+    The type of non-str leaves is part of the key, so that 1, 1.0 and True do not end up as the same object.
+    Raises TypeError if the input contains unhashable leaves. If frozen is given, the keys of dicts are stored in it
+    by their id and reused.
+    """
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is dict:
+        if frozen is None:
+            return frozenset((k, freeze(v)) for k, v in value.items())
+        entry = frozen.get(id(value))
+        if entry is not None and entry[0] is value:
+            if entry[1] is _UNHASHABLE:
+                raise TypeError("unhashable input")
+            return entry[1]
+        # The dict is kept in the entry, so its id is not reused
+        try:
+            key = frozenset((k, freeze(v, frozen)) for k, v in value.items())
+        except TypeError:
+            frozen[id(value)] = (value, _UNHASHABLE)
+            raise
+        frozen[id(value)] = (value, key)
+        return key
+    if value_type is list:
+        return (list, tuple(freeze(v, frozen) for v in value))
+    return (value_type, value)
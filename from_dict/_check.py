@@ -0,0 +1,164 @@
+from typing import Any, Callable, Literal, Optional, get_args, get_origin
+
+from ._class_cache import class_cache
+from ._typing import is_type_alias, is_union, unwrap_type_alias
+
+Checker = Callable[[Any], bool]
+
+
+def _always(v: Any) -> bool:
+    return True
+
+
+def _never(v: Any) -> bool:
+    return False
+
+
+def _isinstance_checker(t: Any) -> Optional[Checker]:
+    """isinstance(v, t) as checker, or None if t can not be used with isinstance"""
+    try:
+        isinstance(None, t)
+    except TypeError:  # Could happen if t is of sort List[x], etc.
+        return None
+
+    def check_isinstance(v):
+        return isinstance(v, t)
+
+    return check_isinstance
+
+
+def _compile_alias(t: Any) -> Checker:
+    """Aliases are compiled on first use; recursive aliases would never finish otherwise"""
+    value = unwrap_type_alias(t)
+    checker: Optional[Checker] = None
+
+    def check_alias(v):
+        nonlocal checker
+        if checker is None:
+            checker = compile_checker(value)
+        return checker(v)
+
+    return check_alias
+
+
+def _compile(t: Any) -> Checker:
+    if is_type_alias(t):
+        return _compile_alias(t)
+
+    # isinstance() always returns false when `Optional[Any]` is the type
+    # https://github.com/python/cpython/issues/128232
+    if t is Any or t is Optional[Any]:
+        return _always
+
+    origin = get_origin(t)
+    type_args = get_args(t)
+
+    if is_union(origin):
+        if all(isinstance(a, type) and not get_args(a) for a in type_args):
+            return _isinstance_checker(type_args) or _never
+        targ_checkers = tuple(_compile(a) for a in type_args)
+        if _always in targ_checkers:
+            return _always
+
+        def check_union(v):
+            for targ_checker in targ_checkers:
+                if targ_checker(v):
+                    return True
+            return False
+
+        return check_union
+
+    if origin is Literal:
+        try:
+            values = frozenset(type_args)
+        except TypeError:  # Unhashable literal values
+            values = None
+
+        if values is None:
+
+            def check_literal(v):
+                return any(a == v for a in type_args)
+
+        else:
+
+            def check_literal(v):
+                try:
+                    return v in values
+                except TypeError:  # Unhashable, e.g. [1] or (1, [2])
+                    return any(a == v for a in type_args)
+
+        return check_literal
+
+    check_type = _isinstance_checker(t)
+    if not origin or not type_args:
+        return check_type or _always
+
+    check_origin = _isinstance_checker(origin)
+    if check_origin is None:
+        return _never  # type_check raises a TypeError for these
+
+    if origin is list:
+        check_element = _compile(type_args[0])
+        if check_element is _always:
+            return check_origin
+
+        def check_list(v):
+            if not isinstance(v, list):
+                return False
+            for element in v:
+                if not check_element(element):
+                    return False
+            return True
+
+        return check_list
+
+    if origin is dict:
+        check_key = _isinstance_checker(type_args[0])
+        if check_key is None:
+            return _never  # type_check raises a TypeError for these
+        key_type = type_args[0]
+        check_value = _compile(type_args[1])
+
+        def check_dict(v):
+            if not isinstance(v, dict):
+                return False
+            for k, val in v.items():
+                if not isinstance(k, key_type) or not check_value(val):
+                    return False
+            return True
+
+        return check_dict
+
+    if check_type is None:
+        return check_origin
+
+    def check_type_and_origin(v):
+        return check_type(v) and check_origin(v)
+
+    return check_type_and_origin
+
+
+@class_cache(1000)
+def _compile_cached(t: Any) -> Checker:
+    return _compile(t)
+
+
+def compile_checker(t: Any) -> Checker:
+    """Compile a type hint into a function that checks if a value agrees with it.
+
+    The checker accepts exactly the values fd_check_types accepts. Type arguments, origins and literal values are
+    looked at once, here, instead of on every check.
+
+    :param t: Type hint to check values against.
+    :return: Function returning True if the given value agrees with t.
+    """
+    # The checker of a class refers to it, cached by the class it would keep the class alive.
+    # Before Python 3.11, list[int] is an instance of type too.
+    if isinstance(t, type) and get_origin(t) is None:
+        return _isinstance_checker(t) or _always
+    return _compile_cached(t)
+
+
+def check(value: Any, t: Any) -> bool:
+    """Does value agree with type hint t, see compile_checker"""
+    return compile_checker(t)(value)
@@ -0,0 +1,109 @@
+import functools
+import weakref
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class ClassCache:
+    """Results of one cached function, in a dict weakly keyed by the classes and type hints they belong to"""
+
+    def __init__(self, function: Callable, maxsize: int, owner: int) -> None:
+        self.function = function
+        self.maxsize = maxsize
+        self.owner = owner
+        self.by_owner: "weakref.WeakKeyDictionary[Any, Dict[Any, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.fallback = functools.lru_cache(maxsize)(function)
+        self.misses = 0
+
+    def results(self, owner: Any) -> Optional[Dict[Any, Any]]:
+        """Dict of the results of owner, None if owner can't be weakly referenced"""
+        by_owner = self.by_owner
+        try:
+            return by_owner[owner]
+        except KeyError:
+            pass
+        except TypeError:  # Not weakly referenceable or not hashable
+            return None
+        # Results that refer back to their owner, like the hints of a self-referencing class, keep it alive.
+        # Dropping the oldest owner bounds how many of those are kept.
+        if len(by_owner) >= self.maxsize:
+            oldest = next(iter(by_owner), None)
+            if oldest is not None:
+                del by_owner[oldest]
+        results: Dict[Any, Any] = {}
+        by_owner[owner] = results
+        return results
+
+    def call(self, args: Tuple, key: Any) -> Any:
+        """Look up or compute the result for args, whose key without the owner is key"""
+        results = self.results(args[self.owner])
+        if results is None:
+            return self.fallback(*args)
+        try:
+            return results[key]
+        except KeyError:
+            pass
+        self.misses += 1
+        result = self.function(*args)
+        if len(results) >= self.maxsize:
+            results.clear()
+        results[key] = result
+        return result
+
+    def cache_info(self) -> Any:
+        """Like lru_cache's cache_info; hits of results stored by owner are not counted"""
+        info = self.fallback.cache_info()
+        return info._replace(misses=info.misses + self.misses)
+
+    def cache_clear(self) -> None:
+        self.fallback.cache_clear()
+        self.by_owner.clear()
+        self.misses = 0
+
+
+def class_cache(maxsize: int, owner: int = 0) -> Callable[[F], F]:
+    """Cache like functools.lru_cache(maxsize) for functions of a class, that does not keep the class alive.
+
+    The results are kept in a weakref.WeakKeyDictionary keyed by the class or typing alias given as positional
+    argument number owner, so they are dropped when it is collected. At most maxsize owners and maxsize results per
+    owner are kept. Results for owners that can't be weakly referenced, like None, strings or X | Y unions, are kept
+    in a bounded lru_cache. Only positional arguments are supported.
+    """
+
+    def decorator(function: F) -> F:
+        cache = ClassCache(function, maxsize, owner)
+        data = cache.by_owner.data
+        ref = weakref.ref
+        call = cache.call
+
+        # The common cases look up the results of the class without further calls
+        if owner == 0 and function.__code__.co_argcount == 1:
+
+            def cached(cls):
+                try:
+                    return data[ref(cls)][None]
+                except (KeyError, TypeError):
+                    return call((cls,), None)
+
+        elif owner == 0 and function.__code__.co_argcount == 2:
+
+            def cached(cls, arg):
+                try:
+                    return data[ref(cls)][arg]
+                except (KeyError, TypeError):
+                    return call((cls, arg), arg)
+
+        else:
+
+            def cached(*args):
+                return call(args, args[:owner] + args[owner + 1 :])
+
+        functools.update_wrapper(cached, function)
+        cached.cache_info = cache.cache_info  # type: ignore
+        cached.cache_clear = cache.cache_clear  # type: ignore
+        return cached  # type: ignore
+
+    return decorator
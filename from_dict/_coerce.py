@@ -0,0 +1,203 @@
+import datetime
+import decimal
+import enum
+import uuid
+from typing import Any, Callable, Dict, Optional, Type, get_args, get_origin
+
+from ._class_cache import class_cache
+from ._typing import is_union, unwrap_type_alias
+
+Coercer = Callable[[Any], Any]
+
+_TRUE_STRINGS = frozenset(("true", "t", "yes", "y", "on", "1"))
+_FALSE_STRINGS = frozenset(("false", "f", "no", "n", "off", "0"))
+
+
+def convert_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered in _TRUE_STRINGS:
+        return True
+    if lowered in _FALSE_STRINGS:
+        return False
+    raise ValueError(f"Not a bool: {value!r}")
+
+
+def enum_converter(t: Type[enum.Enum]) -> Callable[[str], enum.Enum]:
+    """Members are looked up by the str of their value, or else by their name"""
+    members: Dict[str, enum.Enum] = {m.name: m for m in t}
+    members.update((str(m.value), m) for m in t)
+
+    def convert_enum(value: str) -> enum.Enum:
+        try:
+            return members[value]
+        except KeyError:
+            raise ValueError(f"Not a {t.__name__}: {value!r}") from None
+
+    return convert_enum
+
+
+# Conversions of str to types that can't be constructed from a str directly
+STR_CONVERTERS: Dict[Any, Callable[[str], Any]] = {
+    int: int,
+    float: float,
+    bool: convert_bool,
+    decimal.Decimal: decimal.Decimal,
+    datetime.date: datetime.date.fromisoformat,
+    datetime.datetime: datetime.datetime.fromisoformat,
+    datetime.time: datetime.time.fromisoformat,
+    uuid.UUID: uuid.UUID,
+}
+
+
+def _int_from(v: Any) -> int:
+    if type(v) is float and v.is_integer():
+        return int(v)
+    raise ValueError
+
+
+def _float_from(v: Any) -> float:
+    if type(v) is int:
+        return float(v)
+    raise ValueError
+
+
+def _bool_from(v: Any) -> bool:
+    if type(v) is int and v in (0, 1):
+        return bool(v)
+    raise ValueError
+
+
+def _decimal_from(v: Any) -> decimal.Decimal:
+    if type(v) is int or type(v) is float:
+        return decimal.Decimal(str(v))
+    raise ValueError
+
+
+# Conversions of values that are neither str nor of the expected type
+_OTHER_CONVERTERS: Dict[Any, Callable[[Any], Any]] = {
+    int: _int_from,
+    float: _float_from,
+    bool: _bool_from,
+    decimal.Decimal: _decimal_from,
+}
+
+
+def _scalar_coercer(t: Type, from_str: Callable[[str], Any]) -> Coercer:
+    from_other = _OTHER_CONVERTERS.get(t)
+
+    def coerce_scalar(v: Any) -> Any:
+        if type(v) is t:
+            return v
+        try:
+            if type(v) is str:
+                return from_str(v)
+            if from_other is not None:
+                return from_other(v)
+        except (ValueError, decimal.InvalidOperation):
+            pass
+        return v  # Leave it to the type check to reject it
+
+    return coerce_scalar
+
+
+def _optional_coercer(coerce: Coercer) -> Coercer:
+    def coerce_optional(v: Any) -> Any:
+        if v is None:
+            return v
+        return coerce(v)
+
+    return coerce_optional
+
+
+def _list_coercer(coerce_element: Coercer) -> Coercer:
+    def coerce_list(v: Any) -> Any:
+        if type(v) is str:
+            # Comma separated values, e.g. ids=1,2,3 in a query string
+            return [coerce_element(e) for e in v.split(",")] if v else []
+        if type(v) is list:
+            return [coerce_element(e) for e in v]
+        return v
+
+    return coerce_list
+
+
+def _dict_coercer(coerce_value: Coercer) -> Coercer:
+    def coerce_dict(v: Any) -> Any:
+        if type(v) is dict:
+            return {k: coerce_value(val) for k, val in v.items()}
+        return v
+
+    return coerce_dict
+
+
+def _compile(t: Any) -> Optional[Coercer]:
+    t = unwrap_type_alias(t)
+    try:
+        from_str = STR_CONVERTERS.get(t)
+    except TypeError:  # Unhashable type hints
+        from_str = None
+    if from_str is not None:
+        return _scalar_coercer(t, from_str)
+    if isinstance(t, type) and issubclass(t, enum.Enum):
+        return _scalar_coercer(t, enum_converter(t))
+
+    origin = get_origin(t)
+    type_args = get_args(t)
+    if is_union(origin):
+        not_none = [a for a in type_args if a is not type(None)]
+        if len(not_none) == 1:
+            coerce = _compile(not_none[0])
+            return None if coerce is None else _optional_coercer(coerce)
+        return None  # Which type of the union the value is meant for is unknown
+    if origin is list and type_args:
+        coerce = _compile(type_args[0])
+        return None if coerce is None else _list_coercer(coerce)
+    if origin is dict and len(type_args) == 2:
+        coerce = _compile(type_args[1])
+        return None if coerce is None else _dict_coercer(coerce)
+    return None
+
+
+@class_cache(1000)
+def compile_coercer(t: Any) -> Optional[Coercer]:
+    """Compile a type hint into a function that converts values to it, e.g. "42" to 42 for int.
+
+    Coercers return values that are of the type already, and values they can't convert, as they are. Supported are
+    int, float, bool, Decimal, Enum, datetime.date, datetime.datetime, datetime.time, UUID, and Optional, List and
+    Dict values of those. Lists are also coerced from comma separated strings.
+
+    :param t: Type hint to convert values to.
+    :return: Coercer, or None if values of type t are not converted.
+    """
+    return _compile(t)
+
+
+def _key_converter(from_str: Callable[[str], Any]) -> Coercer:
+    def convert_key(k: Any) -> Any:
+        if type(k) is str:
+            try:
+                return from_str(k)
+            except (ValueError, decimal.InvalidOperation):
+                pass
+        return k  # Leave it to the type check to reject it
+
+    return convert_key
+
+
+@class_cache(1000)
+def compile_key_converter(t: Any) -> Optional[Coercer]:
+    """Compile the key type of a Dict into a function that converts str keys, e.g. "1" to 1 for Dict[int, V].
+
+    JSON objects only have str keys, so the same types as for compile_coercer are supported. None is returned for
+    str, Any and other types, whose keys are used as they are.
+    """
+    t = unwrap_type_alias(t)
+    if t is str or t is Any:
+        return None
+    try:
+        from_str = STR_CONVERTERS.get(t)
+    except TypeError:  # Unhashable type hints
+        return None
+    if from_str is None and isinstance(t, type) and issubclass(t, enum.Enum):
+        from_str = enum_converter(t)
+    return None if from_str is None else _key_converter(from_str)
@@ -0,0 +1,145 @@
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Sequence, Union
+
+
+class Convert:
+    """Marker for typing.Annotated that converts the value of a field before it is decoded.
+
+    Annotated[float, Convert(parse_meters)] calls parse_meters with the value from the input, e.g. "2 km", and
+    decodes its result as float. A ValueError or TypeError raised by the function is reported as FromDictTypeError.
+    to_dict calls inverse, if given, with the encoded value of the field to write the input back, e.g. "2.0 km".
+    """
+
+    def __init__(
+        self,
+        function: Callable[[Any], Any],
+        inverse: Optional[Callable[[Any], Any]] = None,
+    ) -> None:
+        self.function = function
+        self.inverse = inverse
+
+    def __repr__(self) -> str:
+        return f"Convert({getattr(self.function, '__name__', self.function)})"
+
+
+class Constraint(ABC):
+    """Base of the markers for typing.Annotated that check the decoded value of a field.
+
+    A value that does not satisfy a constraint is reported as FromDictTypeError, with the constraint as expected
+    type. None is not checked. Subclasses implement __call__, returning whether the value is valid.
+    """
+
+    @abstractmethod
+    def __call__(self, value: Any) -> bool:
+        """Is the value valid"""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class Min(Constraint):
+    """Value has to be at least minimum, e.g. Annotated[int, Min(0)]"""
+
+    def __init__(self, minimum: Any) -> None:
+        self.minimum = minimum
+
+    def __call__(self, value: Any) -> bool:
+        return value >= self.minimum
+
+    def __repr__(self) -> str:
+        return f"Min({self.minimum!r})"
+
+
+class Max(Constraint):
+    """Value has to be at most maximum, e.g. Annotated[int, Max(100)]"""
+
+    def __init__(self, maximum: Any) -> None:
+        self.maximum = maximum
+
+    def __call__(self, value: Any) -> bool:
+        return value <= self.maximum
+
+    def __repr__(self) -> str:
+        return f"Max({self.maximum!r})"
+
+
+class MaxLength(Constraint):
+    """Value has to have at most max_length elements or characters, e.g. Annotated[str, MaxLength(80)]"""
+
+    def __init__(self, max_length: int) -> None:
+        self.max_length = max_length
+
+    def __call__(self, value: Any) -> bool:
+        return len(value) <= self.max_length
+
+    def __repr__(self) -> str:
+        return f"MaxLength({self.max_length!r})"
+
+
+class Regex(Constraint):
+    """str value has to contain a match of pattern, e.g. Annotated[str, Regex(r"^[a-z]+$")]"""
+
+    def __init__(self, pattern: Union[str, "re.Pattern[str]"]) -> None:
+        self.pattern = re.compile(pattern)
+
+    def __call__(self, value: Any) -> bool:
+        return self.pattern.search(value) is not None
+
+    def __repr__(self) -> str:
+        return f"Regex({self.pattern.pattern!r})"
+
+
+ConstraintCheck = Callable[[Any], Optional[Constraint]]
+
+
+class FieldValidation:
+    """Converter, its inverse and constraints of one field, compiled from its Annotated metadata"""
+
+    __slots__ = ("convert", "revert", "check")
+
+    def __init__(self, metadata: Sequence[Any]) -> None:
+        converts = [m for m in metadata if isinstance(m, Convert)]
+        constraints = [m for m in metadata if isinstance(m, Constraint)]
+        self.convert = _compile_converters([c.function for c in converts])
+        # Converters run in order, so their inverses run backwards; one missing inverse can't be made up for
+        inverses = [c.inverse for c in reversed(converts)]
+        self.revert = None if None in inverses else _compile_converters(inverses)
+        self.check = _compile_constraints(constraints)
+
+
+def _compile_converters(
+    converters: Sequence[Callable[[Any], Any]],
+) -> Optional[Callable[[Any], Any]]:
+    if not converters:
+        return None
+    if len(converters) == 1:
+        return converters[0]
+
+    def convert(value: Any) -> Any:
+        for c in converters:
+            value = c(value)
+        return value
+
+    return convert
+
+
+def _compile_constraints(
+    constraints: Sequence[Constraint],
+) -> Optional[ConstraintCheck]:
+    """Function returning the first constraint the value violates, None if it satisfies all"""
+    if not constraints:
+        return None
+
+    def check(value: Any) -> Optional[Constraint]:
+        if value is None:
+            return None
+        for c in constraints:
+            try:
+                if not c(value):
+                    return c
+            except TypeError:  # e.g. comparing a str with an int
+                return c
+        return None
+
+    return check
@@ -0,0 +1,216 @@
+import sys
+from typing import Any, Dict, List, Tuple, Type, get_args, get_origin
+
+from ._coerce import compile_key_converter
+from ._from_dict import C, Decoder, DecodeOptions, FromDictTypeError
+from ._from_dict import decode_object, get_argument_names, get_constructor_type_hints
+from ._from_dict import get_field_validations
+from ._from_dict import make_decode_options, resolve_str_forward_ref, run_top_level
+from ._limits import FromDictLimitError
+from ._typing import is_union, unwrap_type_alias
+
+# Key path below the current structure and value of every flattened key
+Entries = List[Tuple[List[str], Any]]
+
+
+def _group(entries: Entries) -> Dict[str, Entries]:
+    """Group entries by the first part of their key path"""
+    groups: Dict[str, Entries] = {}
+    for path, value in entries:
+        group = groups.get(path[0])
+        if group is None:
+            group = groups[path[0]] = []
+        group.append((path[1:], value))
+    return groups
+
+
+def _nest(entries: Entries) -> Any:
+    """Nested dicts for entries whose type is not known"""
+    if len(entries) == 1 and not entries[0][0]:
+        return entries[0][1]
+    return {k: _nest(group) for k, group in _group(entries).items()}
+
+
+def _leaf(entries: Entries) -> Tuple[bool, Any]:
+    """Is there a single entry without nested keys, and its value"""
+    if len(entries) == 1 and not entries[0][0]:
+        return True, entries[0][1]
+    for path, _ in entries:
+        if not path:
+            raise ValueError("A key is given with a value and with nested keys")
+    return False, None
+
+
+def _list_elements(t: Any, entries: Entries) -> List[Entries]:
+    """Entries of the elements of a list of type hint t, by their index"""
+    indexed = []
+    for index, group in _group(entries).items():
+        # Only 0, 1, 2, ...; "-1" or "01" would be a second name of an element
+        if not (index.isascii() and index.isdigit()) or (
+            index.startswith("0") and index != "0"
+        ):
+            raise FromDictTypeError([index], t, "invalid list index")
+        indexed.append((int(index), group))
+    indexed.sort(key=lambda i: i[0])
+    for expected, (index, _) in enumerate(indexed):
+        if index != expected:
+            raise FromDictTypeError([str(expected)], t, "missing list index")
+    return [group for _, group in indexed]
+
+
+def _unflatten(cls: Type, t: Any, entries: Entries, ns_types: Any) -> Any:
+    """Nested dicts and lists for entries of type hint t, like from_dict gets them"""
+    is_leaf, value = _leaf(entries)
+    if is_leaf:
+        return value
+    t = unwrap_type_alias(resolve_str_forward_ref(t, cls, ns_types))
+    origin = get_origin(t)
+    type_args = get_args(t)
+
+    if is_union(origin):
+        not_none = [a for a in type_args if a is not type(None)]
+        if len(not_none) == 1:
+            return _unflatten(cls, not_none[0], entries, ns_types)
+    elif origin is list and type_args:
+        return [
+            _unflatten(cls, type_args[0], group, ns_types)
+            for group in _list_elements(t, entries)
+        ]
+    elif origin is dict and type_args:
+        return {
+            k: _unflatten(cls, type_args[1], group, ns_types)
+            for k, group in _group(entries).items()
+        }
+    elif isinstance(origin or t, type):
+        hints = get_constructor_type_hints(t, ns_types)
+        if hints:
+            names = get_argument_names(t, ns_types)
+            nested = {}
+            for key, group in _group(entries).items():
+                name = names.get(key)
+                nested[key] = (
+                    _nest(group)
+                    if name is None
+                    else _unflatten(t, hints[name], group, ns_types)
+                )
+            return nested
+    return _nest(entries)
+
+
+def decode_flat(cls: Type[C], entries: Entries, options: DecodeOptions) -> Decoder:
+    """Decoder constructing an object of cls from flattened entries.
+
+    The entries are routed to the constructor arguments by the type hints, so only the arguments of every
+    constructed object are collected in a dict; there is no nested dict for the whole input. Arguments with a
+    Convert are given to it as nested dicts and lists, like by from_dict, and are decoded by decode_object.
+    """
+    ns_types = options.ns_types
+    hints = get_constructor_type_hints(cls, ns_types)
+    if not hints:
+        raise TypeError(f"Given class {cls} is not supported by from_dict")
+    names = get_argument_names(cls, ns_types)
+    validations = get_field_validations(cls, ns_types)
+    fd_errors = options.errors
+
+    given_args = {}
+    for key, group in _group(entries).items():
+        is_leaf, value = _leaf(group)
+        name = names.get(key)
+        if is_leaf or name is None:
+            given_args[key] = value if is_leaf else _nest(group)
+            continue
+        validation = validations.get(name) if validations else None
+
+        errors_before = 0 if fd_errors is None else len(fd_errors)
+        try:
+            if validation is not None and validation.convert is not None:
+                # The converter gets the nested input, decode_object converts and decodes it
+                given_args[key] = _unflatten(cls, hints[name], group, ns_types)
+            else:
+                given_args[key] = yield from _decode_flat_value(
+                    cls, hints[name], group, options
+                )
+        except FromDictTypeError as e:
+            # Add location for better error message
+            e = FromDictTypeError(
+                [key] + e.location, e.expected_type, e.found_type
+            ).with_traceback(sys.exc_info()[2])
+            raise e from None
+        except FromDictLimitError as e:
+            e.location.insert(0, key)
+            raise
+        if fd_errors is not None:
+            for e in fd_errors[errors_before:]:
+                e.location = [key] + e.location
+
+    return (yield decode_object(cls, given_args, options))
+
+
+def _decode_flat_value(
+    cls: Type, t: Any, entries: Entries, options: DecodeOptions
+) -> Decoder:
+    """Decoder for a value of type hint t of an argument of cls, given by nested keys"""
+    t = unwrap_type_alias(resolve_str_forward_ref(t, cls, options.ns_types))
+    origin = get_origin(t)
+    type_args = get_args(t)
+
+    if is_union(origin):
+        not_none = [a for a in type_args if a is not type(None)]
+        if len(not_none) == 1:
+            return (yield from _decode_flat_value(cls, not_none[0], entries, options))
+
+    elif origin is list and type_args:
+        elements = []
+        for group in _list_elements(t, entries):
+            is_leaf, value = _leaf(group)
+            if not is_leaf:
+                value = yield from _decode_flat_value(cls, type_args[0], group, options)
+            elements.append(value)
+        return elements
+
+    elif origin is dict and type_args:
+        convert_key = compile_key_converter(
+            resolve_str_forward_ref(type_args[0], cls, options.ns_types)
+        )
+        result = {}
+        for k, group in _group(entries).items():
+            is_leaf, value = _leaf(group)
+            if not is_leaf:
+                value = yield from _decode_flat_value(cls, type_args[1], group, options)
+            result[k if convert_key is None else convert_key(k)] = value
+        return result
+
+    elif isinstance(origin or t, type) and get_constructor_type_hints(
+        t, options.ns_types
+    ):
+        return (yield decode_flat(t, entries, options))
+
+    # Any, unions of structures, etc. are decoded from nested dicts as usual
+    return _nest(entries)
+
+
+def from_flat_dict(
+    cls: Type[C],
+    fd_flat: Dict[str, Any],
+    fd_separator: str = ".",
+    **kwargs: Any,
+) -> C:
+    """Instantiate a class from a flattened record like {"user.address.city": "Bern", "user.tags.0": "x"}.
+
+    Keys are split by fd_separator and routed along the constructor type hints: parts of keys of structure
+    arguments name the nested arguments, parts of List arguments are list indices and parts of Dict arguments are
+    dict keys. The indices of a list have to be 0 to its length - 1, without leading zeros. Nested structures are
+    constructed directly; only values of types that can't be routed, like Any or unions of several structures, and
+    arguments with a Convert are nested into dicts and lists first.
+
+    :param cls: Structure to be constructed from given record.
+    :param fd_flat: Flattened record.
+    :param fd_separator: Separator of the parts of the keys.
+    :param kwargs: fd_ options passed on to from_dict, see there. Arguments can not be overwritten.
+    :return: Object of cls constructed with keys extracted from fd_flat.
+    """
+    options = make_decode_options(**kwargs)
+    if not isinstance(fd_flat, dict):
+        raise TypeError(f"fd_flat must be dict but was found to be {type(fd_flat)}")
+    entries = [(k.split(fd_separator), v) for k, v in fd_flat.items()]
+    return run_top_level(cls, fd_flat, decode_flat(cls, entries, options))
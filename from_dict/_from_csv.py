@@ -0,0 +1,209 @@
+import csv
+import decimal
+import enum
+import inspect
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from typing import Sequence, Type, Union, get_args, get_origin
+
+from ._coerce import STR_CONVERTERS, enum_converter
+from ._from_dict import C, FromDictTypeError, FromDictUnknownArgsError
+from ._from_dict import NamespaceTypes, get_argument_keys, get_constructor_type_hints
+from ._typing import is_union, unwrap_type_alias
+
+Converter = Callable[[str], Any]
+
+
+def _optional_converter(convert: Optional[Converter]) -> Converter:
+    def convert_optional(value: str) -> Any:
+        if not value:
+            return None
+        return value if convert is None else convert(value)
+
+    return convert_optional
+
+
+def column_converter(t: Any) -> Optional[Converter]:
+    """Function converting the str of a CSV cell to type t; None if the str can be used as is.
+
+    Raises TypeError if there is no conversion for t.
+    """
+    t = unwrap_type_alias(t)
+    if t is str or t is Any:
+        return None
+    try:
+        return STR_CONVERTERS[t]
+    except (KeyError, TypeError):  # TypeError: unhashable type hints
+        pass
+    if isinstance(t, type) and issubclass(t, enum.Enum):
+        return enum_converter(t)
+
+    if is_union(get_origin(t)):
+        type_args = [a for a in get_args(t) if a is not type(None)]
+        if len(type_args) == 1 and len(get_args(t)) == 2:
+            return _optional_converter(column_converter(type_args[0]))
+    raise TypeError(f"CSV columns can not be converted to {t}")
+
+
+class _RowPlan:
+    """How to turn the cells of a row into constructor arguments; built once per CSV file"""
+
+    def __init__(
+        self,
+        cls: Type,
+        header: Sequence[str],
+        ns_types: NamespaceTypes,
+        error_on_unknown: bool,
+    ) -> None:
+        hints = get_constructor_type_hints(cls, ns_types)
+        if not hints:
+            raise TypeError(f"Given class {cls} is not supported by from_csv")
+
+        names_by_key = {v: k for k, v in get_argument_keys(cls, ns_types).items()}
+        unknown = [key for key in header if key not in names_by_key]
+        if error_on_unknown and unknown:
+            raise FromDictUnknownArgsError(unknown)
+
+        columns = [
+            (i, names_by_key[key])
+            for i, key in enumerate(header)
+            if key in names_by_key
+        ]
+        self.names = [name for _, name in columns]
+        self.indices = [i for i, _ in columns]
+        self.converters = [column_converter(hints[name]) for name in self.names]
+        self.expected_types = [hints[name] for name in self.names]
+        self.header = header
+        self.width = len(header)
+        self.positional = _positional_order(cls, self.names)
+        if self.positional is not None:
+            self.indices = [self.indices[i] for i in self.positional]
+            self.converters = [self.converters[i] for i in self.positional]
+            self.names = [self.names[i] for i in self.positional]
+            self.expected_types = [self.expected_types[i] for i in self.positional]
+
+    def convert(self, row: List[str], row_number: int) -> List[Any]:
+        """Converted cells of a row that has all columns, in the order of self.names"""
+        try:
+            return [
+                row[i] if convert is None else convert(row[i])
+                for i, convert in zip(self.indices, self.converters)
+            ]
+        except (ValueError, decimal.InvalidOperation):
+            pass
+
+        # Find the cell that could not be converted
+        return [
+            self._convert_cell(row, row_number, i, convert, t)
+            for i, convert, t in zip(self.indices, self.converters, self.expected_types)
+        ]
+
+    def convert_short(self, row: List[str], row_number: int) -> Dict[str, Any]:
+        """Converted cells of a row that misses columns at its end, by argument name.
+
+        The arguments of the missing cells are left out, so they get their default.
+        """
+        return {
+            name: self._convert_cell(row, row_number, i, convert, t)
+            for i, name, convert, t in zip(
+                self.indices, self.names, self.converters, self.expected_types
+            )
+            if i < len(row)
+        }
+
+    def _convert_cell(
+        self,
+        row: List[str],
+        row_number: int,
+        i: int,
+        convert: Optional[Converter],
+        t: Any,
+    ) -> Any:
+        try:
+            return row[i] if convert is None else convert(row[i])
+        except (ValueError, decimal.InvalidOperation):
+            location = [f"[{row_number}]", self.header[i]]
+            raise FromDictTypeError(location, t, repr(row[i])) from None
+
+
+def _positional_order(cls: Type, names: List[str]) -> Optional[List[int]]:
+    """Order in which the columns can be passed as positional arguments, None if they can't be.
+
+    This is possible if the columns are the first parameters of the constructor.
+    """
+    try:
+        parameters = list(inspect.signature(cls).parameters.values())
+    except (TypeError, ValueError):
+        return None
+    positional_kinds = (
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+    )
+    leading = [p.name for p in parameters[: len(names)] if p.kind in positional_kinds]
+    if sorted(leading) != sorted(names):
+        return None
+    return [names.index(name) for name in leading]
+
+
+def from_csv(
+    cls: Type[C],
+    fd_file: Iterable[str],
+    fd_fieldnames: Optional[Sequence[str]] = None,
+    fd_dialect: Union[str, csv.Dialect, Type[csv.Dialect]] = "excel",
+    fd_global_ns: Optional[dict] = None,
+    fd_local_ns: Optional[dict] = None,
+    fd_error_on_unknown: bool = False,
+    **fmtparams: Any,
+) -> Iterator[C]:
+    """Construct one object of cls per row of a CSV file.
+
+    Columns are matched with constructor arguments by the header row. The conversion of every column is chosen
+    once from the type hints; supported are str, int, float, bool, Decimal, Enum, datetime.date, datetime.datetime,
+    datetime.time, UUID and Optional of those, where an empty cell is None. Columns that are no constructor argument are
+    ignored, missing columns are left to the default of their argument, as are the missing cells of short rows. Rows
+    are read and converted one at a time, without building a dict per row.
+
+    :param cls: Structure to be constructed from every row.
+    :param fd_file: Open text file, or any iterable of lines, e.g. opened with newline="" as csv.reader expects.
+    :param fd_fieldnames: Column names. If not given, the first row is used as header.
+    :param fd_dialect: CSV dialect, see csv.reader.
+    :param fd_global_ns: global namespace to help with handling of forward references encoded as string literals
+    :param fd_local_ns: local namespace to help with handling of forward references encoded as string literals
+    :param fd_error_on_unknown:
+        Should a 'FromDictUnknownArgsError' exception be raised if there are columns that are not used in constructor.
+    :param fmtparams: Formatting parameters passed on to csv.reader, e.g. delimiter.
+    :return: Iterator of the constructed objects. A cell that can't be converted raises a FromDictTypeError with
+        location ["[row number]", column name]; row numbers start at 0 for the first row after the header.
+    """
+    reader = csv.reader(fd_file, fd_dialect, **fmtparams)
+    if fd_fieldnames is None:
+        try:
+            fd_fieldnames = next(reader)
+        except StopIteration:
+            return
+    plan = _RowPlan(
+        cls,
+        fd_fieldnames,
+        NamespaceTypes(fd_global_ns, fd_local_ns),
+        fd_error_on_unknown,
+    )
+
+    convert = plan.convert
+    width = plan.width
+    row_number = 0
+    if plan.positional is not None:
+        for row in reader:
+            if len(row) >= width:
+                yield cls(*convert(row, row_number))
+                row_number += 1
+            elif row:  # Like csv.DictReader, skip blank lines
+                yield cls(**plan.convert_short(row, row_number))
+                row_number += 1
+    else:
+        names = plan.names
+        for row in reader:
+            if len(row) >= width:
+                yield cls(**dict(zip(names, convert(row, row_number))))
+                row_number += 1
+            elif row:
+                yield cls(**plan.convert_short(row, row_number))
+                row_number += 1
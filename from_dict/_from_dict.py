@@ -1,11 +1,26 @@
+import copy
 import functools
 import sys
 import typing
 from collections import ChainMap
 from dataclasses import is_dataclass
-from typing import Any, Callable, Dict, ForwardRef, Mapping, Optional, Type, Literal
+from typing import Annotated, Any, Callable, Dict, ForwardRef, Generator, Mapping
+from typing import Optional, Type
+from typing import FrozenSet, Literal, NamedTuple
 from typing import TypeVar, Union, List, get_args, get_origin
 
+from ._class_cache import class_cache
+from ._check import Checker, compile_checker
+from ._coerce import Coercer, compile_coercer, compile_key_converter
+from ._canonical import CanonicalScope, CanonicalTable, is_frozen
+from ._constraints import FieldValidation
+from ._hooks import HOOKS
+from ._intern import DEFAULT_INTERN_TABLE, Intern, InternTable
+from ._limits import DecodeLimits, FromDictLimitError, LimitCounter
+from ._naming import Alias, get_naming_policy, metadata_aliases
+from ._typing import is_union, specialize, strip_annotated, unwrap_type_alias
+from ._trusted import get_trusted_constructor
+
 PYTHON_VERSION = sys.version_info[:2]
 IS_GE_PYTHON39 = PYTHON_VERSION >= (3, 9)
 C = TypeVar("C")
@@ -81,6 +96,7 @@ def type_check(check_stack: list, v: Any, t: type) -> None:
     def location():
         return ["".join(check_stack)]
 
+    t = unwrap_type_alias(t)
     try:
         # isinstance() always returns false when `Optional[Any]` is the type
         # https://github.com/python/cpython/issues/128232
@@ -99,7 +115,7 @@ def type_check(check_stack: list, v: Any, t: type) -> None:
     if not origin or not type_args:
         return  # Give up
 
-    if origin == Union:
+    if is_union(origin):
         for targ in type_args:
             try:
                 type_check(check_stack, v, targ)
@@ -136,7 +152,7 @@ def is_attr(cls):
     return hasattr(cls, "__attrs_attrs__")
 
 
-@functools.lru_cache(100)
+@class_cache(100)
 def get_constructor_type_hints(
     cls: Optional[Type],
     ns_types: NamespaceTypes,
@@ -144,13 +160,207 @@ def get_constructor_type_hints(
     if cls is None:
         return {}
 
-    if hasattr(cls, "__parameters__"):
+    # Unparametrized generic classes (e.g. Page rather than Page[int]) keep
+    # their type variables, there is nothing to swap them with.
+    if hasattr(cls, "__parameters__") and (
+        get_origin(cls) is not None or not cls.__parameters__
+    ):
         hints = _resolve_generic_class(cls, ns_types)
     else:
-        hints = typing.get_type_hints(
-            cls.__init__, ns_types.global_types, ns_types.local_types
-        ) or typing.get_type_hints(cls, ns_types.global_types, ns_types.local_types)
-    return {k: v for k, v in hints.items() if (k != "return" and v is not type(None))}
+        hints = {
+            k: strip_annotated(v)
+            for k, v in _resolve_annotated_type_hints(cls, ns_types).items()
+        }
+    return {
+        k: unwrap_type_alias(v)
+        for k, v in hints.items()
+        if (k != "return" and v is not type(None))
+    }
+
+
+def _resolve_annotated_type_hints(
+    cls: Type,
+    ns_types: NamespaceTypes,
+) -> Mapping[str, Type]:
+    """Constructor type hints with the metadata of Annotated hints.
+
+    Hints are always resolved with their metadata, which is only found once they are resolved, e.g. when Annotated
+    is reached through an alias or imported under another name.
+    """
+    hints = typing.get_type_hints(
+        cls.__init__, ns_types.global_types, ns_types.local_types, include_extras=True
+    ) or typing.get_type_hints(
+        cls, ns_types.global_types, ns_types.local_types, include_extras=True
+    )
+    return {k: v for k, v in hints.items() if k != "return"}
+
+
+@class_cache(100)
+def get_argument_keys(
+    cls: Optional[Type],
+    ns_types: NamespaceTypes,
+) -> Mapping[str, str]:
+    """Keys of the constructor arguments in the input, by argument name.
+
+    Keys are the argument names, unless they are renamed by an Alias or the naming policy of the class.
+    """
+    hints = get_constructor_type_hints(cls, ns_types)
+    origin = get_origin(cls) or cls
+    policy = get_naming_policy(origin)
+    keys = {name: name if policy is None else policy(name) for name in hints}
+    for name, alias in metadata_aliases(origin).items():
+        if name in keys:
+            keys[name] = alias
+    for name, metadata in get_constructor_annotations(cls, ns_types).items():
+        for m in metadata:
+            if isinstance(m, Alias) and name in keys:
+                keys[name] = m.name
+    return keys
+
+
+@class_cache(100)
+def get_argument_names(
+    cls: Optional[Type],
+    ns_types: NamespaceTypes,
+) -> Mapping[str, str]:
+    """Names of the constructor arguments by their key in the input"""
+    return {key: name for name, key in get_argument_keys(cls, ns_types).items()}
+
+
+@class_cache(100)
+def get_renamed_arguments(
+    cls: Optional[Type],
+    ns_types: NamespaceTypes,
+) -> Mapping[str, str]:
+    """Keys in the input of the constructor arguments that are not given by their name"""
+    return {k: v for k, v in get_argument_keys(cls, ns_types).items() if k != v}
+
+
+@class_cache(100)
+def get_constructor_argument_names(
+    cls: Optional[Type],
+    ns_types: NamespaceTypes,
+) -> FrozenSet[str]:
+    """Keys of the constructor arguments in the input; used to detect unknown arguments"""
+    return frozenset(get_argument_keys(cls, ns_types).values())
+
+
+@class_cache(100)
+def get_field_checkers(
+    cls: Optional[Type],
+    ns_types: NamespaceTypes,
+) -> Mapping[str, Checker]:
+    """Compiled type checkers of the constructor arguments"""
+    return {
+        k: compile_checker(v)
+        for k, v in get_constructor_type_hints(cls, ns_types).items()
+    }
+
+
+@class_cache(100)
+def get_field_coercers(
+    cls: Optional[Type],
+    ns_types: NamespaceTypes,
+) -> Mapping[str, Coercer]:
+    """Coercers of the constructor arguments whose values can be converted"""
+    coercers = {}
+    for k, v in get_constructor_type_hints(cls, ns_types).items():
+        coercer = compile_coercer(v)
+        if coercer is not None:
+            coercers[k] = coercer
+    return coercers
+
+
+@class_cache(100)
+def get_constructor_annotations(
+    cls: Optional[Type],
+    ns_types: NamespaceTypes,
+) -> Mapping[str, tuple]:
+    """Metadata of constructor arguments hinted with typing.Annotated[T, ...]"""
+    if cls is None:
+        return {}
+
+    cls = get_origin(cls) or cls
+    annotations = {}
+    for k, v in _resolve_annotated_type_hints(cls, ns_types).items():
+        metadata = _annotated_metadata(v)
+        if metadata:
+            annotations[k] = metadata
+    return annotations
+
+
+def _annotated_metadata(t: Any) -> tuple:
+    """Metadata of Annotated[T, ...] and of Optional[Annotated[T, ...]]"""
+    if get_origin(t) is Annotated:
+        return t.__metadata__
+    if is_union(get_origin(t)):
+        not_none = [a for a in get_args(t) if a is not type(None)]
+        if len(not_none) == 1 and get_origin(not_none[0]) is Annotated:
+            return not_none[0].__metadata__
+    return ()
+
+
+@class_cache(100)
+def get_field_interners(
+    cls: Optional[Type],
+    ns_types: NamespaceTypes,
+) -> Mapping[str, InternTable]:
+    """Intern tables of constructor arguments hinted with Annotated[str, Intern]"""
+    interners = {}
+    for k, metadata in get_constructor_annotations(cls, ns_types).items():
+        for m in metadata:
+            if m is Intern:
+                interners[k] = DEFAULT_INTERN_TABLE
+            elif isinstance(m, Intern):
+                interners[k] = m.table
+    return interners
+
+
+@class_cache(100)
+def get_field_validations(
+    cls: Optional[Type],
+    ns_types: NamespaceTypes,
+) -> Mapping[str, FieldValidation]:
+    """Converters and constraints of constructor arguments hinted with Annotated[T, Convert(...), Max(...), ...]"""
+    validations = {}
+    for k, metadata in get_constructor_annotations(cls, ns_types).items():
+        validation = FieldValidation(metadata)
+        if validation.convert is not None or validation.check is not None:
+            validations[k] = validation
+    return validations
+
+
+def convert_field(
+    validation: FieldValidation,
+    key: str,
+    value: Any,
+    t: Type,
+    fd_errors: Optional[List[FromDictTypeError]],
+) -> Any:
+    """Apply the Convert of a field; a value that can't be converted is reported and left as it is"""
+    try:
+        return validation.convert(value)  # type: ignore
+    except (ValueError, TypeError):
+        e = FromDictTypeError([key], t, repr(value))
+        if fd_errors is None:
+            raise e from None
+        fd_errors.append(e)
+        return value
+
+
+def check_field(
+    validation: FieldValidation,
+    key: str,
+    value: Any,
+    fd_errors: Optional[List[FromDictTypeError]],
+) -> None:
+    """Check the constraints of a field"""
+    violated = validation.check(value)  # type: ignore
+    if violated is not None:
+        e = FromDictTypeError([key], violated, repr(value))
+        if fd_errors is None:
+            raise e
+        fd_errors.append(e)
 
 
 def _resolve_generic_class(
@@ -161,23 +371,6 @@ def _resolve_generic_class(
     Swap out the generic parameters with the type args.
     """
 
-    def resolve_generic_arg(arg_cls: Type, swaps: Mapping[str, Type]):
-        # A generic type definition inside the generic class
-        arg_args = list(get_args(arg_cls))
-        for i, arg in enumerate(arg_args):
-            if arg in swaps:
-                arg_args[i] = swaps[arg]
-            elif get_args(arg):
-                arg_args[i] = resolve_generic_arg(arg, swaps)
-
-        arg_origin = get_origin(arg_cls)
-        if not IS_GE_PYTHON39:
-            if arg_origin is list:
-                arg_origin = typing.List
-            elif arg_origin is dict:
-                arg_origin = typing.Dict
-        return arg_origin[tuple(arg_args)]  # type: ignore
-
     origin = get_origin(cls)
     if origin is None and hasattr(cls, "__orig_bases__"):
         # Only support the inherit from a generic class if it is
@@ -188,15 +381,13 @@ def _resolve_generic_class(
     else:
         init_method = origin.__init__
     args = [resolve_str_forward_ref(a, cls, ns_types) for a in get_args(cls)]
-    swaps = dict(zip(getattr(origin, "__parameters__"), args))
+    swaps = tuple(zip(getattr(origin, "__parameters__"), args))
     hints = typing.get_type_hints(
         init_method, ns_types.global_types, ns_types.local_types
     ) or typing.get_type_hints(origin, ns_types.global_types, ns_types.local_types)
     for k, v in hints.items():
-        if v in swaps:
-            hints[k] = swaps[v]
-        elif get_args(v):
-            hints[k] = resolve_generic_arg(v, swaps)
+        # A generic type definition inside the generic class
+        hints[k] = specialize(v, swaps)
     return hints
 
 
@@ -216,7 +407,7 @@ def resolve_str_forward_ref(
     return _resolve_str_forward_ref(type_or_name, cls, ns_types)
 
 
-@functools.lru_cache(100)
+@class_cache(100, owner=1)
 def _resolve_str_forward_ref(
     type_or_name: str,
     cls: Type,
@@ -240,11 +431,18 @@ def from_dict(
     fd_global_ns: Optional[dict] = None,
     fd_local_ns: Optional[dict] = None,
     fd_error_on_unknown: bool = False,
+    fd_intern: Union[bool, InternTable] = False,
+    fd_canonical: Union[bool, CanonicalTable] = False,
+    fd_errors: Optional[List[FromDictTypeError]] = None,
+    fd_coerce: bool = False,
+    fd_trusted: bool = False,
+    fd_limits: Optional[DecodeLimits] = None,
     **overwrite_kwargs: Any,
 ) -> C:
     """Instantiate a class with parameters given by a dict.
 
-    The dict is searched for fitting parameters. Keys that are not named like a parameter are ignored.
+    The dict is searched for fitting parameters. Keys that are not named like a parameter are ignored. Parameters
+    can be given other keys with Alias or a naming_policy of the class.
 
     If cls has generic type annotations with type arguments being classes themselves (like typing.List[SubClass]),
     the sub-classes are instantiated using the dictionary structure. Currently typing.List and typing.Mapping are
@@ -261,213 +459,560 @@ def from_dict(
     :param fd_error_on_unknown:
         Should a 'FromDictUnknownArgsError' exception be raised if additional arguments are supplied that are not
         used in constructor. If this is True, fd_copy_unknown has to be set to False
+    :param fd_intern:
+        Should equal strings share one object. Applies to str arguments and to keys and str values copied into
+        __dict__. True uses a shared default table, an InternTable can be given to control its size and lifetime.
+        Single fields can be interned with Annotated[str, Intern] instead.
+    :param fd_canonical:
+        Should nested frozen dataclasses, frozen attr classes and NamedTuples that are given by equal dicts be
+        constructed only once and shared. True uses a new table for this call, a CanonicalTable can be given to
+        share instances across calls with equal options. Nothing is shared with a max_depth in fd_limits.
+    :param fd_errors:
+        If a list is given, a FromDictTypeError is appended to it instead of being raised, and decoding continues
+        with the offending value. See from_dict_with_errors.
+    :param fd_coerce:
+        Should values be converted to the type of their argument, e.g. "42" to 42 for int or "1,2" to [1, 2] for
+        List[int]. Values that can't be converted are left as they are. See compile_coercer for supported types.
+    :param fd_trusted:
+        Should dataclasses, attr classes and NamedTuples be constructed without calling their __init__, by setting
+        their attributes directly. Defaults and default factories are applied, but __post_init__, attrs validators
+        and converters are skipped. Only use this for input that is known to be valid, e.g. that was written by
+        to_dict. Other classes are constructed as usual.
+    :param fd_limits:
+        Limits on nesting depth, number of objects, length of lists and dicts and time of this call, for input from
+        untrusted sources. A FromDictLimitError is raised if one is exceeded.
     :param overwrite_kwargs: All additional keys will overwrite whatever is given in the dictionary.
     :return: Object of cls constructed with keys extracted from fd_from.
     """
+    options = make_decode_options(
+        fd_check_types,
+        fd_copy_unknown,
+        fd_global_ns,
+        fd_local_ns,
+        fd_error_on_unknown,
+        fd_intern,
+        fd_canonical,
+        fd_errors,
+        fd_coerce,
+        fd_trusted,
+        fd_limits,
+    )
+    if fd_from:
+        if not isinstance(fd_from, dict):
+            raise TypeError(f"fd_from must be dict but was found to be {type(fd_from)}")
+    else:
+        fd_from = {}
+
+    # Read straight from the caller's dict; overwrites are layered on top of it
+    # instead of being merged into a copy. Subclasses like defaultdict are
+    # copied, looking up a missing key could call their __missing__.
+    if type(fd_from) is not dict:
+        fd_from = dict(fd_from)
+    given_args = ChainMap(overwrite_kwargs, fd_from) if overwrite_kwargs else fd_from
+    return run_top_level(cls, given_args, decode_object(cls, given_args, options))
+
+
+def make_decode_options(
+    fd_check_types: bool = False,
+    fd_copy_unknown: bool = True,
+    fd_global_ns: Optional[dict] = None,
+    fd_local_ns: Optional[dict] = None,
+    fd_error_on_unknown: bool = False,
+    fd_intern: Union[bool, InternTable] = False,
+    fd_canonical: Union[bool, CanonicalTable] = False,
+    fd_errors: Optional[List[FromDictTypeError]] = None,
+    fd_coerce: bool = False,
+    fd_trusted: bool = False,
+    fd_limits: Optional[DecodeLimits] = None,
+) -> "DecodeOptions":
+    """Check and resolve the options of a from_dict call, see there"""
     if fd_copy_unknown and fd_error_on_unknown:
         raise ValueError(
             "'fd_copy_unknown' and 'fd_error_on_unknown' can't both be true"
         )
 
     ns_types = NamespaceTypes(fd_global_ns, fd_local_ns)
-    given_args = {}
-    if fd_from:
-        if not isinstance(fd_from, dict):
-            raise TypeError(f"fd_from must be dict but was found to be {type(fd_from)}")
-        given_args.update(fd_from)
-    if overwrite_kwargs:
-        given_args.update(overwrite_kwargs)
-    return _from_dict_inner(
-        cls, given_args, fd_check_types, fd_copy_unknown, fd_error_on_unknown, ns_types
+    if fd_intern is True:
+        intern = DEFAULT_INTERN_TABLE
+    elif fd_intern is False:
+        intern = None
+    else:
+        intern = fd_intern
+    canonical = None
+    # Shared objects are not decoded again, so they could not be counted against max_depth
+    if fd_canonical is not False and (fd_limits is None or fd_limits.max_depth is None):
+        table = CanonicalTable() if fd_canonical is True else fd_canonical
+        # The options that decide how objects are decoded and checked
+        canonical_options = (
+            fd_check_types,
+            fd_copy_unknown,
+            fd_error_on_unknown,
+            ns_types,
+            intern,
+            fd_coerce,
+            fd_trusted,
+            None if fd_limits is None else fd_limits.max_length,
+        )
+        canonical = CanonicalScope(table, canonical_options)  # type: ignore
+
+    return DecodeOptions(
+        fd_check_types,
+        fd_copy_unknown,
+        fd_error_on_unknown,
+        ns_types,
+        intern,
+        canonical,
+        fd_errors,
+        fd_coerce,
+        fd_trusted,
+        None if fd_limits is None else fd_limits.start(),
     )
 
 
-def _from_dict_inner(
+def run_top_level(cls: Type[C], given_args: Any, decoder: "Decoder") -> C:
+    """Run the decoder of a from_dict call, surrounded by the decode hooks"""
+    if HOOKS.enabled:
+        return HOOKS.call(cls, given_args, True, lambda: run_decoder(decoder))
+    return run_decoder(decoder)
+
+
+class FromDictResult(NamedTuple):
+    value: Any
+    errors: List[FromDictTypeError]
+
+
+def from_dict_with_errors(
     cls: Type[C],
-    given_args: Union[dict, Any],
-    fd_check_types: bool,
-    fd_copy_unknown: bool,
-    fd_error_on_unknown: bool,
-    ns_types: NamespaceTypes,
-) -> C:
-    if not isinstance(given_args, dict):
-        return given_args
+    fd_from: Optional[dict] = None,
+    **kwargs: Any,
+) -> FromDictResult:
+    """Like from_dict with fd_check_types=True, but all type errors are collected instead of raising the first one.
 
-    _get_constructor_type_hints = functools.partial(
-        get_constructor_type_hints, ns_types=ns_types
-    )
-    _resolve_str_forward_ref = functools.partial(
-        resolve_str_forward_ref, cls=cls, ns_types=ns_types
-    )
-    _from_dict = functools.partial(
-        _from_dict_inner,
-        fd_check_types=fd_check_types,
-        fd_copy_unknown=fd_copy_unknown,
-        fd_error_on_unknown=fd_error_on_unknown,
-        ns_types=ns_types,
+    Objects are constructed with the offending values, so the result can be inspected next to the errors. Errors
+    that are not type errors, e.g. missing constructor arguments, are raised as usual.
+
+    :param cls: Structure to be constructed from given dictionary.
+    :param fd_from: Dictionary from which to read parameters.
+    :param kwargs: Passed on to from_dict, see there.
+    :return: FromDictResult with the constructed object and the list of FromDictTypeErrors found.
+    """
+    errors: List[FromDictTypeError] = []
+    value = from_dict(cls, fd_from, fd_check_types=True, fd_errors=errors, **kwargs)
+    return FromDictResult(value, errors)
+
+
+class DecodeOptions:
+    """Options of one from_dict call, shared by every object constructed during the call"""
+
+    __slots__ = (
+        "check_types",
+        "copy_unknown",
+        "error_on_unknown",
+        "ns_types",
+        "intern",
+        "canonical",
+        "errors",
+        "coerce",
+        "trusted",
+        "limits",
     )
 
-    cls_constructor_argument_types = _get_constructor_type_hints(cls)
+    def __init__(
+        self,
+        check_types: bool,
+        copy_unknown: bool,
+        error_on_unknown: bool,
+        ns_types: NamespaceTypes,
+        intern: Optional[InternTable] = None,
+        canonical: Optional[CanonicalScope] = None,
+        errors: Optional[List[FromDictTypeError]] = None,
+        coerce: bool = False,
+        trusted: bool = False,
+        limits: Optional[LimitCounter] = None,
+    ) -> None:
+        self.check_types = check_types
+        self.copy_unknown = copy_unknown
+        self.error_on_unknown = error_on_unknown
+        self.ns_types = ns_types
+        self.intern = intern
+        self.canonical = canonical
+        self.errors = errors
+        self.coerce = coerce
+        self.trusted = trusted
+        self.limits = limits
+
+    def without_errors(self) -> "DecodeOptions":
+        """Options that raise type errors instead of collecting them"""
+        if self.errors is None:
+            return self
+        options = copy.copy(self)
+        options.errors = None
+        return options
+
+
+# Decoders are generators that yield a decoder for every sub-structure they need
+# and are sent its result (or thrown its exception) by run_decoder.
+Decoder = Generator[Any, Any, Any]
+
+
+def run_decoder(decoder: Decoder) -> Any:
+    """Run a decoder and the decoders it yields on an explicit stack.
+
+    However deep the given structure is, only the frames of one decoder are on the Python stack at a time.
+    """
+    stack: List[Decoder] = []
+    sent: Any = None
+    error: Optional[BaseException] = None
+    while True:
+        try:
+            if error is None:
+                sub_decoder = decoder.send(sent)
+            else:
+                thrown, error = error, None
+                sub_decoder = decoder.throw(thrown)
+        except StopIteration as e:
+            if not stack:
+                return e.value
+            decoder = stack.pop()
+            sent = e.value
+            continue
+        except BaseException as e:
+            if not stack:
+                raise
+            decoder = stack.pop()
+            error = e
+            continue
+        stack.append(decoder)
+        decoder = sub_decoder
+        sent = None
+
+
+def _hooked_decode_object(
+    cls: Type[C], given_args: Union[dict, ChainMap], options: DecodeOptions
+) -> Decoder:
+    """decode_object surrounded by the nested decode hooks"""
+    start = HOOKS.start(cls, given_args, False)
+    try:
+        result = yield decode_object(cls, given_args, options, hooked=True)
+    except BaseException as e:
+        HOOKS.end(start, e)
+        raise
+    HOOKS.end(start, None)
+    return result
+
+
+def _limited_decode_object(
+    cls: Type[C],
+    given_args: Union[dict, ChainMap],
+    options: DecodeOptions,
+    hooked: bool,
+) -> Decoder:
+    """decode_object counted against the limits of the call"""
+    limits = options.limits
+    limits.enter(given_args)  # type: ignore
+    try:
+        return (yield decode_object(cls, given_args, options, hooked, limited=True))
+    finally:
+        limits.depth -= 1  # type: ignore
+
+
+def decode_object(
+    cls: Type[C],
+    given_args: Union[dict, ChainMap, Any],
+    options: DecodeOptions,
+    hooked: bool = False,
+    limited: bool = False,
+) -> Decoder:
+    """Decoder constructing an object of cls from given_args"""
+    if not isinstance(given_args, (dict, ChainMap)):
+        return given_args
+
+    if HOOKS.nested and not hooked:
+        return (yield _hooked_decode_object(cls, given_args, options))
+    if options.limits is not None and not limited:
+        return (yield _limited_decode_object(cls, given_args, options, hooked))
+
+    ns_types = options.ns_types
+    fd_errors = options.errors
+    fd_canonical = options.canonical
+    canonical_key = None
+    if fd_canonical is not None and is_frozen(cls):
+        try:
+            canonical_key = fd_canonical.key(cls, given_args)
+        except (TypeError, RecursionError):
+            pass  # Unhashable or very deep given_args, construct it as usual
+        else:
+            canonical_object = fd_canonical.get(canonical_key)
+            if canonical_object is not None:
+                return canonical_object
+
+    cls_constructor_argument_types = get_constructor_type_hints(cls, ns_types)
     if not cls_constructor_argument_types:
         raise TypeError(f"Given class {cls} is not supported by from_dict")
 
+    fd_intern = options.intern
+    field_interners = get_field_interners(cls, ns_types)
+    do_intern = fd_intern is not None or field_interners
+
+    errors_before = 0 if fd_errors is None else len(fd_errors)
+    fd_check_types = options.check_types
+    field_checkers = get_field_checkers(cls, ns_types) if fd_check_types else None
+    field_coercers = get_field_coercers(cls, ns_types) if options.coerce else None
+    field_validations = get_field_validations(cls, ns_types)
+
     ckwargs = {}
+    renamed = get_renamed_arguments(cls, ns_types)
     for cls_argument_name, cls_argument_type in cls_constructor_argument_types.items():
+        key = (
+            renamed.get(cls_argument_name, cls_argument_name)
+            if renamed
+            else cls_argument_name
+        )
         try:
-            given_argument = given_args[cls_argument_name]
+            argument_value = given_args[key]
         except KeyError:
             continue
 
-        try:
-            # Recursively from_dict attributes which are structures, too
-            argument_value = handle_item(
-                _get_constructor_type_hints,
-                _resolve_str_forward_ref,
-                _from_dict,
-                cls_argument_type,
-                given_argument,
+        validation = (
+            field_validations.get(cls_argument_name) if field_validations else None
+        )
+        if validation is not None and validation.convert is not None:
+            argument_value = convert_field(
+                validation, key, argument_value, cls_argument_type, fd_errors
             )
-        except FromDictTypeError as e:
-            # Add location for better error message
-            e = FromDictTypeError(
-                [cls_argument_name] + e.location, e.expected_type, e.found_type
-            ).with_traceback(sys.exc_info()[2])
-            raise e from None
 
-        if fd_check_types:
-            type_check([cls_argument_name], argument_value, cls_argument_type)
+        if field_coercers:
+            coerce = field_coercers.get(cls_argument_name)
+            if coerce is not None:
+                argument_value = coerce(argument_value)
 
-        ckwargs[cls_argument_name] = argument_value
+        # Only dicts and lists can hold structures that have to be constructed
+        if isinstance(argument_value, (dict, list)):
+            field_errors_before = 0 if fd_errors is None else len(fd_errors)
+            try:
+                argument_value = yield handle_item(
+                    cls, options, cls_argument_type, argument_value
+                )
+            except FromDictTypeError as e:
+                # Add location for better error message
+                e = FromDictTypeError(
+                    [key] + e.location, e.expected_type, e.found_type
+                ).with_traceback(sys.exc_info()[2])
+                raise e from None
+            except FromDictLimitError as e:
+                e.location.insert(0, key)
+                raise
+
+            if fd_errors is not None and len(fd_errors) > field_errors_before:
+                # Add location to errors collected in sub-structures
+                for e in fd_errors[field_errors_before:]:
+                    e.location = [key] + e.location
+
+        # The compiled checker is fast; type_check is only needed to find out
+        # where exactly the value does not agree with its type.
+        if fd_check_types and not field_checkers[cls_argument_name](argument_value):
+            try:
+                type_check([key], argument_value, cls_argument_type)
+            except FromDictTypeError as e:
+                if fd_errors is None:
+                    raise
+                fd_errors.append(e)
+
+        if validation is not None and validation.check is not None:
+            check_field(validation, key, argument_value, fd_errors)
+
+        if do_intern and type(argument_value) is str:
+            intern = field_interners.get(cls_argument_name, fd_intern)
+            if intern is not None:
+                argument_value = intern(argument_value)
 
-    created_object = cls(**ckwargs)
+        ckwargs[cls_argument_name] = argument_value
 
-    if given_args and (fd_copy_unknown or fd_error_on_unknown):
+    construct = get_trusted_constructor(cls) if options.trusted else None
+    if construct is None:
+        created_object = cls(**ckwargs)
+    else:
+        created_object = construct(ckwargs)
+
+    # Common case: every given key is a constructor argument. The size check
+    # avoids iterating given_args when there are more keys than arguments.
+    fd_copy_unknown = options.copy_unknown
+    fd_error_on_unknown = options.error_on_unknown
+    known_names = get_constructor_argument_names(cls, ns_types)
+    if (
+        given_args
+        and (fd_copy_unknown or fd_error_on_unknown)
+        and (
+            len(given_args) > len(known_names) or not known_names.issuperset(given_args)
+        )
+    ):
         created_object_dict = getattr(created_object, "__dict__", None)
-        known_args = ChainMap(ckwargs, created_object_dict or {})
+        known_attributes = created_object_dict or {}
 
         # Check if created_object has a dictionary:
         if fd_copy_unknown and created_object_dict is not None:
             # Add the rest of the arguments to the dict, if possible.
             # Do not overwrite existing keys
-            unknown_args = {k: v for k, v in given_args.items() if k not in known_args}
+            unknown_args = {
+                k: v
+                for k, v in given_args.items()
+                if k not in known_names and k not in known_attributes
+            }
+            if fd_intern is not None:
+                unknown_args = {
+                    fd_intern(k): fd_intern(v) if type(v) is str else v
+                    for k, v in unknown_args.items()
+                }
             created_object.__dict__.update(unknown_args)
-        elif fd_error_on_unknown and set(given_args).difference(known_args):
-            unknown_args = [k for k in given_args if k not in known_args]
-            raise FromDictUnknownArgsError(unknown_args)
-
+        elif fd_error_on_unknown:
+            unknown_args = [
+                k
+                for k in given_args
+                if k not in known_names and k not in known_attributes
+            ]
+            if unknown_args:
+                raise FromDictUnknownArgsError(unknown_args)
+
+    if canonical_key is not None and (
+        fd_errors is None or len(fd_errors) == errors_before
+    ):
+        fd_canonical.add(canonical_key, created_object)  # type: ignore
     return created_object
 
 
 def handle_item(
-    _get_constructor_type_hints: Callable[[Type], Mapping[str, Type]],
-    _resolve_str_forward_ref: Callable[[Union[str, Type]], Type],
-    _from_dict: Callable[[Type, dict], Any],
+    cls: Type,
+    options: DecodeOptions,
     cls_argument_type: Type,
     given_argument: Any,
-):
+) -> Decoder:
     """Handles an item who's type has not been determined yet"""
+    cls_argument_type = unwrap_type_alias(cls_argument_type)
     if isinstance(given_argument, dict):
-        return handle_dict_argument(
-            _get_constructor_type_hints,
-            _resolve_str_forward_ref,
-            _from_dict,
-            cls_argument_type,
-            get_args(cls_argument_type),
-            given_argument,
+        return (
+            yield from handle_dict_argument(
+                cls,
+                options,
+                cls_argument_type,
+                get_args(cls_argument_type),
+                given_argument,
+            )
         )
     elif isinstance(given_argument, list):
-        return handle_list_argument(
-            _get_constructor_type_hints,
-            _resolve_str_forward_ref,
-            _from_dict,
-            cls_argument_type,
-            get_args(cls_argument_type),
-            given_argument,
+        return (
+            yield from handle_list_argument(
+                cls,
+                options,
+                cls_argument_type,
+                get_args(cls_argument_type),
+                given_argument,
+            )
         )
     # TODO: Add support for Tuple?
     else:
         return given_argument
 
 
+def _decode_values(
+    decode: Callable[[Any], Decoder],
+    given_argument: dict,
+    convert_key: Optional[Coercer] = None,
+) -> Decoder:
+    result = {}
+    if convert_key is None:
+        for k, v in given_argument.items():
+            result[k] = yield decode(v)
+    else:
+        for k, v in given_argument.items():
+            result[convert_key(k)] = yield decode(v)
+    return result
+
+
+def _convert_keys(given_argument: dict, convert_key: Optional[Coercer]) -> dict:
+    if convert_key is None:
+        return given_argument  # TODO: return a copy?
+    return {convert_key(k): v for k, v in given_argument.items()}
+
+
+def _decode_elements(decode: Callable[[Any], Decoder], given_argument: list) -> Decoder:
+    result = []
+    for element in given_argument:
+        result.append((yield decode(element)))
+    return result
+
+
 def handle_dict_argument(
-    _get_constructor_type_hints: Callable[[Type], Mapping[str, Type]],
-    _resolve_str_forward_ref: Callable[[Union[str, Type]], Type],
-    _from_dict: Callable[[Type, dict], Any],
+    cls: Type,
+    options: DecodeOptions,
     cls_argument_type: Type,
     cls_arg_type_args: tuple,
     given_argument: dict,
-):
+) -> Decoder:
     """This is called when the given argument is an instance of 'dict'"""
 
     # Empty dictionary. Does not matter what the items are.
     if not given_argument:
         return given_argument
+    if options.limits is not None:
+        options.limits.check_length(given_argument)
 
     # Common case: The expected type is a dataclass or attr
     if is_dataclass(cls_argument_type) or is_attr(cls_argument_type):
-        return _from_dict(cls_argument_type, given_argument)  # type: ignore
+        return (yield decode_object(cls_argument_type, given_argument, options))
 
+    ns_types = options.ns_types
     cls_argument_origin = get_origin(cls_argument_type)
 
     # Expected type is dictionary object with type hints
     if cls_argument_origin is dict:
-        # Dict[a,b]; we only support b being a structure.
-        value_type = _resolve_str_forward_ref(cls_arg_type_args[1])
+        # Dict[a,b]; keys are converted to a, values are constructed if b is a structure.
+        # Keys of JSON objects are str, which needs no conversion.
+        key_type = cls_arg_type_args[0]
+        convert_key = (
+            None
+            if key_type is str
+            else compile_key_converter(resolve_str_forward_ref(key_type, cls, ns_types))
+        )
+        value_type = unwrap_type_alias(
+            resolve_str_forward_ref(cls_arg_type_args[1], cls, ns_types)
+        )
 
         # The dictionary value's type is either a dataclass or attr class
         # Check this first because it is a common case and a fast check
         if is_dataclass(value_type) or is_attr(value_type):
-            return {k: _from_dict(value_type, v) for k, v in given_argument.items()}
+            decode = functools.partial(decode_object, value_type, options=options)
+            return (yield from _decode_values(decode, given_argument, convert_key))
 
         # The dictionary value's type can be anything so leave it as it is.
         if value_type is Any:
-            return given_argument  # TODO: return a copy?
+            return _convert_keys(given_argument, convert_key)
 
         # A generic type with type-hints
         value_type_origin = get_origin(value_type)
         if value_type_origin is not None:
             if value_type_origin in (dict, list):
-                return {
-                    k: handle_item(
-                        _get_constructor_type_hints,
-                        _resolve_str_forward_ref,
-                        _from_dict,
-                        value_type,
-                        v,
-                    )
-                    for k, v in given_argument.items()
-                }
+                decode = functools.partial(handle_item, cls, options, value_type)
+                return (yield from _decode_values(decode, given_argument, convert_key))
 
-            if value_type_origin is Union:
-                return {
-                    k: _handle_union(
-                        _get_constructor_type_hints,
-                        _resolve_str_forward_ref,
-                        _from_dict,
-                        value_type,
-                        v,
-                    )
-                    for k, v in given_argument.items()
-                }
+            if is_union(value_type_origin):
+                decode = functools.partial(_handle_union, cls, options, value_type)
+                return (yield from _decode_values(decode, given_argument, convert_key))
             if value_type_origin is Literal:
-                return given_argument
+                return _convert_keys(given_argument, convert_key)
 
         # Any object that has type-hints in the constructor
-        if _get_constructor_type_hints(value_type):
-            return {k: _from_dict(value_type, v) for k, v in given_argument.items()}
+        if get_constructor_type_hints(value_type, ns_types):
+            decode = functools.partial(decode_object, value_type, options=options)
+            return (yield from _decode_values(decode, given_argument, convert_key))
 
         # The dictionary value's type does not need to be converted
         # Examples: int, str, or dict (with no type-hints)
-        return given_argument  # TODO: return a copy?
+        return _convert_keys(given_argument, convert_key)
 
     # Expected type is a union of multiple types
-    if cls_argument_origin is Union:
-        return _handle_union(
-            _get_constructor_type_hints,
-            _resolve_str_forward_ref,
-            _from_dict,
-            cls_argument_type,
-            given_argument,
+    if is_union(cls_argument_origin):
+        return (
+            yield from _handle_union(cls, options, cls_argument_type, given_argument)
         )
 
     # Expected type can be anything so leave it as it is.
@@ -475,8 +1020,8 @@ def handle_dict_argument(
         return given_argument
 
     # Expected type is any object has type-hints in the constructor
-    if _get_constructor_type_hints(cls_argument_type):
-        return _from_dict(cls_argument_type, given_argument)
+    if get_constructor_type_hints(cls_argument_type, ns_types):
+        return (yield decode_object(cls_argument_type, given_argument, options))
 
     # The argument's type does not need to be converted
     # Should only be be a dict (with no type-hints)
@@ -485,29 +1030,34 @@ def handle_dict_argument(
 
 
 def handle_list_argument(
-    _get_constructor_type_hints: Callable[[Type], Mapping[str, Type]],
-    _resolve_str_forward_ref: Callable[[Union[str, Type]], Type],
-    _from_dict: Callable[[Type, dict], Any],
+    cls: Type,
+    options: DecodeOptions,
     cls_argument_type: Type,
     cls_arg_type_args: tuple,
     given_argument: list,
-):
+) -> Decoder:
     """This is called when the given argument is an instance of 'list'"""
 
     # Empty list. Does not matter what the elements are.
     if not given_argument:
         return given_argument
+    if options.limits is not None:
+        options.limits.check_length(given_argument)
 
+    ns_types = options.ns_types
     cls_argument_origin = get_origin(cls_argument_type)
 
     # Expected type is list object with type hints
     if cls_argument_origin is list:
-        element_type = _resolve_str_forward_ref(cls_arg_type_args[0])
+        element_type = unwrap_type_alias(
+            resolve_str_forward_ref(cls_arg_type_args[0], cls, ns_types)
+        )
 
         # The list's element's type is either a dataclass or attr class
         # Check this first because it is a common case and a fast check
         if is_dataclass(element_type) or is_attr(element_type):
-            return [_from_dict(element_type, x) for x in given_argument]
+            decode = functools.partial(decode_object, element_type, options=options)
+            return (yield from _decode_elements(decode, given_argument))
 
         # The list element's type can be anything so leave it as it is.
         if element_type is Any:
@@ -517,94 +1067,86 @@ def handle_list_argument(
         element_type_origin = get_origin(element_type)
         if element_type_origin is not None:
             if element_type_origin in (dict, list):
-                return [
-                    handle_item(
-                        _get_constructor_type_hints,
-                        _resolve_str_forward_ref,
-                        _from_dict,
-                        element_type,
-                        element,
-                    )
-                    for element in given_argument
-                ]
-
-            if element_type_origin is Union:
-                return [
-                    _handle_union(
-                        _get_constructor_type_hints,
-                        _resolve_str_forward_ref,
-                        _from_dict,
-                        element_type,
-                        v,
-                    )
-                    for v in given_argument
-                ]
+                decode = functools.partial(handle_item, cls, options, element_type)
+                return (yield from _decode_elements(decode, given_argument))
+
+            if is_union(element_type_origin):
+                decode = functools.partial(_handle_union, cls, options, element_type)
+                return (yield from _decode_elements(decode, given_argument))
             if element_type_origin is Literal:
                 return given_argument
 
         # Any object that has type-hints in the constructor
-        if _get_constructor_type_hints(element_type):
-            return [_from_dict(element_type, x) for x in given_argument]
+        if get_constructor_type_hints(element_type, ns_types):
+            decode = functools.partial(decode_object, element_type, options=options)
+            return (yield from _decode_elements(decode, given_argument))
 
         # The list value's type does not need to be converted
         # Examples: int, str, or dict (with no type-hints)
         return given_argument  # TODO: return a copy?
 
     # Expected type is a union of multiple types
-    if cls_argument_origin is Union:
-        return _handle_union(
-            _get_constructor_type_hints,
-            _resolve_str_forward_ref,
-            _from_dict,
-            cls_argument_type,
-            given_argument,
+    if is_union(cls_argument_origin):
+        return (
+            yield from _handle_union(cls, options, cls_argument_type, given_argument)
         )
 
     return given_argument
 
 
 def _handle_union(
-    _get_constructor_type_hints: Callable[[Type], Mapping[str, Type]],
-    _resolve_str_forward_ref: Callable[[Union[str, Type]], Type],
-    _from_dict: Callable[[Type, dict], Any],
+    cls: Type,
+    options: DecodeOptions,
     cls_argument_type: Type,
     given_argument: Any,
-):
+) -> Decoder:
     """This is called when the expected type is a union of multiple types"""
     if isinstance(given_argument, dict):
         for arg_type in get_args(cls_argument_type):
+            arg_type = unwrap_type_alias(arg_type)
             if arg_type is type(None):
                 continue
             if get_origin(arg_type) is dict:
-                return handle_dict_argument(
-                    _get_constructor_type_hints,
-                    _resolve_str_forward_ref,
-                    _from_dict,
-                    arg_type,
-                    get_args(arg_type),
-                    given_argument,
+                return (
+                    yield from handle_dict_argument(
+                        cls, options, arg_type, get_args(arg_type), given_argument
+                    )
                 )
-            constructor_param_names = _get_constructor_type_hints(arg_type)
+            # Only classes have constructor hints; before Python 3.11, Any is no class either
+            if arg_type is Any or not isinstance(
+                get_origin(arg_type) or arg_type, type
+            ):
+                continue
+            constructor_param_names = get_constructor_argument_names(
+                arg_type, options.ns_types
+            )
             if not any(k not in constructor_param_names for k in given_argument):
                 try:
-                    return _from_dict(arg_type, given_argument)
+                    # Errors have to be raised to try the next type of the union
+                    return (
+                        yield decode_object(
+                            arg_type, given_argument, options.without_errors()
+                        )
+                    )
                 except TypeError:
                     pass
         return given_argument
 
     if isinstance(given_argument, list):
         for arg_type in get_args(cls_argument_type):
+            arg_type = unwrap_type_alias(arg_type)
             if arg_type is type(None):
                 continue
             if get_origin(arg_type) is list:
                 try:
-                    return handle_list_argument(
-                        _get_constructor_type_hints,
-                        _resolve_str_forward_ref,
-                        _from_dict,
-                        arg_type,
-                        get_args(arg_type),
-                        given_argument,
+                    return (
+                        yield from handle_list_argument(
+                            cls,
+                            options.without_errors(),
+                            arg_type,
+                            get_args(arg_type),
+                            given_argument,
+                        )
                     )
                 except TypeError:
                     pass
@@ -0,0 +1,61 @@
+import json
+import os
+from typing import Any, Callable, Optional, Type, Union
+
+from ._from_dict import C, from_dict
+
+
+def from_json(
+    cls: Type[C],
+    fd_json: Union[str, bytes, bytearray],
+    fd_parse_float: Optional[Callable[[str], Any]] = None,
+    **kwargs: Any,
+) -> C:
+    """Instantiate a class with parameters given by a JSON document.
+
+    This is a convenience wrapper of json.loads followed by from_dict, it is not faster than calling them yourself.
+    The document is parsed as a whole by the json module before any object is constructed.
+
+    :param cls: Structure to be constructed from given JSON document.
+    :param fd_json: JSON document as str, bytes or bytearray. The top-level value has to be an object.
+    :param fd_parse_float: Called with the string of every JSON float, e.g. decimal.Decimal. Defaults to float.
+    :param kwargs: Passed on to from_dict, see there.
+    :return: Object of cls constructed with keys extracted from fd_json.
+    """
+    given_args = json.loads(fd_json, parse_float=fd_parse_float)
+    return _from_json_object(cls, given_args, kwargs)
+
+
+def from_json_file(
+    cls: Type[C],
+    fd_path: Union[str, "os.PathLike[str]"],
+    fd_parse_float: Optional[Callable[[str], Any]] = None,
+    **kwargs: Any,
+) -> C:
+    """Instantiate a class with parameters given by a JSON file.
+
+    Like from_json, a convenience wrapper of json.loads followed by from_dict. The bytes of the file are dropped
+    once they are decoded, so they are not kept in memory next to the document while it is parsed.
+
+    :param cls: Structure to be constructed from given JSON file.
+    :param fd_path: Path of the JSON file. Its encoding is detected like json.loads does for bytes.
+    :param fd_parse_float: Called with the string of every JSON float, e.g. decimal.Decimal. Defaults to float.
+    :param kwargs: Passed on to from_dict, see there.
+    :return: Object of cls constructed with keys extracted from the file.
+    """
+    with open(fd_path, "rb") as f:
+        data = f.read()
+    document = data.decode(json.detect_encoding(data), "surrogatepass")
+    del data
+
+    given_args = json.loads(document, parse_float=fd_parse_float)
+    del document
+    return _from_json_object(cls, given_args, kwargs)
+
+
+def _from_json_object(cls: Type[C], given_args: Any, kwargs: dict) -> C:
+    if not isinstance(given_args, dict):
+        raise TypeError(
+            f"JSON document must be an object but was found to be {type(given_args)}"
+        )
+    return from_dict(cls, given_args, **kwargs)
@@ -0,0 +1,136 @@
+from typing import Any, Callable, List, Optional, Tuple
+
+
+def class_name(cls: Any) -> str:
+    if isinstance(cls, type):
+        return f"{cls.__module__}.{cls.__qualname__}"
+    return repr(cls)  # Parametrized generics like Page[int]
+
+
+class DecodeEvent:
+    """What is being decoded; passed to decode hooks.
+
+    top_level is True for the event of a from_dict call and False for the events of every object constructed
+    during that call, including the top-level object.
+    """
+
+    __slots__ = ("cls", "payload_size", "top_level")
+
+    def __init__(self, cls: Any, payload_size: int, top_level: bool) -> None:
+        self.cls = cls
+        self.payload_size = payload_size
+        self.top_level = top_level
+
+    @property
+    def class_name(self) -> str:
+        return class_name(self.cls)
+
+    def __repr__(self) -> str:
+        return f"DecodeEvent({self.class_name}, {self.payload_size}, {self.top_level})"
+
+
+OnDecodeStart = Callable[[DecodeEvent], Any]
+OnDecodeEnd = Callable[[DecodeEvent, Any, Optional[BaseException]], None]
+
+
+class DecodeHook:
+    def __init__(
+        self, on_start: OnDecodeStart, on_end: OnDecodeEnd, nested: bool
+    ) -> None:
+        self.on_start = on_start
+        self.on_end = on_end
+        self.nested = nested
+
+
+class DecodeHooks:
+    """Registered decode hooks.
+
+    The decoder only checks `enabled` for from_dict calls and `nested` for every constructed object; everything
+    else is only done if hooks are registered.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.nested = False
+        self._top_level: Tuple[DecodeHook, ...] = ()
+        self._nested: Tuple[DecodeHook, ...] = ()
+
+    def add(self, hook: DecodeHook) -> None:
+        self._set_hooks(self._top_level + (hook,))
+
+    def remove(self, hook: DecodeHook) -> None:
+        self._set_hooks(tuple(h for h in self._top_level if h is not hook))
+
+    def _set_hooks(self, hooks: Tuple[DecodeHook, ...]) -> None:
+        self._top_level = hooks
+        self._nested = tuple(h for h in hooks if h.nested)
+        self.enabled = bool(self._top_level)
+        self.nested = bool(self._nested)
+
+    def start(
+        self, cls: Any, given_args: Any, top_level: bool
+    ) -> Tuple[DecodeEvent, List[Tuple[DecodeHook, Any]]]:
+        """Call on_start of the registered hooks; pass the result to end when decoding is done"""
+        hooks = self._top_level if top_level else self._nested
+        event = DecodeEvent(cls, len(given_args), top_level)
+        started: List[Tuple[DecodeHook, Any]] = []
+        try:
+            for hook in hooks:
+                started.append((hook, hook.on_start(event)))
+        except BaseException as e:
+            self.end((event, started), e)
+            raise
+        return event, started
+
+    def end(
+        self,
+        start: Tuple[DecodeEvent, List[Tuple[DecodeHook, Any]]],
+        error: Optional[BaseException],
+    ) -> None:
+        """Call on_end of the hooks started by start, in reverse order"""
+        event, started = start
+        for hook, token in reversed(started):
+            hook.on_end(event, token, error)
+
+    def call(
+        self,
+        cls: Any,
+        given_args: Any,
+        top_level: bool,
+        decode: Callable[[], Any],
+    ) -> Any:
+        """Call decode() surrounded by the registered hooks"""
+        start = self.start(cls, given_args, top_level)
+        try:
+            result = decode()
+        except BaseException as e:
+            self.end(start, e)
+            raise
+        self.end(start, None)
+        return result
+
+
+HOOKS = DecodeHooks()
+
+
+def add_decode_hook(
+    on_start: OnDecodeStart, on_end: OnDecodeEnd, nested: bool = False
+) -> DecodeHook:
+    """Register callbacks that are called around every from_dict call, e.g. to open and close tracing spans.
+
+    on_start(event) is called with a DecodeEvent before decoding starts; whatever it returns is passed to
+    on_end(event, token, error) when decoding is done. error is the raised exception or None.
+
+    :param on_start: Called before decoding.
+    :param on_end: Called after decoding, also when it failed.
+    :param nested: Also call the callbacks for every constructed object, including the top-level one.
+    :return: Handle to unregister the hook with remove_decode_hook.
+    """
+    hook = DecodeHook(on_start, on_end, nested)
+    HOOKS.add(hook)
+    return hook
+
+
+def remove_decode_hook(hook: DecodeHook) -> None:
+    """Unregister a hook registered with add_decode_hook"""
+    HOOKS.remove(hook)
@@ -0,0 +1,43 @@
+from typing import Dict, Optional
+
+
+class InternTable:
+    """Maps equal strings onto one shared str object.
+
+    The table stops taking in new strings once it holds max_size entries; strings that are already in the table
+    are still shared after that. This keeps the table from growing without bound on high-cardinality data.
+    """
+
+    def __init__(self, max_size: int = 100_000) -> None:
+        self.max_size = max_size
+        self._table: Dict[str, str] = {}
+
+    def __call__(self, s: str) -> str:
+        try:
+            return self._table[s]
+        except KeyError:
+            if len(self._table) < self.max_size:
+                self._table[s] = s
+            return s
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def clear(self) -> None:
+        self._table.clear()
+
+
+DEFAULT_INTERN_TABLE = InternTable()
+
+
+class Intern:
+    """Marker for typing.Annotated that interns the str value of a field.
+
+    Use as Annotated[str, Intern] or Annotated[str, Intern(table)]. Without a table the shared default table is used.
+    """
+
+    def __init__(self, table: Optional[InternTable] = None) -> None:
+        self.table = DEFAULT_INTERN_TABLE if table is None else table
+
+    def __repr__(self) -> str:
+        return f"Intern({self.table!r})"
@@ -0,0 +1,92 @@
+import time
+from typing import Any, List, Optional
+
+
+class FromDictLimitError(ValueError):
+    def __init__(self, location: List[str], limit: str, maximum: Any):
+        self.location = location
+        self.limit = limit
+        self.maximum = maximum
+
+    def __str__(self):
+        return f"For \"{'.'.join(self.location)}\", {self.limit} of {self.maximum} exceeded"
+
+    def __repr__(self):
+        return (
+            f"FromDictLimitError({self.location!r}, {self.limit!r}, {self.maximum!r})"
+        )
+
+
+class DecodeLimits:
+    """Limits on the work of one from_dict call, to cap the CPU and memory spent on untrusted payloads.
+
+    A limit that is exceeded raises a FromDictLimitError with the location in the input. Limits that are None are
+    not checked.
+
+    :param max_depth: Maximum nesting depth of constructed objects; the top-level object has depth 1.
+    :param max_objects: Maximum number of objects constructed, including attempts of members of unions.
+    :param max_length: Maximum number of elements of a list or items of a dict, of fields and of the input of objects.
+    :param timeout: Maximum seconds from the start of the call, checked whenever an object is constructed.
+    """
+
+    def __init__(
+        self,
+        max_depth: Optional[int] = None,
+        max_objects: Optional[int] = None,
+        max_length: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.max_depth = max_depth
+        self.max_objects = max_objects
+        self.max_length = max_length
+        self.timeout = timeout
+
+    def start(self) -> "LimitCounter":
+        return LimitCounter(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"DecodeLimits(max_depth={self.max_depth!r}, max_objects={self.max_objects!r}, "
+            f"max_length={self.max_length!r}, timeout={self.timeout!r})"
+        )
+
+
+class LimitCounter:
+    """Work done by one from_dict call, checked against its limits"""
+
+    __slots__ = (
+        "max_depth",
+        "max_objects",
+        "max_length",
+        "timeout",
+        "deadline",
+        "depth",
+        "objects",
+    )
+
+    def __init__(self, limits: DecodeLimits) -> None:
+        self.max_depth = limits.max_depth
+        self.max_objects = limits.max_objects
+        self.max_length = limits.max_length
+        self.timeout = limits.timeout
+        self.deadline = (
+            None if limits.timeout is None else time.monotonic() + limits.timeout
+        )
+        self.depth = 0
+        self.objects = 0
+
+    def enter(self, given_args: Any) -> None:
+        """Count an object about to be constructed from given_args, one level deeper than the current one"""
+        self.depth += 1
+        self.objects += 1
+        if self.max_depth is not None and self.depth > self.max_depth:
+            raise FromDictLimitError([], "max_depth", self.max_depth)
+        if self.max_objects is not None and self.objects > self.max_objects:
+            raise FromDictLimitError([], "max_objects", self.max_objects)
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise FromDictLimitError([], "timeout", self.timeout)
+        self.check_length(given_args)
+
+    def check_length(self, value: Any) -> None:
+        if self.max_length is not None and len(value) > self.max_length:
+            raise FromDictLimitError([], "max_length", self.max_length)
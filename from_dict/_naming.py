@@ -0,0 +1,90 @@
+import dataclasses
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, Union
+
+NamingPolicy = Callable[[str], str]
+T = TypeVar("T")
+
+
+class Alias:
+    """Marker for typing.Annotated that gives the key of a field in the input, e.g. Annotated[str, Alias("userName")].
+
+    Instead of Annotated, the alias can also be given as metadata of a dataclass field or an attr.ib, with
+    field(metadata={"alias": "userName"}). An alias takes precedence over the naming policy of the class.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Alias({self.name!r})"
+
+
+def _split(name: str):
+    """Leading underscores and the words of a snake_case name"""
+    stripped = name.lstrip("_")
+    return name[: len(name) - len(stripped)], [w for w in stripped.split("_") if w]
+
+
+def camel_case(name: str) -> str:
+    prefix, words = _split(name)
+    if not words:
+        return name
+    return prefix + words[0] + "".join(w[:1].upper() + w[1:] for w in words[1:])
+
+
+def pascal_case(name: str) -> str:
+    prefix, words = _split(name)
+    if not words:
+        return name
+    return prefix + "".join(w[:1].upper() + w[1:] for w in words)
+
+
+def kebab_case(name: str) -> str:
+    prefix, words = _split(name)
+    if not words:
+        return name
+    return prefix + "-".join(words)
+
+
+NAMING_POLICIES: Dict[str, NamingPolicy] = {
+    "camelCase": camel_case,
+    "PascalCase": pascal_case,
+    "kebab-case": kebab_case,
+}
+
+
+def naming_policy(policy: Union[str, NamingPolicy]) -> Callable[[Type[T]], Type[T]]:
+    """Class decorator that names the input keys of all fields of the class by a policy.
+
+    @naming_policy("camelCase") reads the field user_name from the key "userName". Fields with an Alias keep it.
+    The policy applies to the decorated class and its subclasses only, not to nested structures.
+
+    :param policy: "camelCase", "PascalCase", "kebab-case" or a function turning a field name into a key.
+    :return: Decorator setting the policy of the class.
+    """
+    if isinstance(policy, str):
+        try:
+            policy = NAMING_POLICIES[policy]
+        except KeyError:
+            raise ValueError(
+                f"Unknown naming policy {policy!r}, use one of {list(NAMING_POLICIES)}"
+            ) from None
+
+    def set_policy(cls: Type[T]) -> Type[T]:
+        cls.__fd_naming_policy__ = staticmethod(policy)  # type: ignore
+        return cls
+
+    return set_policy
+
+
+def get_naming_policy(cls: Any) -> Optional[NamingPolicy]:
+    return getattr(cls, "__fd_naming_policy__", None)
+
+
+def metadata_aliases(cls: Any) -> Dict[str, str]:
+    """Aliases given with field(metadata={"alias": ...}) of dataclasses and attr classes"""
+    if dataclasses.is_dataclass(cls):
+        fields = dataclasses.fields(cls)
+    else:
+        fields = getattr(cls, "__attrs_attrs__", ())
+    return {f.name: f.metadata["alias"] for f in fields if "alias" in f.metadata}
@@ -0,0 +1,219 @@
+import dataclasses
+import sys
+from typing import Any, Dict, Mapping, Optional, Type, get_args, get_origin
+
+from ._class_cache import class_cache
+from ._coerce import Coercer, compile_key_converter
+from ._from_dict import C, Decoder, DecodeOptions, FromDictTypeError
+from ._from_dict import FromDictUnknownArgsError, check_field, convert_field
+from ._from_dict import get_argument_names, get_constructor_type_hints
+from ._from_dict import get_field_checkers, get_field_coercers, get_field_interners
+from ._from_dict import get_field_validations, handle_item, make_decode_options
+from ._from_dict import resolve_str_forward_ref, run_top_level, type_check
+from ._limits import FromDictLimitError
+from ._typing import is_union, unwrap_type_alias
+
+_MISSING = object()
+
+
+def _is_replaceable(value: Any) -> bool:
+    """Can a copy of the value be made with some of its arguments replaced"""
+    cls = type(value)
+    return (
+        dataclasses.is_dataclass(cls)
+        or hasattr(cls, "__attrs_attrs__")
+        or (isinstance(value, tuple) and hasattr(cls, "_fields"))
+    )
+
+
+@class_cache(100)
+def _get_attribute_names(cls: Type) -> Mapping[str, str]:
+    """Attributes holding the constructor arguments, by argument name, where they differ"""
+    attributes = getattr(cls, "__attrs_attrs__", ())
+    return {
+        getattr(a, "alias", None) or a.name.lstrip("_"): a.name
+        for a in attributes
+        if a.init and a.name.startswith("_")
+    }
+
+
+def _replace(obj: Any, changes: Dict[str, Any]) -> Any:
+    """Copy of obj with changed constructor arguments, like dataclasses.replace"""
+    cls = type(obj)
+    if dataclasses.is_dataclass(cls):
+        return dataclasses.replace(obj, **changes)
+    if hasattr(cls, "__attrs_attrs__"):
+        import attr
+
+        return attr.evolve(obj, **changes)
+    return obj._replace(**changes)
+
+
+def _located(key: str, decoder: Decoder, options: DecodeOptions) -> Decoder:
+    """Run a decoder of the value of key, adding key to the location of its errors"""
+    fd_errors = options.errors
+    errors_before = 0 if fd_errors is None else len(fd_errors)
+    try:
+        value = yield decoder
+    except FromDictTypeError as e:
+        # Add location for better error message
+        e = FromDictTypeError(
+            [key] + e.location, e.expected_type, e.found_type
+        ).with_traceback(sys.exc_info()[2])
+        raise e from None
+    except FromDictLimitError as e:
+        e.location.insert(0, key)
+        raise
+    if fd_errors is not None:
+        for e in fd_errors[errors_before:]:
+            e.location = [key] + e.location
+    return value
+
+
+def _decode_argument(
+    cls: Type, name: str, key: str, value: Any, options: DecodeOptions
+) -> Decoder:
+    """Decode the new value of an argument of cls like from_dict does"""
+    ns_types = options.ns_types
+    t = get_constructor_type_hints(cls, ns_types)[name]
+    validation = get_field_validations(cls, ns_types).get(name)
+    if validation is not None and validation.convert is not None:
+        value = convert_field(validation, key, value, t, options.errors)
+    if options.coerce:
+        coerce = get_field_coercers(cls, ns_types).get(name)
+        if coerce is not None:
+            value = coerce(value)
+
+    if isinstance(value, (dict, list)):
+        value = yield from _located(key, handle_item(cls, options, t, value), options)
+
+    if options.check_types and not get_field_checkers(cls, ns_types)[name](value):
+        try:
+            type_check([key], value, t)
+        except FromDictTypeError as e:
+            if options.errors is None:
+                raise
+            options.errors.append(e)
+
+    if validation is not None and validation.check is not None:
+        check_field(validation, key, value, options.errors)
+
+    if type(value) is str:
+        intern = get_field_interners(cls, ns_types).get(name, options.intern)
+        if intern is not None:
+            value = intern(value)
+    return value
+
+
+def _key_converter(cls: Type, name: str, options: DecodeOptions) -> Optional[Coercer]:
+    """Converter of the keys of the Dict, or Optional Dict, argument name of cls"""
+    t = get_constructor_type_hints(cls, options.ns_types)[name]
+    if is_union(get_origin(t)):
+        not_none = [a for a in get_args(t) if a is not type(None)]
+        t = not_none[0] if len(not_none) == 1 else t
+    t = unwrap_type_alias(t)
+    if get_origin(t) is not dict or not get_args(t):
+        return None
+    key_type = resolve_str_forward_ref(get_args(t)[0], cls, options.ns_types)
+    return compile_key_converter(key_type)
+
+
+def _patch_dict(
+    cls: Type,
+    name: str,
+    key: str,
+    current: dict,
+    delta: dict,
+    options: DecodeOptions,
+) -> Decoder:
+    """Merge delta into a Dict argument; None removes a key, structures are patched"""
+    convert_key = _key_converter(cls, name, options)
+    if convert_key is not None:
+        delta = {convert_key(k): v for k, v in delta.items()}
+    result = dict(current)
+    new_entries = {}
+    for k, v in delta.items():
+        if v is None:
+            result.pop(k, None)
+            continue
+        existing = current.get(k, _MISSING)
+        if type(v) is dict and _is_replaceable(existing):
+            result[k] = yield from _located(
+                key, _located(k, patch_object(existing, v, options), options), options
+            )
+        else:
+            new_entries[k] = v
+    if new_entries:
+        result.update(
+            (yield from _decode_argument(cls, name, key, new_entries, options))
+        )
+    return result
+
+
+def patch_object(obj: Any, delta: Dict[str, Any], options: DecodeOptions) -> Decoder:
+    """Decoder returning a copy of obj with the arguments given in delta decoded and replaced"""
+    cls = type(obj)
+    ns_types = options.ns_types
+    if not get_constructor_type_hints(cls, ns_types):
+        raise TypeError(f"Given object of {cls} is not supported by from_dict_patch")
+    names = get_argument_names(cls, ns_types)
+    attributes = _get_attribute_names(cls)
+
+    changes = {}
+    unknown = {}
+    for key, value in delta.items():
+        name = names.get(key)
+        if name is None:
+            unknown[key] = value
+            continue
+        current = getattr(obj, attributes.get(name, name), _MISSING)
+        if type(value) is dict and _is_replaceable(current):
+            changes[name] = yield from _located(
+                key, patch_object(current, value, options), options
+            )
+        elif type(value) is dict and type(current) is dict:
+            changes[name] = yield from _patch_dict(
+                cls, name, key, current, value, options
+            )
+        else:
+            changes[name] = yield from _decode_argument(cls, name, key, value, options)
+
+    if unknown and options.error_on_unknown:
+        raise FromDictUnknownArgsError(list(unknown))
+    if not changes and not unknown:
+        return obj
+
+    patched = _replace(obj, changes)
+
+    # Keep the unknown keys copied into __dict__ by from_dict, and add the new ones
+    patched_dict = getattr(patched, "__dict__", None)
+    if options.copy_unknown and patched_dict is not None:
+        for k, v in obj.__dict__.items():
+            if k not in patched_dict:
+                patched_dict[k] = v
+        for k, v in unknown.items():
+            if k not in patched_dict:
+                patched_dict[k] = v
+    return patched
+
+
+def from_dict_patch(fd_object: C, fd_delta: Dict[str, Any], **kwargs: Any) -> C:
+    """Apply a delta to an object constructed by from_dict, without decoding the unchanged parts again.
+
+    The delta is a JSON merge patch: keys of nested dataclasses, attr classes and NamedTuples that are given by a
+    dict are patched recursively, Dict arguments are merged key by key where a value of None removes the key, and
+    all other values, including lists, replace the old value and are decoded like by from_dict. Changed objects are
+    copied like with dataclasses.replace, so their __init__ and __post_init__ run again; untouched nested objects
+    are shared with fd_object. The work done scales with the size of the delta, not the size of the object.
+
+    :param fd_object: Object to be patched, it is not changed.
+    :param fd_delta: Changed arguments, by their keys in the input.
+    :param kwargs: fd_ options passed on to from_dict, see there. Arguments can not be overwritten.
+    :return: New object with the delta applied, or fd_object itself if the delta is empty.
+    """
+    options = make_decode_options(**kwargs)
+    if not isinstance(fd_delta, dict):
+        raise TypeError(f"fd_delta must be dict but was found to be {type(fd_delta)}")
+    return run_top_level(
+        type(fd_object), fd_delta, patch_object(fd_object, fd_delta, options)
+    )
@@ -0,0 +1,160 @@
+import logging
+import math
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from ._hooks import DecodeEvent, DecodeHook, add_decode_hook, class_name
+from ._hooks import remove_decode_hook
+
+logger = logging.getLogger("from_dict")
+
+# Latencies are counted in buckets of a quarter octave (factor 2**0.25, ~19%)
+_BUCKETS_PER_OCTAVE = 4
+
+
+class Histogram:
+    """Log-scale histogram; percentiles are reported as the upper bound of their bucket"""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._buckets: Dict[int, int] = {}
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        bucket = math.ceil(math.log2(value) * _BUCKETS_PER_OCTAVE) if value > 0 else 0
+        self._buckets[bucket] = self._buckets.get(bucket, 0) + 1
+
+    def percentile(self, p: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = p / 100 * self.count
+        seen = 0
+        for bucket in sorted(self._buckets):
+            seen += self._buckets[bucket]
+            if seen >= rank:
+                return min(2 ** (bucket / _BUCKETS_PER_OCTAVE), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class DecodeStats:
+    """Collects decode latencies per class and objects constructed per from_dict call.
+
+    Statistics are collected through decode hooks, so there is no cost while they are disabled.
+    """
+
+    def __init__(self) -> None:
+        self.slow_threshold: Optional[float] = None
+        self.objects_constructed = 0
+        self._latencies: Dict[Any, Histogram] = {}
+        self._objects_per_call = Histogram()
+        self._hook: Optional[DecodeHook] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._hook is not None
+
+    def enable(self, slow_threshold: Optional[float]) -> None:
+        self.slow_threshold = slow_threshold
+        if self._hook is None:
+            self._hook = add_decode_hook(self._on_start, self._on_end, nested=True)
+
+    def disable(self) -> None:
+        if self._hook is not None:
+            remove_decode_hook(self._hook)
+            self._hook = None
+
+    def _on_start(self, event: DecodeEvent) -> Tuple[float, int]:
+        return time.perf_counter(), self.objects_constructed
+
+    def _on_end(
+        self,
+        event: DecodeEvent,
+        token: Tuple[float, int],
+        error: Optional[BaseException],
+    ) -> None:
+        if error is not None:
+            return
+        start, objects_before = token
+        elapsed = time.perf_counter() - start
+        if event.top_level:
+            self._record_call(event, elapsed, objects_before)
+            return
+
+        # Construction of one object, including its sub-structures
+        self.objects_constructed += 1
+        histogram = self._latencies.get(event.cls)
+        if histogram is None:
+            histogram = self._latencies[event.cls] = Histogram()
+        histogram.add(elapsed)
+
+    def _record_call(
+        self, event: DecodeEvent, elapsed: float, objects_before: int
+    ) -> None:
+        self._objects_per_call.add(self.objects_constructed - objects_before)
+        if self.slow_threshold is not None and elapsed >= self.slow_threshold:
+            logger.warning(
+                "Slow decode of %s took %.3f ms for a payload with %d keys",
+                event.class_name,
+                elapsed * 1000,
+                event.payload_size,
+            )
+
+    def reset(self) -> None:
+        self.objects_constructed = 0
+        self._latencies.clear()
+        self._objects_per_call = Histogram()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "classes": {
+                class_name(cls): h.summary() for cls, h in self._latencies.items()
+            },
+            "objects_per_call": self._objects_per_call.summary(),
+        }
+
+
+STATS = DecodeStats()
+
+
+def enable_stats(slow_threshold: Optional[float] = None) -> None:
+    """Start collecting decode statistics, see stats.
+
+    :param slow_threshold: Log a warning for from_dict calls that take at least this many seconds.
+    """
+    STATS.enable(slow_threshold)
+
+
+def disable_stats() -> None:
+    """Stop collecting decode statistics. Collected statistics are kept until reset_stats is called."""
+    STATS.disable()
+
+
+def reset_stats() -> None:
+    """Forget all collected decode statistics"""
+    STATS.reset()
+
+
+def stats() -> Dict[str, Any]:
+    """Decode statistics collected since enable_stats or the last reset_stats.
+
+    "classes" maps the name of every constructed class to the count, total, mean, p50, p90, p99 and max of the
+    seconds it took to construct one object, including its sub-structures. "objects_per_call" has the same keys
+    for the number of objects constructed per from_dict call.
+    """
+    return STATS.summary()
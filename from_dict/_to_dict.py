@@ -0,0 +1,284 @@
+import datetime
+import decimal
+import functools
+import operator
+import uuid
+from dataclasses import is_dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Literal, Optional, Tuple
+from typing import Type, get_args, get_origin
+
+from ._class_cache import class_cache
+from ._from_dict import NamespaceTypes, get_argument_keys, get_constructor_type_hints
+from ._from_dict import get_field_validations, is_attr
+from ._typing import is_union, unwrap_type_alias
+
+# Values of these types are immutable and are returned as they are.
+_LEAF_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+_Encoder = Optional[Callable[[Any], Any]]
+
+_isoformat = operator.methodcaller("isoformat")
+
+# Dict keys from_dict converts from str, written back as the str it reads them from
+_KEY_TO_STR: Dict[Any, Callable[[Any], str]] = {
+    int: str,
+    float: str,
+    bool: lambda b: "true" if b else "false",
+    decimal.Decimal: str,
+    datetime.date: _isoformat,
+    datetime.datetime: _isoformat,
+    datetime.time: _isoformat,
+    uuid.UUID: str,
+}
+
+
+def _is_leaf_type(t: Any) -> bool:
+    """Is every value agreeing with type hint t an immutable leaf"""
+    t = unwrap_type_alias(t)
+    if t in _LEAF_TYPES:
+        return True
+    if isinstance(t, type) and issubclass(t, Enum):
+        return True
+    origin = get_origin(t)
+    if origin is Literal:
+        return True
+    if is_union(origin):
+        return all(_is_leaf_type(a) for a in get_args(t))
+    return False
+
+
+def _encode_value(value: Any, ns_types: NamespaceTypes) -> Any:
+    """Encode a value whose type is only known at run-time"""
+    value_type = type(value)
+    if value_type in _LEAF_TYPES:
+        return value
+
+    if value_type is list:
+        return [_encode_value(v, ns_types) for v in value]
+    if value_type is dict:
+        return {k: _encode_value(v, ns_types) for k, v in value.items()}
+
+    serializer = _get_serializer(value_type, ns_types)
+    if serializer is not None:
+        return serializer(value)
+
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(v, ns_types) for v in value]
+    if isinstance(value, dict):
+        return {k: _encode_value(v, ns_types) for k, v in value.items()}
+    return value
+
+
+def _compile_key_encoder(t: Any) -> _Encoder:
+    """Choose an encoder for the keys of Dict[t, V], None if they are kept as they are"""
+    t = unwrap_type_alias(t)
+    try:
+        to_str = _KEY_TO_STR.get(t)
+    except TypeError:  # Unhashable type hints
+        return None
+    if to_str is None and isinstance(t, type) and issubclass(t, Enum):
+
+        def to_str(k):
+            return str(k.value)
+
+    if to_str is None:
+        return None
+
+    key_type = t
+
+    def encode_key(k):
+        # Keys that are no K, e.g. str keys given to the constructor, are kept
+        return to_str(k) if isinstance(k, key_type) else k
+
+    return encode_key
+
+
+def _reverting(encoder: _Encoder, revert: Callable[[Any], Any]) -> _Encoder:
+    """Encoder writing the input a Convert was given, from the encoded value of the field"""
+    if encoder is None:
+        return revert
+
+    def encode_and_revert(v):
+        return revert(encoder(v))
+
+    return encode_and_revert
+
+
+def _compile_encoder(t: Any, ns_types: NamespaceTypes) -> _Encoder:
+    """Choose an encoder for values of type hint t.
+
+    None is returned if values of this type can be used as they are.
+    The hints are trusted the same way from_dict trusts them; if the value does
+    not have the expected container type, we fall back to run-time dispatch.
+    """
+    if _is_leaf_type(t):
+        return None
+
+    encode_value = functools.partial(_encode_value, ns_types=ns_types)
+    t = unwrap_type_alias(t)
+    origin = get_origin(t)
+    type_args = get_args(t)
+    if origin is list and type_args:
+        element_encoder = _compile_encoder(type_args[0], ns_types)
+        if element_encoder is None:
+
+            def encode_list(v):
+                return list(v) if type(v) is list else encode_value(v)
+
+        else:
+
+            def encode_list(v):
+                if type(v) is not list:
+                    return encode_value(v)
+                return [element_encoder(x) for x in v]
+
+        return encode_list
+
+    if origin is dict and type_args:
+        key_encoder = _compile_key_encoder(type_args[0])
+        value_encoder = _compile_encoder(type_args[1], ns_types)
+        if key_encoder is not None:
+
+            def encode_dict(v):
+                if type(v) is not dict:
+                    return encode_value(v)
+                if value_encoder is None:
+                    return {key_encoder(k): x for k, x in v.items()}
+                return {key_encoder(k): value_encoder(x) for k, x in v.items()}
+
+        elif value_encoder is None:
+
+            def encode_dict(v):
+                return dict(v) if type(v) is dict else encode_value(v)
+
+        else:
+
+            def encode_dict(v):
+                if type(v) is not dict:
+                    return encode_value(v)
+                return {k: value_encoder(x) for k, x in v.items()}
+
+        return encode_dict
+
+    if is_union(origin) and len(type_args) == 2 and type(None) in type_args:
+        # Optional[Dict[K, V]] and Optional[List[...]]; Optional structures are dispatched below
+        not_none = type_args[0] if type_args[1] is type(None) else type_args[1]
+        if get_origin(unwrap_type_alias(not_none)) in (list, dict):
+            encode_not_none = _compile_encoder(not_none, ns_types)
+
+            def encode_optional(v):
+                return None if v is None else encode_not_none(v)
+
+            return encode_optional
+
+    # Structures, unions of structures, Any, etc. are dispatched on the
+    # run-time type of the value. This also keeps self-referencing classes
+    # from being compiled recursively.
+    return encode_value
+
+
+@class_cache(100)
+def _get_serializer(
+    cls: Type, ns_types: NamespaceTypes
+) -> Optional[Callable[[Any], dict]]:
+    """Build a function that turns an instance of cls into a dict.
+
+    None is returned if cls is not a structure from_dict could construct.
+    """
+    if cls in _LEAF_TYPES or issubclass(cls, Enum):
+        return None
+
+    try:
+        hints = get_constructor_type_hints(cls, ns_types)
+    except (NameError, TypeError):
+        return None
+    if not hints:
+        return None
+
+    keys = get_argument_keys(cls, ns_types)
+    encoders = {name: _compile_encoder(hint, ns_types) for name, hint in hints.items()}
+    for name, validation in get_field_validations(cls, ns_types).items():
+        if validation.revert is not None:
+            encoders[name] = _reverting(encoders[name], validation.revert)
+    fields: Tuple[Tuple[str, str, _Encoder], ...] = tuple(
+        (name, keys[name], encoders[name]) for name in hints
+    )
+
+    if is_dataclass(cls) or is_attr(cls) or hasattr(cls, "_fields"):
+        # Every constructor argument is stored as an attribute of the same name
+        def serialize(obj):
+            result = {}
+            for name, key, encoder in fields:
+                value = getattr(obj, name)
+                result[key] = value if encoder is None else encoder(value)
+            return result
+
+    else:
+        # Normal classes might not keep their constructor arguments around
+        missing = object()
+
+        def serialize(obj):
+            result = {}
+            for name, key, encoder in fields:
+                value = getattr(obj, name, missing)
+                if value is missing:
+                    continue
+                result[key] = value if encoder is None else encoder(value)
+            return result
+
+    return serialize
+
+
+def _serializer_for(cls: Type, ns_types: NamespaceTypes) -> Callable[[Any], dict]:
+    serializer = _get_serializer(cls, ns_types)
+    if serializer is None:
+        raise TypeError(f"Given class {cls} is not supported by to_dict")
+    return serializer
+
+
+def to_dict(
+    obj: Any,
+    fd_global_ns: Optional[dict] = None,
+    fd_local_ns: Optional[dict] = None,
+) -> Dict[str, Any]:
+    """Turn an object into a dict that from_dict can turn back into the object.
+
+    The constructor type hints of the object's class are used to build a serializer once per class. Nested
+    structures, lists and dicts are converted recursively; immutable values like str, int or enums are not copied.
+
+    Arguments are written under their key in the input, so an Alias or the naming policy of the class is applied.
+    Keys of Dict[K, V] arguments that from_dict converts from str, like int, UUID, date or Enum keys, are written as
+    str, e.g. str(uuid), date.isoformat() or str(enum.value). Fields with Convert markers are written with their
+    inverse, Convert(function, inverse); without an inverse the value is written as it was after the conversion,
+    which from_dict would convert again.
+
+    :param obj: Structure to be converted into a dictionary.
+    :param fd_global_ns: global namespace to help with handling of forward references encoded as string literals
+    :param fd_local_ns: local namespace to help with handling of forward references encoded as string literals
+    :return: Dictionary with one key per constructor argument of the object's class, named like from_dict expects it.
+    """
+    ns_types = NamespaceTypes(fd_global_ns, fd_local_ns)
+    return _serializer_for(type(obj), ns_types)(obj)
+
+
+def to_dict_many(
+    objs: Iterable[Any],
+    fd_global_ns: Optional[dict] = None,
+    fd_local_ns: Optional[dict] = None,
+) -> List[Dict[str, Any]]:
+    """Turn every object of an iterable into a dict, see to_dict.
+
+    The serializer is only looked up again when the class changes between two consecutive objects.
+    """
+    ns_types = NamespaceTypes(fd_global_ns, fd_local_ns)
+    result = []
+    last_cls = None
+    serializer = None
+    for obj in objs:
+        cls = type(obj)
+        if cls is not last_cls:
+            serializer = _serializer_for(cls, ns_types)
+            last_cls = cls
+        result.append(serializer(obj))
+    return result
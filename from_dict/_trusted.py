@@ -0,0 +1,149 @@
+import dataclasses
+import weakref
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, get_origin
+
+from ._class_cache import class_cache
+
+TrustedConstructor = Callable[[Dict[str, Any]], Any]
+# Attribute name, constructor argument name (None if it is no argument), default and default factory
+Field = Tuple[str, Optional[str], Any, Any]
+
+_MISSING = object()
+_ATTRS_HASH_CACHE = "_attrs_cached_hash"
+
+
+def _missing_arguments(cls: Type, names: List[str]) -> TypeError:
+    listed = ", ".join(repr(n) for n in names)
+    return TypeError(f"{cls.__name__} is missing required arguments: {listed}")
+
+
+def _fill_defaults(
+    cls: Type,
+    kwargs: Dict[str, Any],
+    fields: Tuple[Field, ...],
+) -> Dict[str, Any]:
+    """Attribute values in field order: the given arguments, or else their defaults"""
+    values = {}
+    missing = []
+    for attribute, argument, default, factory in fields:
+        value = _MISSING if argument is None else kwargs.get(argument, _MISSING)
+        if value is _MISSING:
+            if default is not _MISSING:
+                value = default
+            elif factory is not _MISSING:
+                value = factory()
+            elif argument is None:
+                continue  # init=False field without default, __init__ leaves it unset
+            else:
+                missing.append(argument)
+                continue
+        values[attribute] = value
+    if missing:
+        raise _missing_arguments(cls, missing)
+    return values
+
+
+def _store(cls: Type, fields: Tuple[Field, ...]) -> TrustedConstructor:
+    """Allocate with object.__new__ and set the attributes directly, bypassing __setattr__ of frozen classes"""
+    new = object.__new__
+    set_attribute = object.__setattr__
+    has_dict = "__dict__" in dir(cls)
+    # Constructors are cached by their class, a strong reference would keep it alive
+    cls_ref = weakref.ref(cls)
+
+    if has_dict:
+
+        def construct(kwargs):
+            cls = cls_ref()
+            obj = new(cls)
+            set_attribute(obj, "__dict__", _fill_defaults(cls, kwargs, fields))
+            return obj
+
+    else:
+
+        def construct(kwargs):
+            cls = cls_ref()
+            obj = new(cls)
+            for k, v in _fill_defaults(cls, kwargs, fields).items():
+                set_attribute(obj, k, v)
+            return obj
+
+    return construct
+
+
+def _dataclass_constructor(cls: Type) -> Optional[TrustedConstructor]:
+    fields: List[Field] = []
+    for f in dataclasses.fields(cls):
+        fields.append(
+            (
+                f.name,
+                f.name if f.init else None,
+                _MISSING if f.default is dataclasses.MISSING else f.default,
+                (
+                    _MISSING
+                    if f.default_factory is dataclasses.MISSING  # type: ignore
+                    else f.default_factory
+                ),  # type: ignore
+            )
+        )
+    # InitVars are only passed on to __post_init__, which is not called
+    has_init_vars = any(
+        isinstance(v, dataclasses.InitVar) or v is dataclasses.InitVar
+        for v in getattr(cls, "__annotations__", {}).values()
+    )
+    if has_init_vars:
+        return None
+    return _store(cls, tuple(fields))
+
+
+def _attrs_constructor(cls: Type) -> Optional[TrustedConstructor]:
+    import attr
+
+    fields: List[Field] = []
+    for a in cls.__attrs_attrs__:
+        default, factory = a.default, _MISSING
+        if default is attr.NOTHING:
+            default = _MISSING
+        elif isinstance(default, attr.Factory):  # type: ignore
+            if default.takes_self:
+                return None
+            default, factory = _MISSING, default.factory
+        argument = getattr(a, "alias", None) or a.name.lstrip("_")
+        fields.append((a.name, argument if a.init else None, default, factory))
+    # With cache_hash=True, __init__ clears the cached hash, which __hash__ reads
+    hash_code = getattr(cls.__hash__, "__code__", None)
+    if hash_code is not None and _ATTRS_HASH_CACHE in hash_code.co_names:
+        fields.append((_ATTRS_HASH_CACHE, None, None, _MISSING))
+    return _store(cls, tuple(fields))
+
+
+def _named_tuple_constructor(cls: Type) -> TrustedConstructor:
+    names = cls._fields
+    defaults = cls._field_defaults
+    new = tuple.__new__
+    cls_ref = weakref.ref(cls)
+
+    def construct(kwargs):
+        cls = cls_ref()
+        try:
+            return new(cls, [kwargs[n] if n in kwargs else defaults[n] for n in names])
+        except KeyError:
+            missing = [n for n in names if n not in kwargs and n not in defaults]
+            raise _missing_arguments(cls, missing) from None
+
+    return construct
+
+
+@class_cache(100)
+def get_trusted_constructor(cls: Any) -> Optional[TrustedConstructor]:
+    """Constructor of cls that bypasses __init__, or None if cls has to be constructed by calling it"""
+    cls = get_origin(cls) or cls
+    if not isinstance(cls, type):
+        return None
+    if dataclasses.is_dataclass(cls):
+        return _dataclass_constructor(cls)
+    if hasattr(cls, "__attrs_attrs__"):
+        return _attrs_constructor(cls)
+    if issubclass(cls, tuple) and hasattr(cls, "_fields"):
+        return _named_tuple_constructor(cls)
+    return None
@@ -0,0 +1,106 @@
+"""Helpers for type hints that differ between Python versions"""
+
+import sys
+import types
+import typing
+from typing import Annotated, Any, Mapping, Tuple, Type, Union, get_args, get_origin
+
+from ._class_cache import class_cache
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+
+    # Union[A, B] and A | B have different origins
+    UNION_ORIGINS: Tuple[Any, ...] = (Union, UnionType)
+else:
+    UnionType = None
+    UNION_ORIGINS = (Union,)
+
+if sys.version_info >= (3, 12):
+    from typing import TypeAliasType
+else:
+    TypeAliasType = None
+
+
+def is_union(origin: Any) -> bool:
+    """Is origin the origin of Union[...] or A | B"""
+    return origin is Union or UnionType is not None and origin is UnionType
+
+
+def is_type_alias(t: Any) -> bool:
+    """Is t a `type X = ...` alias (Python 3.12+), or a parametrized one"""
+    if TypeAliasType is None:
+        return False
+    return isinstance(t, TypeAliasType) or isinstance(get_origin(t), TypeAliasType)
+
+
+def unwrap_type_alias(t: Any) -> Any:
+    """Replace `type X = ...` aliases by the type they stand for.
+
+    Only the outermost alias is replaced, so recursive aliases can be unwrapped one level at a time.
+    """
+    if TypeAliasType is None:
+        return t
+    while True:
+        if isinstance(t, TypeAliasType):
+            t = t.__value__
+            continue
+        origin = get_origin(t)
+        if isinstance(origin, TypeAliasType):
+            swaps = tuple(zip(origin.__type_params__, get_args(t)))
+            t = specialize(origin.__value__, swaps)
+            continue
+        return t
+
+
+def strip_annotated(t: Any) -> Any:
+    """Replace Annotated[T, ...] by T, also in type arguments, like typing.get_type_hints does without include_extras"""
+    if get_origin(t) is Annotated:
+        return strip_annotated(t.__origin__)
+    args = get_args(t)
+    if not args:
+        return t
+    stripped = tuple(strip_annotated(a) for a in args)
+    if all(s is a for s, a in zip(stripped, args)):
+        return t
+
+    origin = get_origin(t)
+    if is_union(origin):
+        return Union[stripped]  # type: ignore
+    if isinstance(t, types.GenericAlias):
+        return types.GenericAlias(origin, stripped)
+    return t.copy_with(stripped)
+
+
+@class_cache(1000)
+def specialize(generic: Type, swaps: Tuple[Tuple[Any, Any], ...]) -> Type:
+    """Swap out the type variables of a generic type definition like List[T] or Dict[str, T].
+
+    Specializations are cached, so classes with many instantiations like Page[int], Page[str], ... only build
+    every specialized type once.
+    """
+    swaps_map = dict(swaps)
+    if generic in swaps_map:
+        return swaps_map[generic]
+    return _specialize(generic, swaps_map)
+
+
+def _specialize(generic: Type, swaps: Mapping[Any, Any]) -> Type:
+    args = list(get_args(generic))
+    if not args:
+        return generic
+    for i, arg in enumerate(args):
+        if arg in swaps:
+            args[i] = swaps[arg]
+        elif get_args(arg):
+            args[i] = _specialize(arg, swaps)
+
+    origin = get_origin(generic)
+    if is_union(origin):
+        return Union[tuple(args)]  # type: ignore
+    if sys.version_info < (3, 9):
+        if origin is list:
+            origin = typing.List
+        elif origin is dict:
+            origin = typing.Dict
+    return origin[tuple(args)]  # type: ignore
@@ -0,0 +1,363 @@
+"""Benchmarks for from_dict.
+
+Run with `python -m from_dict.bench`. Every scenario is timed for from_dict and for a hand-written constructor
+baseline that builds the same objects. Results can be saved as JSON and compared with an earlier run to find
+regressions:
+
+    python -m from_dict.bench --output before.json
+    python -m from_dict.bench --compare before.json
+"""
+
+import argparse
+import csv
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar, Union
+
+from ._from_csv import from_csv
+from ._from_dict import from_dict
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Wide:
+    f00: int
+    f01: str
+    f02: float
+    f03: bool
+    f04: Optional[str]
+    f05: int
+    f06: str
+    f07: float
+    f08: bool
+    f09: Optional[str]
+    f10: int
+    f11: str
+    f12: float
+    f13: bool
+    f14: Optional[str]
+    f15: int
+    f16: str
+    f17: float
+    f18: bool
+    f19: Optional[str]
+
+
+@dataclass(frozen=True)
+class Node:
+    value: int
+    child: Optional["Node"]
+
+
+@dataclass(frozen=True)
+class Item:
+    name: str
+    count: int
+    price: float
+
+
+@dataclass(frozen=True)
+class ItemList:
+    items: List[Item]
+
+
+@dataclass(frozen=True)
+class ItemDict:
+    items: Dict[str, Item]
+
+
+@dataclass(frozen=True)
+class Tag:
+    label: str
+
+
+@dataclass(frozen=True)
+class UnionHolder:
+    values: List[Union[Tag, Item]]
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: List[T]
+    total: int
+
+
+@dataclass(frozen=True)
+class ForwardRefs:
+    first: "Item"
+    rest: List["Item"]
+
+
+@dataclass
+class Scenario:
+    name: str
+    run: Callable[[], Any]
+    objects_per_call: int
+
+
+def _wide_data() -> dict:
+    data: Dict[str, Any] = {}
+    for i in range(0, 20, 5):
+        data[f"f{i:02}"] = i
+        data[f"f{i + 1:02}"] = str(i)
+        data[f"f{i + 2:02}"] = i / 3
+        data[f"f{i + 3:02}"] = i % 2 == 0
+        data[f"f{i + 4:02}"] = None
+    return data
+
+
+def _deep_data(depth: int) -> dict:
+    data: Optional[dict] = None
+    for i in range(depth):
+        data = {"value": i, "child": data}
+    return data  # type: ignore
+
+
+def _items_data(n: int) -> List[dict]:
+    return [{"name": f"item-{i}", "count": i, "price": i * 1.5} for i in range(n)]
+
+
+def _items_csv(n: int) -> str:
+    lines = ["name,count,price"]
+    lines += [f"item-{i},{i},{i * 1.5}" for i in range(n)]
+    return "\n".join(lines) + "\n"
+
+
+def _build_csv(text: str) -> List[Item]:
+    reader = csv.reader(io.StringIO(text))
+    next(reader)
+    return [Item(name, int(count), float(price)) for name, count, price in reader]
+
+
+def _build_deep(data: Optional[dict]) -> Optional[Node]:
+    if data is None:
+        return None
+    return Node(data["value"], _build_deep(data["child"]))
+
+
+def _build_union(v: dict) -> Union[Tag, Item]:
+    return Tag(**v) if "label" in v else Item(**v)
+
+
+def scenarios() -> List[Scenario]:
+    """All benchmark scenarios, each with a hand-written baseline"""
+    wide = _wide_data()
+    deep = _deep_data(50)
+    items = {"items": _items_data(1000)}
+    item_dict = {"items": {d["name"]: d for d in _items_data(1000)}}
+    union = {
+        "values": [{"label": f"t{i}"} for i in range(500)] + _items_data(500),
+    }
+    page = {"items": _items_data(100), "total": 100}
+    forward = {"first": _items_data(1)[0], "rest": _items_data(100)}
+    items_csv = _items_csv(1000)
+
+    result = []
+    for check_types in (False, True):
+        suffix = "-checked" if check_types else ""
+        result += [
+            Scenario(
+                "wide" + suffix,
+                lambda c=check_types: from_dict(Wide, wide, fd_check_types=c),
+                1,
+            ),
+            Scenario(
+                "deep" + suffix,
+                lambda c=check_types: from_dict(Node, deep, fd_check_types=c),
+                50,
+            ),
+            Scenario(
+                "list" + suffix,
+                lambda c=check_types: from_dict(ItemList, items, fd_check_types=c),
+                1001,
+            ),
+            Scenario(
+                "dict" + suffix,
+                lambda c=check_types: from_dict(ItemDict, item_dict, fd_check_types=c),
+                1001,
+            ),
+            Scenario(
+                "union" + suffix,
+                lambda c=check_types: from_dict(UnionHolder, union, fd_check_types=c),
+                1001,
+            ),
+            Scenario(
+                "generic" + suffix,
+                lambda c=check_types: from_dict(Page[Item], page, fd_check_types=c),
+                101,
+            ),
+            Scenario(
+                "forward-ref" + suffix,
+                lambda c=check_types: from_dict(ForwardRefs, forward, fd_check_types=c),
+                102,
+            ),
+        ]
+
+    result += [
+        Scenario("deep-trusted", lambda: from_dict(Node, deep, fd_trusted=True), 50),
+        Scenario(
+            "list-trusted", lambda: from_dict(ItemList, items, fd_trusted=True), 1001
+        ),
+        Scenario("csv", lambda: list(from_csv(Item, io.StringIO(items_csv))), 1000),
+        Scenario("wide-baseline", lambda: Wide(**wide), 1),
+        Scenario("deep-baseline", lambda: _build_deep(deep), 50),
+        Scenario(
+            "list-baseline",
+            lambda: ItemList([Item(**d) for d in items["items"]]),
+            1001,
+        ),
+        Scenario(
+            "dict-baseline",
+            lambda: ItemDict({k: Item(**d) for k, d in item_dict["items"].items()}),
+            1001,
+        ),
+        Scenario(
+            "union-baseline",
+            lambda: UnionHolder([_build_union(v) for v in union["values"]]),
+            1001,
+        ),
+        Scenario(
+            "generic-baseline",
+            lambda: Page([Item(**d) for d in page["items"]], page["total"]),
+            101,
+        ),
+        Scenario(
+            "forward-ref-baseline",
+            lambda: ForwardRefs(
+                Item(**forward["first"]), [Item(**d) for d in forward["rest"]]
+            ),
+            102,
+        ),
+        Scenario("csv-baseline", lambda: _build_csv(items_csv), 1000),
+    ]
+    return result
+
+
+def _calibrate(run: Callable[[], Any], min_time: float) -> int:
+    """Number of calls needed for one sample to take at least min_time seconds"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        if time.perf_counter() - start >= min_time:
+            return number
+        number *= 2
+
+
+def measure(scenario: Scenario, repeat: int, min_time: float) -> dict:
+    """Time a scenario; returns calls and objects per second with statistics"""
+    run = scenario.run
+    run()  # Warm up caches
+    number = _calibrate(run, min_time)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        samples.append(number / (time.perf_counter() - start))
+
+    return {
+        "calls_per_sec": statistics.median(samples),
+        "calls_per_sec_mean": statistics.mean(samples),
+        "calls_per_sec_stdev": statistics.stdev(samples) if repeat > 1 else 0.0,
+        "calls_per_sec_min": min(samples),
+        "calls_per_sec_max": max(samples),
+        "objects_per_sec": statistics.median(samples) * scenario.objects_per_call,
+        "calls_per_sample": number,
+        "repeat": repeat,
+    }
+
+
+def run_benchmarks(
+    names: Optional[List[str]] = None, repeat: int = 5, min_time: float = 0.2
+) -> dict:
+    results = {}
+    for scenario in scenarios():
+        if names and not any(scenario.name.startswith(n) for n in names):
+            continue
+        results[scenario.name] = measure(scenario, repeat, min_time)
+    return {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def compare(old: dict, new: dict, threshold: float) -> List[str]:
+    """Names of scenarios that got slower by more than threshold (0.1 = 10%)"""
+    regressions = []
+    for name, new_result in new["results"].items():
+        old_result = old["results"].get(name)
+        if old_result is None:
+            continue
+        if new_result["calls_per_sec"] < old_result["calls_per_sec"] * (1 - threshold):
+            regressions.append(name)
+    return regressions
+
+
+def format_results(results: dict, old: Optional[dict] = None) -> str:
+    lines = [
+        f"{'scenario':<26}{'calls/s':>12}{'stdev':>10}{'objects/s':>14}{'change':>9}"
+    ]
+    for name, r in results["results"].items():
+        change = ""
+        if old is not None and name in old["results"]:
+            ratio = r["calls_per_sec"] / old["results"][name]["calls_per_sec"]
+            change = f"{ratio - 1:+.1%}"
+        lines.append(
+            f"{name:<26}{r['calls_per_sec']:>12.1f}{r['calls_per_sec_stdev']:>10.1f}"
+            f"{r['objects_per_sec']:>14.0f}{change:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m from_dict.bench", description="Benchmark from_dict."
+    )
+    parser.add_argument(
+        "scenarios", nargs="*", help="Only run scenarios starting with these names"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per scenario")
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="Minimum seconds per sample"
+    )
+    parser.add_argument("--output", help="Save results as JSON to this file")
+    parser.add_argument("--compare", help="Compare with results saved by --output")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="Slowdown that counts as regression when comparing (default 0.1 = 10%%)",
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.scenarios, args.repeat, args.min_time)
+
+    old = None
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)
+    print(format_results(results, old))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if old is not None:
+        regressions = compare(old, results, args.threshold)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Annotated as A
+from typing import Optional
+
+from from_dict import Alias, Intern, InternTable, Max, Min, Regex
+
+# . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . . .
+# Classes whose Annotated hints are only found once they are resolved
+
+PositiveInt = A[int, Min(0)]
+Code = A[str, Regex(r"^[A-Z]+$")]
+CODES = InternTable()
+
+
+@dataclass
+class Measurement:
+    value: PositiveInt
+    percent: A[int, Min(0), Max(100)]
+    code: Optional[Code] = None
+    unit: A[str, Alias("unitName"), Intern(CODES)] = "m"
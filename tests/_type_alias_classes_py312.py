@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class Leaf:
+    name: str
+
+
+type LeafOrName = Leaf | str
+type Pair[T] = dict[str, T]
+type Json = dict[str, Json] | list[Json] | str | int | None
+
+
+@dataclass
+class ClassWithAliases:
+    leaf: LeafOrName
+    leaves: list[LeafOrName]
+    pair: Pair[Leaf]
+    json: Json
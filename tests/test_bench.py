@@ -0,0 +1,33 @@
+import json
+
+from from_dict import bench
+
+
+def test_scenarios_build_same_objects_as_baseline():
+    runs = {s.name: s.run for s in bench.scenarios()}
+    for name, run in runs.items():
+        if name.endswith("-baseline"):
+            prefix = name[: -len("-baseline")]
+            assert runs[prefix]() == run(), name
+            for variant in ("-checked", "-trusted"):
+                if prefix + variant in runs:
+                    assert runs[prefix + variant]() == run(), name + variant
+
+
+def test_run_save_and_compare(tmp_path, capsys):
+    output = tmp_path / "results.json"
+    args = ["wide", "--repeat", "2", "--min-time", "0.001"]
+    assert bench.main(args + ["--output", str(output)]) == 0
+
+    results = json.loads(output.read_text())
+    assert set(results["results"]) == {"wide", "wide-checked", "wide-baseline"}
+    assert results["results"]["wide"]["objects_per_sec"] > 0
+
+    assert bench.main(args + ["--compare", str(output), "--threshold", "1"]) == 0
+    assert "wide-baseline" in capsys.readouterr().out
+
+
+def test_compare_finds_regressions():
+    old = {"results": {"a": {"calls_per_sec": 100.0}, "b": {"calls_per_sec": 100.0}}}
+    new = {"results": {"a": {"calls_per_sec": 95.0}, "b": {"calls_per_sec": 80.0}}}
+    assert bench.compare(old, new, threshold=0.1) == ["b"]
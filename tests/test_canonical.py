@@ -0,0 +1,216 @@
+from dataclasses import dataclass
+from typing import Generic, List, NamedTuple, Optional, TypeVar
+
+import attr
+import pytest
+
+from from_dict import CanonicalTable, DecodeLimits, FromDictTypeError, from_dict
+from from_dict import _canonical
+
+
+@dataclass(frozen=True)
+class Money:
+    currency: str
+    region: str
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class AttrMoney:
+    currency: str
+    region: str
+
+
+class TupleMoney(NamedTuple):
+    currency: str
+    region: str
+
+
+@dataclass
+class MutableMoney:
+    currency: str
+    region: str
+
+
+@dataclass(frozen=True)
+class LineItem:
+    amount: int
+    money: Money
+    attr_money: AttrMoney
+    tuple_money: TupleMoney
+    mutable_money: MutableMoney
+
+
+@dataclass(frozen=True)
+class Order:
+    items: List[LineItem]
+
+
+def make_order(n: int) -> dict:
+    money = {"currency": "CHF", "region": "EU"}
+    return {
+        "items": [
+            {
+                "amount": i % 2,
+                "money": dict(money),
+                "attr_money": dict(money),
+                "tuple_money": dict(money),
+                "mutable_money": dict(money),
+            }
+            for i in range(n)
+        ]
+    }
+
+
+def test_frozen_structures_are_shared():
+    order = from_dict(Order, make_order(4), fd_canonical=True)
+    first, second = order.items[0], order.items[1]
+
+    assert first.money is second.money
+    assert first.attr_money is second.attr_money
+    assert first.tuple_money is second.tuple_money
+    assert first.mutable_money is not second.mutable_money
+
+    # Items are frozen too, equal items are shared as well
+    assert order.items[0] is order.items[2]
+    assert order.items[0] is not order.items[1]
+
+
+def test_off_by_default():
+    order = from_dict(Order, make_order(2))
+    assert order.items[0].money is not order.items[1].money
+    assert order.items[0].money == order.items[1].money
+
+
+def test_table_shared_across_calls():
+    table = CanonicalTable()
+    order_1 = from_dict(Order, make_order(1), fd_canonical=table)
+    order_2 = from_dict(Order, make_order(1), fd_canonical=table)
+    assert order_1.items[0].money is order_2.items[0].money
+
+    table.clear()
+    order_3 = from_dict(Order, make_order(1), fd_canonical=table)
+    assert order_1.items[0].money is not order_3.items[0].money
+
+
+def test_types_of_values_are_respected():
+    @dataclass(frozen=True)
+    class Value:
+        v: object
+
+    @dataclass(frozen=True)
+    class Values:
+        values: List[Value]
+
+    values = from_dict(
+        Values, {"values": [{"v": 1}, {"v": True}, {"v": 1.0}]}, fd_canonical=True
+    )
+    assert [type(v.v) for v in values.values] == [int, bool, float]
+
+
+def test_unhashable_values_are_not_shared():
+    @dataclass(frozen=True)
+    class Holder:
+        data: object
+
+    @dataclass(frozen=True)
+    class Holders:
+        holders: List[Holder]
+
+    holders = from_dict(
+        Holders, {"holders": [{"data": {1, 2}}, {"data": {1, 2}}]}, fd_canonical=True
+    )
+    assert holders.holders[0] == holders.holders[1]
+    assert holders.holders[0] is not holders.holders[1]
+
+
+def test_table_is_bounded():
+    table = CanonicalTable(max_size=1)
+    from_dict(Order, make_order(2), fd_canonical=table)
+    assert len(table) == 1
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: List[T]
+    number: int
+
+
+@dataclass(frozen=True)
+class Book:
+    first: Page[int]
+    second: Page[int]
+
+
+def test_generic_classes():
+    page = from_dict(Page[int], {"items": [1], "number": 1}, fd_canonical=True)
+    assert page == Page([1], 1)
+
+    page_data = {"items": [1, 2], "number": 3}
+    book = from_dict(
+        Book, {"first": page_data, "second": dict(page_data)}, fd_canonical=True
+    )
+    assert book.first == Page([1, 2], 3)
+    assert book.first is book.second
+
+
+@dataclass(frozen=True)
+class Price:
+    amount: int
+
+
+@dataclass(frozen=True)
+class Line:
+    price: Price
+
+
+def test_table_is_shared_only_with_equal_options():
+    table = CanonicalTable()
+    unchecked = from_dict(Line, {"price": {"amount": "1"}}, fd_canonical=table)
+    assert unchecked.price.amount == "1"
+
+    with pytest.raises(FromDictTypeError):
+        from_dict(
+            Line, {"price": {"amount": "1"}}, fd_canonical=table, fd_check_types=True
+        )
+    coerced = from_dict(
+        Line, {"price": {"amount": "1"}}, fd_canonical=table, fd_coerce=True
+    )
+    assert coerced.price.amount == 1
+
+    again = from_dict(Line, {"price": {"amount": "1"}}, fd_canonical=table)
+    assert again is unchecked
+
+
+def test_no_sharing_with_max_depth():
+    limits = DecodeLimits(max_depth=2)
+    table = CanonicalTable()
+    from_dict(Line, {"price": {"amount": 1}}, fd_canonical=table, fd_limits=limits)
+    assert len(table) == 0
+
+
+@dataclass(frozen=True)
+class Chain:
+    value: int
+    next: Optional["Chain"] = None
+
+
+def test_input_is_frozen_once(monkeypatch):
+    calls = []
+    freeze = _canonical.freeze
+
+    def counting_freeze(*args):
+        calls.append(1)
+        return freeze(*args)
+
+    monkeypatch.setattr(_canonical, "freeze", counting_freeze)
+    depth = 100
+    data = None
+    for i in range(depth):
+        data = {"value": i, "next": data}
+    chain = from_dict(Chain, data, fd_canonical=True)
+    assert chain.next.value == depth - 2
+    # Every dict and leaf once, and a lookup for every nested object
+    assert len(calls) < 4 * depth
@@ -0,0 +1,96 @@
+import datetime
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar, Union
+
+import pytest
+from from_dict import check, compile_checker
+from from_dict._from_dict import FromDictTypeError, type_check
+
+T = TypeVar("T")
+
+
+@dataclass
+class Data:
+    value: int
+
+
+@dataclass
+class GenericData(Generic[T]):
+    value: T
+
+
+TYPES = [
+    int,
+    str,
+    Any,
+    Optional[Any],
+    Optional[int],
+    Union[int, str],
+    Union[List[int], str],
+    Union[Data, Dict[str, int], None],
+    List[int],
+    List[Any],
+    List[Optional[str]],
+    List[List[int]],
+    Dict[str, int],
+    Dict[str, List[Data]],
+    Dict[int, Any],
+    Literal["a", "b"],
+    Literal[1, 2, 3],
+    Optional[Literal["x"]],
+    Data,
+    GenericData[int],
+    List["Data"],
+    list[int],
+    dict[str, Data],
+    list,
+    dict,
+]
+
+VALUES = [
+    1,
+    True,
+    1.0,
+    "a",
+    "x",
+    None,
+    [],
+    [1, 2],
+    [1, "2"],
+    [[1], [2]],
+    [None, "s"],
+    {},
+    {"k": 1},
+    {"k": "v"},
+    {1: "v"},
+    {"k": [Data(1)]},
+    Data(1),
+    GenericData(1),
+    datetime.date(2020, 1, 1),
+]
+
+
+def type_check_passes(value, t) -> bool:
+    try:
+        type_check([], value, t)
+        return True
+    except FromDictTypeError:
+        return False
+
+
+@pytest.mark.parametrize("t", TYPES, ids=str)
+def test_agrees_with_type_check(t):
+    for value in VALUES:
+        assert check(value, t) == type_check_passes(value, t), value
+
+
+def test_literal_with_unhashable_values():
+    checker = compile_checker(Literal[1, 2])
+    assert checker(1)
+    assert not checker([1])
+    assert not checker({"a": 1})
+    assert not checker((1, [2]))
+
+
+def test_checkers_are_cached():
+    assert compile_checker(List[int]) is compile_checker(List[int])
@@ -0,0 +1,142 @@
+import gc
+import weakref
+from dataclasses import dataclass, make_dataclass
+from typing import List, Optional
+
+import pytest
+
+from from_dict import from_dict, to_dict
+from from_dict._class_cache import class_cache
+
+
+def _decode_dynamic_classes(count: int, **kwargs) -> List[weakref.ref]:
+    """Create, decode and drop classes like a plugin host; returns weak references to them"""
+    refs = []
+    for i in range(count):
+        child = make_dataclass(f"Child{i}", [("value", int)])
+        node = make_dataclass(
+            f"Node{i}",
+            [
+                ("name", str),
+                ("child", child),
+                # Builtin generics, typing keeps List[child] and Optional[child] in caches of its own
+                ("children", list[child]),
+                ("by_name", dict[str, child]),
+            ],
+        )
+        data = {
+            "name": "n",
+            "child": {"value": 1},
+            "children": [{"value": 2}],
+            "by_name": {"a": {"value": 3}},
+        }
+        obj = from_dict(node, data, **kwargs)
+        to_dict(obj)
+        refs += [weakref.ref(child), weakref.ref(node)]
+        del child, node, obj
+    # Dropping a class drops its cached results, which may free further cycles
+    while gc.collect():
+        pass
+    return refs
+
+
+def _alive(refs: List[weakref.ref]) -> int:
+    return sum(1 for r in refs if r() is not None)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {},
+        {"fd_check_types": True},
+        {"fd_coerce": True},
+        {"fd_trusted": True},
+        {"fd_canonical": True},
+    ],
+)
+def test_dropped_classes_are_collected(options):
+    refs = _decode_dynamic_classes(300, **options)
+    assert _alive(refs) == 0
+
+
+def test_self_referencing_classes_are_bounded():
+    def decode(count: int) -> List[weakref.ref]:
+        refs = []
+        for i in range(count):
+            node = make_dataclass(
+                f"Node{i}", [("value", int), ("next", Optional[f"Node{i}"])]
+            )
+            from_dict(
+                node,
+                {"value": 1, "next": {"value": 2, "next": None}},
+                fd_local_ns={f"Node{i}": node},
+            )
+            refs.append(weakref.ref(node))
+            del node
+        gc.collect()
+        return refs
+
+    # The hints of a self-referencing class refer to it, so they keep it alive until they are dropped from the cache
+    refs = decode(300)
+    first_alive = _alive(refs)
+    refs += decode(300)
+    assert _alive(refs) <= first_alive
+
+
+class _Locked(type):
+    """Metaclass of classes whose attributes can't be set once they are locked"""
+
+    def __setattr__(cls, name, value):
+        if cls.__dict__.get("_locked"):
+            raise AttributeError(f"{cls.__name__} is read-only")
+        super().__setattr__(name, value)
+
+
+@dataclass
+class Point(metaclass=_Locked):
+    x: int
+    y: Optional[int] = None
+
+
+type.__setattr__(Point, "_locked", True)
+
+
+@dataclass
+class Line:
+    points: List[Point]
+
+
+@pytest.mark.parametrize("options", [{}, {"fd_check_types": True, "fd_trusted": True}])
+def test_classes_are_not_changed(options):
+    before = {Point: dict(vars(Point)), Line: dict(vars(Line))}
+    line = from_dict(Line, {"points": [{"x": 1}, {"x": 2, "y": 3}]}, **options)
+    assert line == Line([Point(1), Point(2, 3)])
+    assert to_dict(line) == {"points": [{"x": 1, "y": None}, {"x": 2, "y": 3}]}
+    assert {Point: dict(vars(Point)), Line: dict(vars(Line))} == before
+
+
+def test_results_are_stored_per_class():
+    calls = []
+
+    @class_cache(10)
+    def name_of(cls, suffix):
+        calls.append(cls)
+        return cls.__name__ + suffix
+
+    @dataclass
+    class Base:
+        x: int
+
+    class Sub(Base):
+        pass
+
+    assert name_of(Base, "!") == "Base!"
+    assert name_of(Sub, "!") == "Sub!"
+    assert name_of(Base, "!") == "Base!"
+    assert name_of(None.__class__, "?") == "NoneType?"
+    assert name_of(None.__class__, "?") == "NoneType?"
+    assert calls == [Base, Sub, type(None)]
+
+    name_of.cache_clear()
+    assert name_of(Base, "!") == "Base!"
+    assert calls[-1] is Base
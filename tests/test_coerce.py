@@ -0,0 +1,120 @@
+import datetime
+import decimal
+import enum
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+import pytest
+from from_dict import FromDictTypeError, compile_coercer, from_dict
+from from_dict import from_dict_with_errors
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+@dataclass
+class Filter:
+    limit: int
+    ratio: float
+    active: bool
+    price: decimal.Decimal
+    color: Color
+    since: Optional[datetime.date]
+    ids: List[int]
+    weights: Dict[str, float]
+    name: str = ""
+
+
+@dataclass
+class Query:
+    filter: Filter
+    filters: List[Filter]
+
+
+QUERY_STRINGS = {
+    "limit": "42",
+    "ratio": "0.5",
+    "active": "true",
+    "price": "9.99",
+    "color": "green",
+    "since": "2024-01-31",
+    "ids": "1,2,3",
+    "weights": {"a": "1", "b": 2},
+    "name": "12",
+}
+
+EXPECTED = Filter(
+    42,
+    0.5,
+    True,
+    decimal.Decimal("9.99"),
+    Color.GREEN,
+    datetime.date(2024, 1, 31),
+    [1, 2, 3],
+    {"a": 1.0, "b": 2.0},
+    "12",
+)
+
+
+def test_coerce_strings():
+    assert from_dict(Filter, QUERY_STRINGS, fd_coerce=True, fd_check_types=True) == EXPECTED
+
+
+def test_nested_structures_are_coerced():
+    given = {"filter": QUERY_STRINGS, "filters": [QUERY_STRINGS]}
+    query = from_dict(Query, given, fd_coerce=True, fd_check_types=True)
+    assert query == Query(EXPECTED, [EXPECTED])
+
+
+def test_values_of_the_right_type_are_kept():
+    given = dict(QUERY_STRINGS, ids=[4, "5"], since=None, limit=7, price=1.5, active=0)
+    result = from_dict(Filter, given, fd_coerce=True, fd_check_types=True)
+    assert result.ids == [4, 5]
+    assert result.since is None
+    assert result.limit == 7
+    assert result.price == decimal.Decimal("1.5")
+    assert result.active is False
+
+
+def test_no_coercion_by_default():
+    assert from_dict(Filter, QUERY_STRINGS).limit == "42"
+    with pytest.raises(FromDictTypeError):
+        from_dict(Filter, QUERY_STRINGS, fd_check_types=True)
+
+
+def test_unconvertible_values_are_left_to_type_check():
+    given = dict(QUERY_STRINGS, limit="many", ids="1,x", active="maybe")
+    assert from_dict(Filter, given, fd_coerce=True).limit == "many"
+
+    result = from_dict_with_errors(Filter, given, fd_coerce=True)
+    assert sorted(e.location for e in result.errors) == [["active"], ["ids[1]"], ["limit"]]
+
+
+@pytest.mark.parametrize(
+    "t, value, expected",
+    [
+        (int, "-3", -3),
+        (int, 3.0, 3),
+        (int, 3.5, 3.5),
+        (float, 3, 3.0),
+        (bool, "No", False),
+        (bool, 1, True),
+        (bool, 2, 2),
+        (Optional[int], "4", 4),
+        (List[bool], "", []),
+        (datetime.datetime, "2024-01-31T10:00", datetime.datetime(2024, 1, 31, 10)),
+        (Color, "RED", Color.RED),
+        (decimal.Decimal, "x", "x"),
+    ],
+)
+def test_compile_coercer(t, value, expected):
+    result = compile_coercer(t)(value)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize("t", [str, Filter, Union[int, str], List[str], Dict[str, Filter]])
+def test_nothing_to_coerce(t):
+    assert compile_coercer(t) is None
@@ -0,0 +1,83 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+import pytest
+from from_dict import FromDictResult, FromDictTypeError, from_dict, from_dict_with_errors
+
+
+@dataclass(frozen=True)
+class Item:
+    name: str
+    count: int
+
+
+@dataclass(frozen=True)
+class Batch:
+    id: int
+    items: List[Item]
+    by_name: Dict[str, Item]
+    tags: List[str]
+    note: Optional[str] = None
+
+
+def test_no_errors():
+    result = from_dict_with_errors(Batch, id=1, items=[{"name": "a", "count": 1}], by_name={}, tags=[])
+    assert isinstance(result, FromDictResult)
+    assert result.errors == []
+    assert result.value == Batch(1, [Item("a", 1)], {}, [])
+
+
+def test_all_errors_are_collected():
+    result = from_dict_with_errors(
+        Batch,
+        {
+            "id": "1",
+            "items": [{"name": "a", "count": 1}, {"name": "b", "count": "2"}],
+            "by_name": {"c": {"name": 3, "count": 3}},
+            "tags": ["x", 4],
+            "note": 5,
+        },
+    )
+
+    assert [str(e) for e in result.errors] == [
+        "For \"id\", expected <class 'int'> but found <class 'str'>",
+        "For \"items.count\", expected <class 'int'> but found <class 'str'>",
+        "For \"by_name.name\", expected <class 'str'> but found <class 'int'>",
+        "For \"tags[1]\", expected <class 'str'> but found <class 'int'>",
+        f"For \"note\", expected {Optional[str]} but found <class 'int'>",
+    ]
+    # Offending values are kept
+    assert result.value.id == "1"
+    assert result.value.items[1] == Item("b", "2")
+    assert result.value.tags == ["x", 4]
+
+
+def test_locations_agree_with_raised_errors():
+    data = {"id": 1, "items": [{"name": "b", "count": "2"}], "by_name": {}, "tags": []}
+    with pytest.raises(FromDictTypeError) as e:
+        from_dict(Batch, data, fd_check_types=True)
+
+    result = from_dict_with_errors(Batch, data)
+    assert [err.location for err in result.errors] == [e.value.location]
+
+
+def test_union_candidates_are_still_tried():
+    @dataclass(frozen=True)
+    class Other:
+        name: int
+        count: str
+
+    @dataclass(frozen=True)
+    class Holder:
+        held: Union[Other, Item]
+
+    result = from_dict_with_errors(Holder, held={"name": "a", "count": 1})
+    assert result.errors == []
+    assert result.value.held == Item("a", 1)
+
+
+def test_errors_list_can_be_given_to_from_dict():
+    errors = []
+    for record in [{"name": "a", "count": 1}, {"name": 2, "count": 2}]:
+        from_dict(Item, record, fd_check_types=True, fd_errors=errors)
+    assert [e.location for e in errors] == [["name"]]
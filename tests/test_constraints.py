@@ -0,0 +1,134 @@
+from dataclasses import dataclass
+from typing import Annotated, List, Optional, Union
+
+import pytest
+
+from from_dict import Constraint, Convert, FromDictTypeError, Max, MaxLength, Min
+from from_dict import Regex, from_dict, from_dict_patch, from_dict_with_errors
+
+
+def parse_meters(value):
+    if isinstance(value, str) and value.endswith(" km"):
+        return float(value[:-3]) * 1000
+    return value
+
+
+def clamp_percent(value):
+    return min(max(value, 0), 100)
+
+
+class Even(Constraint):
+    def __call__(self, value):
+        return value % 2 == 0
+
+
+@dataclass
+class Run:
+    name: Annotated[str, MaxLength(10), Regex(r"^[a-z]+$")]
+    distance: Annotated[float, Convert(parse_meters), Min(0)]
+    effort: Annotated[int, Convert(clamp_percent)]
+    laps: Annotated[int, Min(1), Max(100), Even()] = 2
+    tags: Annotated[List[str], MaxLength(2)] = ()
+    note: Optional[Annotated[str, MaxLength(5)]] = None
+
+
+@dataclass
+class Week:
+    runs: List[Run]
+    best: Union[Run, None] = None
+
+
+def run(**kwargs):
+    return {"name": "morning", "distance": 500.0, "effort": 50, **kwargs}
+
+
+def test_valid_values():
+    obj = from_dict(Run, run(distance="2.5 km", effort=120, tags=["a"], note="ok"))
+    assert obj.distance == 2500.0
+    assert obj.effort == 100
+    assert obj.tags == ["a"]
+    assert obj.note == "ok"
+
+
+@pytest.mark.parametrize(
+    "field, value, constraint",
+    [
+        ("name", "a" * 11, "MaxLength(10)"),
+        ("name", "Morning", "Regex('^[a-z]+$')"),
+        ("distance", -1.0, "Min(0)"),
+        ("laps", 0, "Min(1)"),
+        ("laps", 102, "Max(100)"),
+        ("laps", 3, "Even()"),
+        ("tags", ["a", "b", "c"], "MaxLength(2)"),
+        ("note", "too long", "MaxLength(5)"),
+    ],
+)
+def test_constraint_violations(field, value, constraint):
+    with pytest.raises(FromDictTypeError) as e:
+        from_dict(Week, {"runs": [run(**{field: value})]})
+    assert e.value.location == ["runs", field]
+    assert repr(e.value.expected_type) == constraint
+
+
+def test_constraints_of_wrong_types_fail():
+    with pytest.raises(FromDictTypeError):
+        from_dict(Run, run(laps="many"))
+
+
+def test_none_is_not_checked():
+    assert from_dict(Run, run(note=None)).note is None
+
+
+def test_conversion_errors():
+    def fail(value):
+        raise ValueError(value)
+
+    @dataclass
+    class Failing:
+        x: Annotated[int, Convert(fail)]
+
+    with pytest.raises(FromDictTypeError) as e:
+        from_dict(Failing, {"x": 1})
+    assert e.value.location == ["x"]
+
+
+def test_errors_are_collected():
+    result = from_dict_with_errors(Run, run(name="X", laps=3))
+    assert sorted(e.location[0] for e in result.errors) == ["laps", "name"]
+
+
+def test_unions_try_next_member():
+    data = {"runs": [], "best": run(laps=3)}
+    assert from_dict(Week, data).best == data["best"]
+
+
+def test_patch():
+    obj = from_dict(Run, run())
+    assert from_dict_patch(obj, {"distance": "1 km"}).distance == 1000.0
+    with pytest.raises(FromDictTypeError):
+        from_dict_patch(obj, {"laps": 0})
+
+
+def test_annotated_through_aliases():
+    from _annotated_alias_classes import CODES, Measurement
+
+    obj = from_dict(Measurement, {"value": 1, "percent": 50, "unitName": "km"})
+    assert (obj.value, obj.percent, obj.unit) == (1, 50, "km")
+    assert CODES("km") is obj.unit
+
+    for data, location in [
+        ({"value": -5, "percent": 50}, ["value"]),
+        ({"value": 5, "percent": 101}, ["percent"]),
+        ({"value": 5, "percent": 50, "code": "abc"}, ["code"]),
+    ]:
+        with pytest.raises(FromDictTypeError) as e:
+            from_dict(Measurement, data)
+        assert e.value.location == location
+
+
+def test_constraints_have_to_implement_call():
+    class Incomplete(Constraint):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,126 @@
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+import pytest
+from from_dict import FromDictTypeError, add_decode_hook, from_dict
+from from_dict import from_dict_with_errors, remove_decode_hook
+
+# Deeper than the recursion limit allows for a recursive decoder
+DEPTH = sys.getrecursionlimit() * 2
+
+
+@dataclass
+class Node:
+    value: int
+    child: Optional["Node"]
+
+
+@dataclass
+class Comment:
+    text: str
+    replies: List["Comment"]
+
+
+@dataclass
+class Expression:
+    operator: str
+    operands: Dict[str, Union["Expression", int]]
+
+
+def deep_nodes(depth):
+    data = None
+    for i in range(depth):
+        data = {"value": i, "child": data}
+    return data
+
+
+def walk_nodes(node):
+    values = []
+    while node is not None:
+        values.append(node.value)
+        node = node.child
+    return values
+
+
+@pytest.mark.parametrize("check_types", [False, True])
+def test_deep_chain(check_types):
+    node = from_dict(Node, deep_nodes(DEPTH), fd_check_types=check_types)
+    assert walk_nodes(node) == list(reversed(range(DEPTH)))
+
+
+def test_deep_thread():
+    data = {"text": "leaf", "replies": []}
+    for i in range(DEPTH):
+        data = {"text": f"reply {i}", "replies": [data, {"text": "x", "replies": []}]}
+
+    comment = from_dict(Comment, data, fd_check_types=True)
+    depth = 0
+    while comment.replies:
+        assert comment.replies[1] == Comment("x", [])
+        comment = comment.replies[0]
+        depth += 1
+    assert depth == DEPTH
+    assert comment.text == "leaf"
+
+
+def test_deep_union():
+    data = {"operator": "+", "operands": {"left": 1, "right": 2}}
+    for _ in range(DEPTH):
+        data = {"operator": "-", "operands": {"left": data, "right": 3}}
+
+    expression = from_dict(Expression, data)
+    for _ in range(DEPTH):
+        assert expression.operands["right"] == 3
+        expression = expression.operands["left"]
+    assert expression == Expression("+", {"left": 1, "right": 2})
+
+
+def test_deep_error_location():
+    data = {"text": 1, "replies": []}
+    for i in range(DEPTH):
+        data = {"text": f"reply {i}", "replies": [data]}
+
+    with pytest.raises(FromDictTypeError) as e:
+        from_dict(Comment, data, fd_check_types=True)
+    assert e.value.location == ["replies"] * DEPTH + ["text"]
+
+    data["replies"][0]["text"] = 2
+    result = from_dict_with_errors(Comment, data)
+    assert [e.location for e in result.errors] == [
+        ["replies", "text"],
+        ["replies"] * DEPTH + ["text"],
+    ]
+
+
+def test_deep_nested_hooks():
+    events = []
+    hook = add_decode_hook(events.append, lambda event, token, error: None, nested=True)
+    try:
+        from_dict(Node, deep_nodes(DEPTH))
+    finally:
+        remove_decode_hook(hook)
+    assert len(events) == DEPTH + 1
+
+
+@dataclass(frozen=True)
+class FrozenNode:
+    value: int
+    child: Optional["FrozenNode"]
+
+
+def test_deep_canonical():
+    # Keys can't be built for the upper levels, they are constructed as usual.
+    # A low recursion limit keeps building the keys of the lower levels cheap.
+    depth = 1000
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(300)
+    try:
+        node = from_dict(FrozenNode, deep_nodes(depth), fd_canonical=True)
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+    values = []
+    while node is not None:
+        values.append(node.value)
+        node = node.child
+    assert values == list(reversed(range(depth)))
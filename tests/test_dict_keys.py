@@ -0,0 +1,85 @@
+import datetime
+import enum
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from from_dict import FromDictTypeError, from_dict, from_dict_patch, from_flat_dict
+from from_dict import from_json
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+@dataclass
+class Item:
+    name: str
+
+
+@dataclass
+class Keyed:
+    by_id: Dict[int, Item]
+    by_uuid: Dict[uuid.UUID, int]
+    by_day: Dict[datetime.date, List[Item]]
+    by_color: Dict[Color, Any]
+    by_name: Dict[str, int]
+    optional: Optional[Dict[int, str]] = None
+
+
+ID = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+DATA = {
+    "by_id": {"1": {"name": "a"}, "2": {"name": "b"}},
+    "by_uuid": {str(ID): 1},
+    "by_day": {"2024-01-31": [{"name": "c"}]},
+    "by_color": {"red": 1, "GREEN": 2},
+    "by_name": {"x": 1},
+    "optional": {"3": "c"},
+}
+
+
+def test_keys_are_converted():
+    obj = from_dict(Keyed, DATA, fd_check_types=True)
+    assert obj.by_id == {1: Item("a"), 2: Item("b")}
+    assert obj.by_uuid == {ID: 1}
+    assert obj.by_day == {datetime.date(2024, 1, 31): [Item("c")]}
+    assert obj.by_color == {Color.RED: 1, Color.GREEN: 2}
+    assert obj.by_name == {"x": 1}
+    assert obj.optional == {3: "c"}
+
+
+def test_str_keys_are_not_copied():
+    data = {**DATA, "by_name": {"x": 1}}
+    assert from_dict(Keyed, data).by_name is data["by_name"]
+
+
+def test_keys_of_the_type_are_kept():
+    data = {**DATA, "by_id": {1: {"name": "a"}}}
+    assert from_dict(Keyed, data, fd_check_types=True).by_id == {1: Item("a")}
+
+
+def test_invalid_keys_fail_the_type_check():
+    data = {**DATA, "by_id": {"one": {"name": "a"}}}
+    assert from_dict(Keyed, data).by_id == {"one": Item("a")}
+    with pytest.raises(FromDictTypeError):
+        from_dict(Keyed, data, fd_check_types=True)
+
+
+def test_from_json():
+    document = '{"by_id": {"7": {"name": "x"}}, "by_uuid": {}, "by_day": {}, "by_color": {}, "by_name": {}}'
+    assert from_json(Keyed, document).by_id == {7: Item("x")}
+
+
+def test_from_flat_dict():
+    flat = {"by_id.5.name": "e", "by_uuid": {}, "by_day": {}, "by_color": {}}
+    assert from_flat_dict(Keyed, {**flat, "by_name": {}}).by_id == {5: Item("e")}
+
+
+def test_patch_keys():
+    obj = from_dict(Keyed, DATA)
+    patched = from_dict_patch(obj, {"by_id": {"1": {"name": "z"}, "2": None}})
+    assert patched.by_id == {1: Item("z")}
@@ -0,0 +1,146 @@
+from dataclasses import dataclass
+from typing import Annotated, Any, Dict, Generic, List, Optional, TypeVar
+
+import pytest
+from from_dict import Convert, FromDictTypeError, Min, from_dict, from_dict_with_errors
+from from_dict import from_flat_dict, naming_policy
+
+T = TypeVar("T")
+
+
+@dataclass
+class Address:
+    city: str
+    zip: Optional[str] = None
+
+
+@naming_policy("camelCase")
+@dataclass
+class User:
+    name: str
+    address: Address
+    tags: List[str]
+    previous_addresses: List[Address]
+    scores: Dict[str, int]
+    extra: Any = None
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+
+
+FLAT = {
+    "name": "ada",
+    "address.city": "Bern",
+    "tags.1": "y",
+    "tags.0": "x",
+    "previousAddresses.0.city": "Basel",
+    "previousAddresses.0.zip": "4000",
+    "previousAddresses.1.city": "Chur",
+    "scores.math": 3,
+    "extra.a.b": 1,
+}
+
+NESTED = {
+    "name": "ada",
+    "address": {"city": "Bern"},
+    "tags": ["x", "y"],
+    "previousAddresses": [{"city": "Basel", "zip": "4000"}, {"city": "Chur"}],
+    "scores": {"math": 3},
+    "extra": {"a": {"b": 1}},
+}
+
+
+def test_same_as_nested():
+    assert from_flat_dict(User, FLAT, fd_check_types=True) == from_dict(User, NESTED)
+
+
+def test_separator_and_generics():
+    page = from_flat_dict(Page[Address], {"items/0/city": "Bern"}, fd_separator="/")
+    assert page == Page([Address("Bern")])
+
+
+def test_optional_any_is_nested():
+    @dataclass
+    class Event:
+        name: str
+        payload: Optional[Any] = None
+
+    event = from_flat_dict(Event, {"name": "e", "payload.a.0": 1}, fd_check_types=True)
+    assert event == Event("e", {"a": {"0": 1}})
+
+
+def _title_city(address: dict) -> dict:
+    return dict(address, city=address["city"].title())
+
+
+@dataclass
+class Converted:
+    address: Annotated[Address, Convert(_title_city)]
+    scores: Annotated[List[int], Convert(sorted), Min([0])]
+    previous: List[Annotated[Address, Convert(_title_city)]]
+
+
+def test_converters_get_nested_input():
+    flat = {
+        "address.city": "bern",
+        "scores.0": 2,
+        "scores.1": 1,
+        "previous.0.city": "chur",
+    }
+    nested = {
+        "address": {"city": "bern"},
+        "scores": [2, 1],
+        "previous": [{"city": "chur"}],
+    }
+    expected = Converted(Address("Bern"), [1, 2], [Address("chur")])
+    assert from_dict(Converted, nested, fd_check_types=True) == expected
+    assert from_flat_dict(Converted, flat, fd_check_types=True) == expected
+
+    with pytest.raises(FromDictTypeError) as e:
+        from_flat_dict(Converted, dict(flat, **{"scores.3": 0}))
+    assert e.value.location == ["scores", "2"]
+
+
+def test_unknown_keys_are_nested():
+    user = from_flat_dict(User, dict(FLAT, **{"meta.source": "log"}))
+    assert user.meta == {"source": "log"}
+
+
+def test_error_locations():
+    with pytest.raises(FromDictTypeError) as e:
+        from_flat_dict(User, dict(FLAT, **{"address.city": 1}), fd_check_types=True)
+    assert e.value.location == ["address", "city"]
+
+    errors = from_dict_with_errors(User, NESTED, address={"city": 1}, previousAddresses=[{"city": 2}]).errors
+    flat = dict(FLAT, **{"address.city": 1, "previousAddresses.0.city": 2})
+    del flat["previousAddresses.0.zip"], flat["previousAddresses.1.city"]
+    flat_errors = []
+    from_flat_dict(User, flat, fd_check_types=True, fd_errors=flat_errors)
+    assert [e.location for e in flat_errors] == [e.location for e in errors]
+
+
+def test_invalid_keys():
+    with pytest.raises(FromDictTypeError):
+        from_flat_dict(User, dict(FLAT, **{"tags.first": "x"}))
+    with pytest.raises(ValueError):
+        from_flat_dict(User, dict(FLAT, address="Bern"))
+
+
+@pytest.mark.parametrize(
+    "tags, location, found",
+    [
+        ({"tags.0": "x", "tags.-1": "y"}, ["tags", "-1"], "invalid list index"),
+        ({"tags.0": "x", "tags.01": "y"}, ["tags", "01"], "invalid list index"),
+        ({"tags.0": "x", "tags.+1": "y"}, ["tags", "+1"], "invalid list index"),
+        ({"tags.0": "x", "tags.2": "y"}, ["tags", "1"], "missing list index"),
+        ({"tags.5": "x"}, ["tags", "0"], "missing list index"),
+    ],
+)
+def test_invalid_list_indices(tags, location, found):
+    flat = {k: v for k, v in FLAT.items() if not k.startswith("tags.")}
+    with pytest.raises(FromDictTypeError) as e:
+        from_flat_dict(User, {**flat, **tags})
+    assert e.value.location == location
+    assert e.value.found_type == found
@@ -0,0 +1,136 @@
+import datetime
+import decimal
+import enum
+import io
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+
+import pytest
+from from_dict import FromDictTypeError, FromDictUnknownArgsError, from_csv
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Size(enum.Enum):
+    SMALL = 1
+    LARGE = 2
+
+
+@dataclass
+class Product:
+    name: str
+    count: int
+    price: float
+    available: bool
+    color: Color
+    size: Optional[Size]
+    added: datetime.date
+    note: Optional[str] = None
+
+
+PRODUCTS_CSV = """name,count,price,available,color,size,added,extra
+tea,3,2.5,true,red,1,2024-01-31,x
+cake,0,4.25,No,GREEN,,2024-02-01,y
+
+coffee,12,3,1,green,LARGE,2024-03-01,z
+"""
+
+
+def test_from_csv():
+    products = list(from_csv(Product, io.StringIO(PRODUCTS_CSV)))
+    assert products == [
+        Product("tea", 3, 2.5, True, Color.RED, Size.SMALL, datetime.date(2024, 1, 31)),
+        Product("cake", 0, 4.25, False, Color.GREEN, None, datetime.date(2024, 2, 1)),
+        Product("coffee", 12, 3.0, True, Color.GREEN, Size.LARGE, datetime.date(2024, 3, 1)),
+    ]
+
+
+def test_columns_in_any_order():
+    data = "note,added,size,color,available,price,count,name\n,2024-01-31,,red,false,1.5,2,tea\n"
+    (product,) = from_csv(Product, io.StringIO(data))
+    assert product == Product("tea", 2, 1.5, False, Color.RED, None, datetime.date(2024, 1, 31))
+
+
+def test_fieldnames_and_dialect():
+    data = "tea;3;2.5;yes;red;2;2024-01-31\n"
+    fieldnames = ["name", "count", "price", "available", "color", "size", "added"]
+    (product,) = from_csv(Product, io.StringIO(data), fd_fieldnames=fieldnames, delimiter=";")
+    assert product.size is Size.LARGE
+    assert product.note is None
+
+
+def test_named_tuple_and_streaming():
+    class Point(NamedTuple):
+        x: int
+        y: int
+
+    lines = iter(["x,y\n", "1,2\n", "3,4\n"])
+    points = from_csv(Point, lines)
+    assert next(points) == Point(1, 2)
+    assert next(lines) == "3,4\n"  # Rows are only read when needed
+
+
+def test_conversion_error_location():
+    data = "name,count,price,available,color,size,added\ntea,1,1,1,red,1,2024-01-31\ntea,one,1,1,red,1,2024-01-31\n"
+    with pytest.raises(FromDictTypeError) as e:
+        list(from_csv(Product, io.StringIO(data)))
+    assert e.value.location == ["[1]", "count"]
+    assert e.value.expected_type is int
+    assert e.value.found_type == "'one'"
+
+    with pytest.raises(FromDictTypeError) as e:
+        list(from_csv(Product, io.StringIO(data.replace(",red,1,2024-01-31\ntea,one", ",blue,1,2024-01-31\ntea,one"))))
+    assert e.value.location == ["[0]", "color"]
+
+
+def test_unknown_columns():
+    with pytest.raises(FromDictUnknownArgsError) as e:
+        list(from_csv(Product, io.StringIO(PRODUCTS_CSV), fd_error_on_unknown=True))
+    assert e.value.unknown_args == ["extra"]
+
+
+def test_unsupported_column_type():
+    @dataclass
+    class Nested:
+        product: Product
+
+    with pytest.raises(TypeError):
+        list(from_csv(Nested, io.StringIO("product\nx\n")))
+
+
+def test_empty_file():
+    assert list(from_csv(Product, io.StringIO(""))) == []
+
+
+def test_invalid_decimal_cell():
+    @dataclass
+    class Payment:
+        amount: decimal.Decimal
+
+    assert list(from_csv(Payment, io.StringIO("amount\n1.50\n"))) == [
+        Payment(decimal.Decimal("1.50"))
+    ]
+    with pytest.raises(FromDictTypeError) as e:
+        list(from_csv(Payment, io.StringIO("amount\n1.50\nabc\n")))
+    assert e.value.location == ["[1]", "amount"]
+    assert e.value.found_type == "'abc'"
+
+
+def test_short_rows_use_defaults():
+    @dataclass
+    class Row:
+        name: str
+        count: int = 7
+        label: str = "none"
+
+    rows = list(from_csv(Row, io.StringIO("name,count,label\na\nb,2\nc,3,x\n")))
+    assert rows == [Row("a", 7, "none"), Row("b", 2, "none"), Row("c", 3, "x")]
+
+    rows = list(from_csv(Row, io.StringIO("name,label\na,x\nb\n")))
+    assert rows == [Row("a", 7, "x"), Row("b", 7, "none")]
+
+    with pytest.raises(TypeError):
+        list(from_csv(Row, io.StringIO("label,name\ny\n")))
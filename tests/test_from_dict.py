@@ -1,3 +1,4 @@
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Dict, List, NamedTuple, Optional, Type, Union, TypeVar, Generic, Any
 
@@ -569,4 +570,58 @@ def test_optional_any():
     assert from_dict(Data, value=None, fd_check_types=True)
     assert from_dict(Data, value="ANYTHING", fd_check_types=True)
 
+
+def test_optional_any_with_structures():
+    @dataclass
+    class Inner:
+        x: int
+
+    @dataclass
+    class Data:
+        value: Optional[Any]
+        either: Union[Any, Inner] = None
+
+    data = from_dict(Data, value={"a": [1]}, either={"x": 1}, fd_check_types=True)
+    assert data.value == {"a": [1]}
+    assert data.either == Inner(1)
+
     
+
+
+def test_keyword_style_does_not_modify_given_dict():
+    given = {"foo": 42, "bar": "given", "extra": 1}
+    obj = from_dict(SubTestDictDataclass, given, bar="overwritten", other=2)
+
+    assert obj.foo == 42
+    assert obj.bar == "overwritten"
+    assert obj.extra == 1
+    assert obj.other == 2
+    assert given == {"foo": 42, "bar": "given", "extra": 1}
+
+
+def test_unknown_args_set_by_constructor_are_not_overwritten():
+    class Normal:
+        def __init__(self, foo: int) -> None:
+            self.foo = foo
+            self.bar = "from constructor"
+
+    obj = from_dict(Normal, foo=1, bar="given", baz="unknown")
+    assert obj.bar == "from constructor"
+    assert obj.baz == "unknown"
+
+    from_dict(Normal, foo=1, bar="given", fd_error_on_unknown=True, fd_copy_unknown=False)
+    with pytest.raises(FromDictUnknownArgsError) as e:
+        from_dict(Normal, foo=1, bar="given", baz="unknown", fd_error_on_unknown=True, fd_copy_unknown=False)
+    assert e.value.unknown_args == ["baz"]
+
+
+def test_dict_subclasses_are_not_looked_up_for_missing_keys():
+    @dataclass
+    class WithDefault:
+        x: int
+        y: int = 5
+
+    given = defaultdict(int, x=1)
+    assert from_dict(WithDefault, given) == WithDefault(x=1, y=5)
+    assert from_dict(WithDefault, given, x=2) == WithDefault(x=2, y=5)
+    assert given == {"x": 1}
@@ -0,0 +1,104 @@
+import decimal
+import json
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import pytest
+from from_dict import FromDictTypeError, from_json, from_json_file
+
+
+@dataclass(frozen=True)
+class LineItem:
+    name: str
+    price: float
+
+
+@dataclass(frozen=True)
+class Order:
+    id: int
+    items: List[LineItem]
+    by_name: Dict[str, LineItem]
+    note: Optional[str] = None
+
+
+ORDER_JSON = """{
+    "id": 7,
+    "items": [{"name": "tea", "price": 2.5}, {"name": "cake", "price": 4.25}],
+    "by_name": {"tea": {"name": "tea", "price": 2.5}},
+    "unknown": true
+}"""
+
+
+def test_from_str():
+    order = from_json(Order, ORDER_JSON)
+    assert order.id == 7
+    assert order.items == [LineItem("tea", 2.5), LineItem("cake", 4.25)]
+    assert order.by_name == {"tea": LineItem("tea", 2.5)}
+    assert order.note is None
+    assert order.unknown is True
+
+
+def test_from_bytes():
+    assert from_json(Order, ORDER_JSON.encode("utf-8")) == from_json(Order, ORDER_JSON)
+
+
+def test_parse_float():
+    order = from_json(Order, ORDER_JSON, fd_parse_float=decimal.Decimal)
+    assert order.items[1].price == decimal.Decimal("4.25")
+
+
+def test_from_dict_arguments_are_passed_on():
+    with pytest.raises(FromDictTypeError):
+        from_json(Order, '{"id": "7", "items": [], "by_name": {}}', fd_check_types=True)
+
+    assert from_json(Order, ORDER_JSON, note="overwritten").note == "overwritten"
+
+
+def test_top_level_must_be_object():
+    with pytest.raises(TypeError):
+        from_json(Order, "[]")
+
+
+def test_from_file(tmp_path):
+    path = tmp_path / "order.json"
+    path.write_text(ORDER_JSON, encoding="utf-8")
+    order = from_json_file(Order, path, note="overwritten")
+    assert order == from_json(Order, ORDER_JSON, note="overwritten")
+
+    order = from_json_file(Order, str(path), fd_parse_float=decimal.Decimal)
+    assert order.items[1].price == decimal.Decimal("4.25")
+
+
+@pytest.mark.parametrize("encoding", ["utf-8-sig", "utf-16", "utf-32-le"])
+def test_from_file_encodings(tmp_path, encoding):
+    path = tmp_path / "order.json"
+    path.write_bytes(ORDER_JSON.replace("tea", "té ☕").encode(encoding))
+    order = from_json_file(Order, path)
+    assert order.items[0].name == "té ☕"
+
+
+def test_from_empty_file(tmp_path):
+    path = tmp_path / "empty.json"
+    path.write_bytes(b"")
+    with pytest.raises(json.JSONDecodeError):
+        from_json_file(Order, path)
+
+
+def test_file_bytes_are_dropped_before_parsing(tmp_path):
+    path = tmp_path / "orders.json"
+    items = [{"name": "x" * 1000, "price": 1.0}] * 2000
+    path.write_text(json.dumps({"id": 1, "items": items, "by_name": {}}))
+
+    def peak(decode):
+        tracemalloc.start()
+        try:
+            decode()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    # Reading the file keeps its bytes next to the decoded str while parsing
+    from_file = peak(lambda: from_json_file(Order, path))
+    read = peak(lambda: from_json(Order, path.read_bytes()))
+    assert from_file + path.stat().st_size * 0.9 < read
@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+from from_dict import DecodeEvent, add_decode_hook, from_dict, remove_decode_hook
+
+
+@dataclass(frozen=True)
+class Item:
+    name: str
+
+
+@dataclass(frozen=True)
+class Order:
+    items: List[Item]
+
+
+class Tracer:
+    """Stand-in for a tracer that records spans"""
+
+    def __init__(self):
+        self.spans = []
+        self.open = 0
+
+    def start(self, event: DecodeEvent):
+        self.open += 1
+        return {"name": event.class_name, "size": event.payload_size, "top": event.top_level}
+
+    def end(self, event: DecodeEvent, span, error):
+        self.open -= 1
+        span["error"] = error
+        self.spans.append(span)
+
+
+@pytest.fixture
+def tracer():
+    tracer = Tracer()
+    yield tracer
+    for hook in getattr(tracer, "hooks", []):
+        remove_decode_hook(hook)
+
+
+def register(tracer, nested=False):
+    hook = add_decode_hook(tracer.start, tracer.end, nested=nested)
+    tracer.hooks = getattr(tracer, "hooks", []) + [hook]
+    return hook
+
+
+def test_top_level_calls(tracer):
+    register(tracer)
+    from_dict(Order, items=[{"name": "a"}, {"name": "b"}], extra=1)
+
+    assert tracer.spans == [
+        {"name": f"{__name__}.Order", "size": 2, "top": True, "error": None}
+    ]
+
+
+def test_nested_objects(tracer):
+    register(tracer, nested=True)
+    from_dict(Order, items=[{"name": "a"}])
+
+    assert [(s["name"], s["top"]) for s in tracer.spans] == [
+        (f"{__name__}.Item", False),
+        (f"{__name__}.Order", False),
+        (f"{__name__}.Order", True),
+    ]
+    assert tracer.open == 0
+
+
+def test_errors_are_reported(tracer):
+    register(tracer, nested=True)
+    with pytest.raises(TypeError):
+        from_dict(Order, items=[{"nome": "a"}])
+
+    assert tracer.open == 0
+    assert all(isinstance(s["error"], TypeError) for s in tracer.spans)
+    assert len(tracer.spans) == 3
+
+
+def test_remove_hook(tracer):
+    hook = register(tracer)
+    remove_decode_hook(hook)
+    from_dict(Item, name="a")
+    assert tracer.spans == []
@@ -0,0 +1,81 @@
+from dataclasses import dataclass
+from typing import Annotated, List, Optional
+
+from from_dict import Intern, InternTable, from_dict
+
+
+def new_str(s: str) -> str:
+    # Build an equal but distinct str object
+    return "".join(list(s))
+
+
+@dataclass
+class Event:
+    status: str
+    country: Annotated[str, Intern]
+    comment: Optional[str] = None
+
+
+def test_annotated_field_is_interned():
+    e1 = from_dict(Event, status=new_str("ok"), country=new_str("Switzerland"))
+    e2 = from_dict(Event, status=new_str("ok"), country=new_str("Switzerland"))
+
+    assert e1.country is e2.country
+    assert e1.status == e2.status
+    assert e1.status is not e2.status
+
+
+def test_annotated_field_with_own_table():
+    table = InternTable()
+
+    @dataclass
+    class Tagged:
+        tag: Annotated[str, Intern(table)]
+
+    t1 = from_dict(Tagged, tag=new_str("red"))
+    t2 = from_dict(Tagged, tag=new_str("red"))
+    assert t1.tag is t2.tag
+    assert len(table) == 1
+
+
+def test_global_interning():
+    table = InternTable()
+    records = [
+        {"status": new_str("ok"), "country": new_str("CH"), new_str("extra"): new_str("x")}
+        for _ in range(3)
+    ]
+    events = [from_dict(Event, r, fd_intern=table) for r in records]
+
+    assert all(e.status is events[0].status for e in events)
+    assert all(e.extra is events[0].extra for e in events)
+    keys = [next(k for k in e.__dict__ if k == "extra") for e in events]
+    assert all(k is keys[0] for k in keys)
+
+
+def test_global_interning_with_default_table():
+    e1 = from_dict(Event, status=new_str("failed"), country="CH", fd_intern=True)
+    e2 = from_dict(Event, status=new_str("failed"), country="CH", fd_intern=True)
+    assert e1.status is e2.status
+
+
+def test_non_str_values_are_untouched():
+    @dataclass
+    class Numbers:
+        values: List[int]
+        name: str
+
+    n = from_dict(Numbers, values=[1, 2], name="n", fd_intern=True)
+    assert n.values == [1, 2]
+
+
+def test_intern_table_is_bounded():
+    table = InternTable(max_size=2)
+    a, b, c = table(new_str("alpha")), table(new_str("beta")), table(new_str("gamma"))
+    assert len(table) == 2
+
+    assert table(new_str("alpha")) is a
+    assert table(new_str("beta")) is b
+    assert table(new_str("gamma")) is not c
+
+    table.clear()
+    assert len(table) == 0
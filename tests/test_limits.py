@@ -0,0 +1,108 @@
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+import pytest
+
+from from_dict import DecodeLimits, FromDictLimitError, from_dict, from_json
+
+
+@dataclass
+class Node:
+    value: int
+    child: Optional["Node"]
+
+
+@dataclass
+class Item:
+    name: str
+
+
+@dataclass
+class Basket:
+    items: List[Item]
+    counts: Dict[str, int]
+    labels: List[str]
+
+
+@dataclass
+class Choice:
+    option: Union[Item, Node]
+
+
+def deep_nodes(depth):
+    data = None
+    for i in range(depth):
+        data = {"value": i, "child": data}
+    return data
+
+
+def basket(n):
+    return {
+        "items": [{"name": str(i)} for i in range(n)],
+        "counts": {str(i): i for i in range(n)},
+        "labels": [str(i) for i in range(n)],
+    }
+
+
+def test_within_limits():
+    limits = DecodeLimits(max_depth=10, max_objects=11, max_length=5, timeout=10)
+    assert from_dict(Node, deep_nodes(10), fd_limits=limits).value == 9
+    assert len(from_dict(Basket, basket(5), fd_limits=limits).items) == 5
+
+
+def test_max_depth():
+    with pytest.raises(FromDictLimitError) as e:
+        from_dict(Node, deep_nodes(10), fd_limits=DecodeLimits(max_depth=3))
+    assert e.value.limit == "max_depth"
+    assert e.value.location == ["child", "child", "child"]
+    assert str(e.value) == 'For "child.child.child", max_depth of 3 exceeded'
+
+
+def test_max_objects():
+    with pytest.raises(FromDictLimitError) as e:
+        from_dict(Basket, basket(10), fd_limits=DecodeLimits(max_objects=5))
+    assert e.value.limit == "max_objects"
+    assert e.value.location == ["items"]
+
+
+@pytest.mark.parametrize("field", ["items", "counts", "labels"])
+def test_max_length(field):
+    data = basket(3)
+    data[field] = basket(10)[field]
+    with pytest.raises(FromDictLimitError) as e:
+        from_dict(Basket, data, fd_limits=DecodeLimits(max_length=5))
+    assert e.value.limit == "max_length"
+    assert e.value.location == [field]
+
+
+def test_max_length_of_object_input():
+    data = {"value": 1, "child": None}
+    data.update((f"extra{i}", i) for i in range(10))
+    with pytest.raises(FromDictLimitError) as e:
+        from_dict(Node, data, fd_limits=DecodeLimits(max_length=5))
+    assert e.value.location == []
+
+
+def test_timeout():
+    with pytest.raises(FromDictLimitError) as e:
+        from_dict(Node, deep_nodes(10), fd_limits=DecodeLimits(timeout=-1))
+    assert e.value.limit == "timeout"
+
+    limits = DecodeLimits(timeout=0.05)
+    from_dict(Node, deep_nodes(10), fd_limits=limits)
+    time.sleep(0.1)
+    # Every call gets its own deadline
+    from_dict(Node, deep_nodes(10), fd_limits=limits)
+
+
+def test_limit_errors_are_not_swallowed_by_unions():
+    data = {"option": {"value": 1, "child": deep_nodes(5)}}
+    with pytest.raises(FromDictLimitError):
+        from_dict(Choice, data, fd_limits=DecodeLimits(max_depth=3))
+
+
+def test_from_json_passes_limits():
+    document = '{"value": 1, "child": {"value": 2, "child": null}}'
+    with pytest.raises(FromDictLimitError):
+        from_json(Node, document, fd_limits=DecodeLimits(max_depth=1))
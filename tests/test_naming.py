@@ -0,0 +1,104 @@
+import io
+from dataclasses import dataclass, field
+from typing import Annotated, List, Optional
+
+import attr
+import pytest
+from from_dict import Alias, FromDictTypeError, FromDictUnknownArgsError, from_csv
+from from_dict import from_dict, from_dict_with_errors, naming_policy, to_dict
+
+
+@naming_policy("camelCase")
+@dataclass
+class Address:
+    street_name: str
+    house_number: int
+    zip: Annotated[str, Alias("postalCode")]
+
+
+@naming_policy("camelCase")
+@dataclass
+class User:
+    user_name: str
+    home_address: Address
+    previous_addresses: List[Address]
+    user_id: int = field(default=0, metadata={"alias": "ID"})
+    nick_name: Optional[str] = None
+
+
+@attr.s(auto_attribs=True)
+class AttrUser:
+    user_name: str = attr.ib(metadata={"alias": "login"})
+    full_name: Annotated[str, Alias("displayName")] = ""
+
+
+USER = {
+    "userName": "ada",
+    "ID": 7,
+    "homeAddress": {"streetName": "Main St", "houseNumber": 1, "postalCode": "123"},
+    "previousAddresses": [{"streetName": "Old St", "houseNumber": 2, "postalCode": "456"}],
+}
+
+
+def test_naming_policy_and_aliases():
+    user = from_dict(User, USER, fd_check_types=True)
+    assert user == User(
+        "ada", Address("Main St", 1, "123"), [Address("Old St", 2, "456")], 7
+    )
+    assert to_dict(user) == dict(USER, nickName=None)
+
+
+def test_attr_metadata_alias():
+    user = from_dict(AttrUser, login="ada", displayName="Ada L.")
+    assert user == AttrUser("ada", "Ada L.")
+    assert to_dict(user) == {"login": "ada", "displayName": "Ada L."}
+
+
+def test_only_keys_are_read():
+    user = from_dict(User, USER, user_name="ignored", nick_name="ignored")
+    assert user.user_name == "ada"
+    assert user.nick_name is None
+
+    with pytest.raises(FromDictUnknownArgsError) as e:
+        from_dict(AttrUser, login="ada", fullName="x", fd_copy_unknown=False, fd_error_on_unknown=True)
+    assert e.value.unknown_args == ["fullName"]
+
+
+def test_error_locations_use_keys():
+    given = dict(USER, homeAddress={"streetName": 1, "houseNumber": 1, "postalCode": 2})
+    with pytest.raises(FromDictTypeError) as e:
+        from_dict(User, given, fd_check_types=True)
+    assert e.value.location == ["homeAddress", "streetName"]
+
+    errors = from_dict_with_errors(User, given).errors
+    assert [e.location for e in errors] == [["homeAddress", "streetName"], ["homeAddress", "postalCode"]]
+
+
+@pytest.mark.parametrize(
+    "policy, key",
+    [("camelCase", "userName"), ("PascalCase", "UserName"), ("kebab-case", "user-name"), (str.upper, "USER_NAME")],
+)
+def test_policies(policy, key):
+    @naming_policy(policy)
+    @dataclass
+    class Named:
+        user_name: str
+        _private_id: int = 0
+
+    assert from_dict(Named, {key: "ada"}).user_name == "ada"
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        naming_policy("snake-Case")
+
+
+def test_csv_columns_use_keys():
+    data = "userName,displayName\nada,Ada L.\n"
+
+    @dataclass
+    class Row:
+        user_name: Annotated[str, Alias("userName")]
+        display_name: Annotated[str, Alias("displayName")]
+
+    assert list(from_csv(Row, io.StringIO(data))) == [Row("ada", "Ada L.")]
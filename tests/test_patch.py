@@ -0,0 +1,140 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional
+
+import attr
+import pytest
+
+from from_dict import FromDictTypeError, FromDictUnknownArgsError, from_dict
+from from_dict import from_dict_patch, naming_policy
+
+
+@dataclass(frozen=True)
+class Limits:
+    cpu: int
+    memory: int
+
+
+@dataclass(frozen=True)
+class Service:
+    name: str
+    limits: Limits
+    ports: List[int] = field(default_factory=list)
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class Region:
+    _code: str
+    origin: Point
+
+
+@naming_policy("camelCase")
+@dataclass(frozen=True)
+class Config:
+    version: int
+    services: Dict[str, Service]
+    region: Region
+    default_service: Optional[Service] = None
+
+
+DATA = {
+    "version": 1,
+    "services": {
+        "api": {"name": "api", "limits": {"cpu": 1, "memory": 512}, "ports": [80]},
+        "db": {"name": "db", "limits": {"cpu": 2, "memory": 2048}},
+    },
+    "region": {"code": "eu", "origin": {"x": 0, "y": 0}},
+}
+
+
+@pytest.fixture
+def config():
+    return from_dict(Config, DATA)
+
+
+def test_changed_paths_are_replaced(config):
+    patched = from_dict_patch(
+        config, {"services": {"api": {"limits": {"cpu": 4}}}, "version": 2}
+    )
+    assert patched.version == 2
+    assert patched.services["api"].limits == Limits(4, 512)
+    assert patched.services["api"].ports == [80]
+    # Untouched subtrees are shared
+    assert patched.services["db"] is config.services["db"]
+    assert patched.region is config.region
+    assert patched.services["api"].ports is config.services["api"].ports
+    # The original object is not changed
+    assert config.services["api"].limits.cpu == 1
+
+
+def test_same_result_as_from_dict_of_merged_dict(config):
+    delta = {
+        "services": {"cache": {"name": "cache", "limits": {"cpu": 1, "memory": 64}}},
+        "region": {"origin": {"y": 5}},
+        "defaultService": {"name": "x", "limits": {"cpu": 1, "memory": 1}},
+    }
+    merged = {
+        **DATA,
+        "services": {**DATA["services"], **delta["services"]},
+        "region": {"code": "eu", "origin": {"x": 0, "y": 5}},
+        "defaultService": delta["defaultService"],
+    }
+    assert from_dict_patch(config, delta) == from_dict(Config, merged)
+
+
+def test_none_removes_dict_keys(config):
+    patched = from_dict_patch(config, {"services": {"db": None}})
+    assert list(patched.services) == ["api"]
+
+
+def test_lists_are_replaced(config):
+    patched = from_dict_patch(config, {"services": {"api": {"ports": [1, 2]}}})
+    assert patched.services["api"].ports == [1, 2]
+
+
+def test_empty_delta_returns_object(config):
+    assert from_dict_patch(config, {}) is config
+
+
+def test_type_errors_have_location(config):
+    delta = {"services": {"api": {"limits": {"cpu": "many"}}}}
+    with pytest.raises(FromDictTypeError) as e:
+        from_dict_patch(config, delta, fd_check_types=True)
+    assert e.value.location == ["services", "api", "limits", "cpu"]
+
+    errors = []
+    from_dict_patch(config, delta, fd_check_types=True, fd_errors=errors)
+    assert [e.location for e in errors] == [["services", "api", "limits", "cpu"]]
+
+    with pytest.raises(FromDictTypeError) as e:
+        from_dict_patch(config, {"version": "2"}, fd_check_types=True)
+    assert e.value.location == ["version"]
+
+
+def test_unknown_keys(config):
+    with pytest.raises(FromDictUnknownArgsError):
+        from_dict_patch(
+            config,
+            {"unknown": 1},
+            fd_copy_unknown=False,
+            fd_error_on_unknown=True,
+        )
+
+    @dataclass
+    class Open:
+        x: int
+
+    obj = from_dict(Open, {"x": 1, "old": "o"})
+    patched = from_dict_patch(obj, {"x": 2, "new": "n"})
+    assert (patched.x, patched.old, patched.new) == (2, "o", "n")
+
+
+def test_unsupported_object():
+    with pytest.raises(TypeError):
+        from_dict_patch(1, {"x": 1})
+    with pytest.raises(TypeError):
+        from_dict_patch(Limits(1, 1), [])
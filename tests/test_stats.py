@@ -0,0 +1,88 @@
+import logging
+from dataclasses import dataclass
+from typing import List
+
+import pytest
+import from_dict as fd
+from from_dict import from_dict
+
+
+@dataclass(frozen=True)
+class Item:
+    name: str
+
+
+@dataclass(frozen=True)
+class Order:
+    items: List[Item]
+
+
+ITEM = f"{__name__}.Item"
+ORDER = f"{__name__}.Order"
+
+
+@pytest.fixture
+def collect_stats():
+    fd.reset_stats()
+    fd.enable_stats()
+    yield
+    fd.disable_stats()
+    fd.reset_stats()
+
+
+def test_disabled_by_default():
+    fd.reset_stats()
+    from_dict(Order, items=[{"name": "a"}])
+    assert fd.stats()["classes"] == {}
+    assert fd.stats()["objects_per_call"]["count"] == 0
+
+
+def test_counts_per_class(collect_stats):
+    from_dict(Order, items=[{"name": "a"}, {"name": "b"}])
+    from_dict(Order, items=[{"name": "c"}])
+
+    result = fd.stats()
+    assert result["classes"][ITEM]["count"] == 3
+    assert result["classes"][ORDER]["count"] == 2
+
+    order_stats = result["classes"][ORDER]
+    assert 0 < order_stats["p50"] <= order_stats["p99"] <= order_stats["max"]
+    assert order_stats["total"] >= order_stats["max"]
+
+    per_call = result["objects_per_call"]
+    assert per_call["count"] == 2
+    assert per_call["total"] == 5
+    assert per_call["max"] == 3
+
+
+def test_reset(collect_stats):
+    from_dict(Item, name="a")
+    fd.reset_stats()
+    assert fd.stats()["classes"] == {}
+
+
+def test_disable_keeps_stats(collect_stats):
+    from_dict(Item, name="a")
+    fd.disable_stats()
+    from_dict(Item, name="b")
+    assert fd.stats()["classes"][ITEM]["count"] == 1
+
+
+def test_slow_decode_is_logged(collect_stats, caplog):
+    fd.enable_stats(slow_threshold=0.0)
+    with caplog.at_level(logging.WARNING, logger="from_dict"):
+        from_dict(Order, items=[{"name": "a"}], extra=1)
+    assert len(caplog.records) == 1
+    assert ORDER in caplog.records[0].getMessage()
+    assert "2 keys" in caplog.records[0].getMessage()
+
+
+def test_histogram_percentiles():
+    from from_dict._stats import Histogram
+
+    h = Histogram()
+    for v in range(1, 101):
+        h.add(v)
+    assert h.percentile(50) == pytest.approx(50, rel=0.2)
+    assert h.percentile(99) == pytest.approx(99, rel=0.2)
+    assert h.percentile(100) == 100
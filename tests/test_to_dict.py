@@ -0,0 +1,186 @@
+import datetime
+import json
+import uuid
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Annotated, Any, Dict, List, NamedTuple, Optional, TypeVar, Generic, Union
+
+import attr
+import pytest
+from from_dict import Alias, Convert, from_dict, naming_policy, to_dict, to_dict_many
+
+
+@dataclass(frozen=True)
+class Preference:
+    name: str
+    score: int
+
+
+@attr.s(auto_attribs=True)
+class Address:
+    city: str
+    zip_code: Optional[int]
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+@dataclass
+class Customer:
+    name: str
+    preferences: List[Preference]
+    addresses: Dict[str, Address]
+    location: Point
+    tags: List[str] = field(default_factory=list)
+    parent: Optional["Customer"] = None
+    anything: Any = None
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    total: int
+
+
+CUSTOMER_DICT = {
+    "name": "Christopher Lee",
+    "preferences": [{"name": "The Hobbit", "score": 37}],
+    "addresses": {"home": {"city": "London", "zip_code": None}},
+    "location": {"x": 1, "y": 2},
+    "tags": ["actor"],
+    "parent": None,
+    "anything": {"nested": [1, 2]},
+}
+
+
+def test_round_trip():
+    customer = from_dict(Customer, CUSTOMER_DICT)
+    assert to_dict(customer) == CUSTOMER_DICT
+    assert from_dict(Customer, to_dict(customer)) == customer
+
+
+def test_self_reference():
+    child = from_dict(Customer, CUSTOMER_DICT, parent=CUSTOMER_DICT)
+    assert to_dict(child)["parent"] == CUSTOMER_DICT
+
+
+def test_containers_are_copied_but_leaves_are_not():
+    name = "".join(["Christopher", " ", "Lee"])
+    customer = from_dict(Customer, CUSTOMER_DICT, name=name)
+    result = to_dict(customer)
+
+    assert result["name"] is name
+    assert result["tags"] == customer.tags
+    assert result["tags"] is not customer.tags
+    assert result["anything"] is not customer.anything
+    assert isinstance(result["location"], dict)
+
+
+def test_generic_class():
+    page = from_dict(Page[Preference], items=[{"name": "a", "score": 1}], total=1)
+    assert to_dict(page) == {"items": [{"name": "a", "score": 1}], "total": 1}
+
+
+def test_normal_class_without_matching_attributes():
+    class Normal:
+        def __init__(self, value: int, when: datetime.date) -> None:
+            self.value = value
+            self.other = when
+
+    today = datetime.date.today()
+    assert to_dict(Normal(3, today)) == {"value": 3}
+
+
+def test_union_of_structures():
+    @dataclass
+    class Holder:
+        held: Union[Preference, Address, str]
+
+    assert to_dict(Holder("text")) == {"held": "text"}
+    assert to_dict(Holder(Preference("a", 1))) == {"held": {"name": "a", "score": 1}}
+    assert to_dict(Holder(Address("Bern", 3000))) == {
+        "held": {"city": "Bern", "zip_code": 3000}
+    }
+
+
+def test_to_dict_many():
+    objs = [Preference("a", 1), Preference("b", 2), Address("Bern", None)]
+    assert to_dict_many(objs) == [
+        {"name": "a", "score": 1},
+        {"name": "b", "score": 2},
+        {"city": "Bern", "zip_code": None},
+    ]
+
+
+def test_unsupported_object():
+    with pytest.raises(TypeError):
+        to_dict(3)
+    with pytest.raises(TypeError):
+        to_dict({"a": 1})
+
+
+class Color(Enum):
+    RED = 1
+    BLUE = 2
+
+
+@naming_policy("camelCase")
+@dataclass
+class Account:
+    user_name: str
+    balances: Dict[int, float]
+    email: Annotated[str, Alias("mail")] = ""
+    # Input in cents, kept in whole units
+    limit: Annotated[
+        float, Convert(lambda cents: cents / 100, lambda units: round(units * 100))
+    ] = 0.0
+    by_day: Optional[Dict[datetime.date, List[float]]] = None
+    owners: Dict[uuid.UUID, str] = field(default_factory=dict)
+    colors: Dict[Color, str] = field(default_factory=dict)
+
+
+def test_round_trip_of_input_transforms():
+    owner = "12345678-1234-5678-1234-567812345678"
+    data = {
+        "userName": "ada",
+        "balances": {"1": 2.5},
+        "mail": "a@b",
+        "limit": 5000,
+        "byDay": {"2020-01-31": [1.5]},
+        "owners": {owner: "bob"},
+        "colors": {"1": "red"},
+    }
+    account = from_dict(Account, data, fd_check_types=True)
+    assert account == Account(
+        "ada",
+        {1: 2.5},
+        "a@b",
+        50.0,
+        {datetime.date(2020, 1, 31): [1.5]},
+        {uuid.UUID(owner): "bob"},
+        {Color.RED: "red"},
+    )
+
+    # Renamed keys, converted Dict keys and converted fields are written like from_dict reads them
+    encoded = to_dict(account)
+    assert encoded == data
+    assert json.loads(json.dumps(encoded)) == data
+    assert from_dict(Account, encoded, fd_check_types=True) == account
+
+
+def test_convert_without_inverse_is_written_converted():
+    @dataclass
+    class Distance:
+        meters: Annotated[float, Convert(lambda km: km * 1000)]
+        steps: Annotated[
+            int, Convert(int, str), Convert(lambda s: s + 1, lambda s: s - 1)
+        ] = 0
+
+    distance = from_dict(Distance, {"meters": 2, "steps": "5"})
+    assert distance == Distance(2000, 6)
+    assert to_dict(distance) == {"meters": 2000, "steps": "5"}
@@ -0,0 +1,163 @@
+import sys
+from dataclasses import InitVar, dataclass, field
+from typing import Dict, List, NamedTuple, Optional
+
+import attr
+import pytest
+
+from from_dict import from_dict
+
+
+@dataclass(frozen=True)
+class Frozen:
+    x: int
+    tags: List[str] = field(default_factory=list)
+    name: str = "default"
+
+
+@dataclass
+class Validated:
+    x: int
+    post_init_calls: int = field(default=0, init=False)
+
+    def __post_init__(self):
+        if self.x < 0:
+            raise ValueError("x must not be negative")
+        self.post_init_calls += 1
+
+
+@dataclass
+class Slotted:
+    __slots__ = ("x", "y")
+    x: int
+    y: int
+
+
+@dataclass
+class WithInitVar:
+    x: int
+    factor: InitVar[int] = 1
+
+    def __post_init__(self, factor):
+        self.x *= factor
+
+
+@attr.s(auto_attribs=True)
+class AttrClass:
+    _private: int
+    items: List[int] = attr.Factory(list)
+    checked: int = attr.ib(default=0, validator=attr.validators.instance_of(int))
+
+
+@attr.s(auto_attribs=True, frozen=True, cache_hash=True)
+class CachedHash:
+    x: int
+
+
+@attr.s(auto_attribs=True, frozen=True, cache_hash=True, slots=True)
+class SlottedCachedHash:
+    x: int
+
+
+@attr.define
+class AttrSlotted:
+    x: int
+    y: Optional[str] = None
+
+
+class Point(NamedTuple):
+    x: int
+    y: int = 0
+
+
+@dataclass(frozen=True)
+class Nested:
+    frozen: Frozen
+    points: List[Point]
+    by_name: Dict[str, Slotted]
+
+
+def test_dataclass_defaults_and_factories():
+    first = from_dict(Frozen, {"x": 1}, fd_trusted=True)
+    second = from_dict(Frozen, {"x": 2}, fd_trusted=True)
+    assert first == Frozen(1)
+    assert first.tags is not second.tags
+    assert from_dict(Frozen, {"x": 1, "tags": ["a"], "name": "n"}, fd_trusted=True) == (
+        Frozen(1, ["a"], "n")
+    )
+
+
+def test_post_init_is_skipped():
+    obj = from_dict(Validated, {"x": -1}, fd_trusted=True)
+    assert obj.x == -1
+    assert obj.post_init_calls == 0
+    with pytest.raises(ValueError):
+        from_dict(Validated, {"x": -1})
+
+
+def test_slotted_dataclass():
+    obj = from_dict(Slotted, {"x": 1, "y": 2}, fd_trusted=True)
+    assert obj == Slotted(1, 2)
+    assert not hasattr(obj, "__dict__")
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slots=True needs Python 3.10")
+def test_slots_dataclass_defaults():
+    @dataclass(slots=True)
+    class Defaults:
+        x: int
+        y: int = 2
+
+    assert from_dict(Defaults, {"x": 1}, fd_trusted=True) == Defaults(1, 2)
+
+
+def test_init_vars_use_constructor():
+    assert from_dict(WithInitVar, {"x": 2, "factor": 3}, fd_trusted=True).x == 6
+
+
+def test_attr_classes():
+    obj = from_dict(AttrClass, {"private": 1, "checked": "no"}, fd_trusted=True)
+    assert obj._private == 1
+    assert obj.items == []
+    assert obj.checked == "no"  # Validator is skipped
+    assert from_dict(AttrSlotted, {"x": 1}, fd_trusted=True) == AttrSlotted(1)
+
+
+@pytest.mark.parametrize("cls", [CachedHash, SlottedCachedHash])
+def test_attr_classes_with_cached_hash(cls):
+    obj = from_dict(cls, {"x": 1}, fd_trusted=True)
+    assert hash(obj) == hash(cls(1))
+    assert obj == cls(1)
+
+
+def test_named_tuple():
+    assert from_dict(Point, {"x": 1}, fd_trusted=True) == Point(1, 0)
+
+
+def test_missing_argument():
+    with pytest.raises(TypeError, match="'x'"):
+        from_dict(Frozen, {}, fd_trusted=True)
+    with pytest.raises(TypeError, match="'x'"):
+        from_dict(Point, {"y": 1}, fd_trusted=True)
+
+
+def test_nested_structures_equal_constructor_path():
+    data = {
+        "frozen": {"x": 1, "tags": ["a"]},
+        "points": [{"x": 1, "y": 2}, {"x": 3}],
+        "by_name": {"a": {"x": 1, "y": 5}},
+    }
+    assert from_dict(Nested, data, fd_trusted=True) == from_dict(Nested, data)
+
+
+def test_unknown_keys_are_copied():
+    obj = from_dict(Validated, {"x": 1, "extra": "e"}, fd_trusted=True)
+    assert obj.extra == "e"
+
+
+def test_plain_classes_use_constructor():
+    class Plain:
+        def __init__(self, x: int):
+            self.x = x * 2
+
+    assert from_dict(Plain, {"x": 1}, fd_trusted=True).x == 2
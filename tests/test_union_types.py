@@ -0,0 +1,91 @@
+import sys
+from dataclasses import dataclass
+from typing import Dict, Generic, List, Optional, TypeVar
+
+import pytest
+from from_dict import FromDictTypeError, check, from_dict, to_dict
+from from_dict._from_dict import get_constructor_type_hints
+from from_dict._typing import specialize
+
+requires_py310 = pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="X | Y unions need Python 3.10"
+)
+requires_py312 = pytest.mark.skipif(
+    sys.version_info < (3, 12), reason="type aliases need Python 3.12"
+)
+
+
+@dataclass
+class Leaf:
+    name: str
+
+
+@requires_py310
+def test_pipe_unions():
+    @dataclass
+    class Tree:
+        value: "int | str"
+        leaf: "Leaf | None"
+        leaves: "list[Leaf | None]"
+        by_name: "dict[str, Leaf | int]"
+
+    given = {
+        "value": "x",
+        "leaf": {"name": "a"},
+        "leaves": [{"name": "b"}, None],
+        "by_name": {"c": {"name": "c"}, "d": 4},
+    }
+    for check_types in (False, True):
+        tree = from_dict(Tree, given, fd_check_types=check_types)
+        assert tree == Tree("x", Leaf("a"), [Leaf("b"), None], {"c": Leaf("c"), "d": 4})
+        assert to_dict(tree) == given
+
+    with pytest.raises(FromDictTypeError):
+        from_dict(Tree, given, value=1.5, fd_check_types=True)
+    with pytest.raises(FromDictTypeError):
+        from_dict(Tree, given, leaves=[1], fd_check_types=True)
+
+    assert check(1, int | str)
+    assert not check(1.5, int | str)
+    assert check([Leaf("a"), None], list[Leaf | None])
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    by_key: Dict[str, Optional[T]]
+
+
+def test_generic_specializations_are_cached():
+    assert from_dict(Page[int], items=[1], by_key={"a": None}).items == [1]
+    misses = specialize.cache_info().misses
+
+    # Resolving the hints again reuses the specialized types
+    get_constructor_type_hints.cache_clear()
+    assert from_dict(Page[int], items=[2], by_key={"a": 3}).by_key == {"a": 3}
+    assert specialize.cache_info().misses == misses
+    assert specialize(List[T], ((T, int),)) is specialize(List[T], ((T, int),))
+
+
+@requires_py312
+def test_type_aliases():
+    from _type_alias_classes_py312 import ClassWithAliases, Leaf as AliasLeaf
+
+    given = {
+        "leaf": {"name": "a"},
+        "leaves": [{"name": "b"}, "c"],
+        "pair": {"d": {"name": "d"}},
+        "json": {"x": [1, "y", None, {"z": {}}]},
+    }
+    for check_types in (False, True):
+        obj = from_dict(ClassWithAliases, given, fd_check_types=check_types)
+        assert obj.leaf == AliasLeaf("a")
+        assert obj.leaves == [AliasLeaf("b"), "c"]
+        assert obj.pair == {"d": AliasLeaf("d")}
+        assert obj.json == given["json"]
+
+    with pytest.raises(FromDictTypeError):
+        from_dict(ClassWithAliases, given, json={"x": [1.5]}, fd_check_types=True)